@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Lap and Stint Analytics
+Publishes public/data/laps/round_XX.json for completed sprints and races; the code lives in f1data.lap_analytics
+
+    python3 scripts/analyse-laps.py 2025
+    python3 scripts/analyse-laps.py 2025 --refresh --limit 5
+"""
+
+import runpy
+
+if __name__ == "__main__":
+    runpy.run_module('f1data.lap_analytics', run_name='__main__')
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Results Extraction Micro-Benchmark
+Compares per-row iterrows extraction with the columnar extractors on synthetic 20-driver sessions
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from f1data.results_extract import extract_session_results, extract_standings_batch, extract_standings_results
+
+TEAMS = ['McLaren', 'Ferrari', 'Red Bull Racing', 'Mercedes', 'Aston Martin',
+         'Alpine', 'Haas F1 Team', 'Racing Bulls', 'Williams', 'Kick Sauber']
+RACE_POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+
+def make_session_results(seed, drivers=20):
+    """Build a results DataFrame shaped like FastF1's session.results"""
+    rng = np.random.default_rng(seed)
+    positions = rng.permutation(drivers) + 1
+    numbers = [str(n) for n in rng.choice(np.arange(1, 100), size=drivers, replace=False)]
+
+    def lap_times():
+        times = pd.to_timedelta(rng.uniform(84, 90, drivers), unit='s')
+        return times.where(rng.random(drivers) > 0.2)
+
+    return pd.DataFrame({
+        'DriverNumber': numbers,
+        'FullName': [f'Driver {n}' for n in numbers],
+        'TeamName': [TEAMS[i // 2 % len(TEAMS)] for i in range(drivers)],
+        'Position': positions.astype(float),
+        'Points': [float(RACE_POINTS[p - 1]) if p <= 10 else 0.0 for p in positions],
+        'Status': ['Finished'] * drivers,
+        'Time': pd.to_timedelta(rng.uniform(0, 60, drivers), unit='s'),
+        'Q1': lap_times(),
+        'Q2': lap_times(),
+        'Q3': lap_times(),
+    }, index=numbers)
+
+def legacy_format_f1_time(time_obj):
+    """Previous string-splitting formatter, kept here as the baseline"""
+    if pd.isna(time_obj) or time_obj is None:
+        return None
+    try:
+        time_str = str(time_obj)
+        if '0 days' in time_str:
+            time_str = time_str.replace('0 days ', '')
+        if ':' in time_str:
+            parts = time_str.split(':')
+            if len(parts) >= 3:
+                total_minutes = int(parts[0]) * 60 + int(parts[1])
+                seconds_ms = float(parts[2])
+                seconds = int(seconds_ms)
+                milliseconds = int((seconds_ms - seconds) * 1000)
+                return f"{total_minutes}:{seconds:02d}.{milliseconds:03d}"
+        return time_str
+    except Exception:
+        return None
+
+def legacy_extract(results):
+    """Previous iterrows extraction for standings and latest-session records"""
+    standings, session = [], []
+    for _, driver in results.iterrows():
+        standings.append({
+            'driver_number': int(driver['DriverNumber']),
+            'full_name': driver['FullName'],
+            'team_name': driver['TeamName'],
+            'position': int(driver['Position']) if pd.notna(driver['Position']) else None,
+            'points': int(driver['Points']) if pd.notna(driver['Points']) else 0,
+            'status': driver.get('Status', 'Unknown')
+        })
+        result = {
+            'driver_number': int(driver['DriverNumber']),
+            'name': str(driver['FullName']),
+            'position': int(driver['Position']) if pd.notna(driver['Position']) else None,
+            'time': legacy_format_f1_time(driver.get('Time', None)),
+            'status': str(driver.get('Status', '')),
+            'points': int(driver['Points']) if pd.notna(driver['Points']) else 0,
+        }
+        for column in ('Q1', 'Q2', 'Q3'):
+            if pd.notna(driver[column]):
+                result[column.lower()] = legacy_format_f1_time(driver[column])
+        session.append(result)
+    return standings, session
+
+def columnar_extract(results):
+    """Columnar extraction for standings and latest-session records"""
+    return extract_standings_results(results), extract_session_results(results)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark results extraction')
+    parser.add_argument('--sessions', type=int, default=48,
+                        help='Number of 20-driver sessions per run (default: 48, two per round)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    sessions = [make_session_results(seed) for seed in range(args.sessions)]
+
+    def run(extract):
+        for results in sessions:
+            extract(results)
+
+    def run_batch():
+        extract_standings_batch(dict(enumerate(sessions)))
+        for results in sessions:
+            extract_session_results(results)
+
+    def best(func):
+        return min(timeit.repeat(func, number=1, repeat=args.repeat))
+
+    legacy = best(lambda: run(legacy_extract))
+    columnar = best(lambda: run(columnar_extract))
+    batched = best(run_batch)
+
+    print(f"Sessions: {args.sessions} x 20 drivers (best of {args.repeat})")
+    print(f"iterrows:          {legacy * 1000:8.1f} ms")
+    print(f"columnar:          {columnar * 1000:8.1f} ms  ({legacy / columnar:.1f}x)")
+    print(f"columnar, batched: {batched * 1000:8.1f} ms  ({legacy / batched:.1f}x)")
+
+if __name__ == "__main__":
+    main()
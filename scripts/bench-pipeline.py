@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Data Pipeline Benchmark Suite
+Times the updater's hot paths offline on synthetic seasons and compares the results against a stored baseline
+
+    python3 scripts/bench-pipeline.py --output logs/bench-results.json
+    python3 scripts/bench-pipeline.py --baseline bench-baseline.json   # exits 1 on regressions
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+def load_bench_extract():
+    """Import bench-extract.py (hyphenated, so not importable by name) for its fixtures"""
+    spec = importlib.util.spec_from_file_location('bench_extract', SCRIPTS_DIR / 'bench-extract.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# A realistic season, scaled up for the 10x runs
+ROUNDS_PER_SEASON = 24
+SPRINT_EVERY = 4
+CACHE_ENTRIES_PER_ROUND = 3
+
+# Median slowdown beyond this fraction of the baseline counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+class FixtureSession:
+    """Stands in for a loaded FastF1 session, built from synthetic results"""
+
+    def __init__(self, results, session_name, start):
+        self.results = results
+        self.session_info = {'Type': session_name, 'StartDate': start}
+
+def make_schedule(year, rounds, now):
+    """Synthetic ScheduleIndex with every round already run, one week apart"""
+    from f1data.schedule_index import ScheduleIndex
+
+    first = now - timedelta(weeks=rounds + 1)
+    events = []
+    for round_number in range(1, rounds + 1):
+        race_start = first + timedelta(weeks=round_number)
+        sessions = [('Qualifying', race_start - timedelta(days=1)), ('Race', race_start)]
+        if round_number % SPRINT_EVERY == 0:
+            sessions.append(('Sprint', race_start - timedelta(days=1, hours=4)))
+        events.append({
+            'round': round_number,
+            'name': f'Grand Prix {round_number}',
+            'location': f'Circuit {round_number}',
+            'country': 'Country',
+            'format': 'sprint_qualifying' if round_number % SPRINT_EVERY == 0 else 'conventional',
+            'sessions': [
+                {'name': name, 'start': start.timestamp(), 'end': (start + timedelta(hours=2)).timestamp(),
+                 'local_date': start.isoformat()}
+                for name, start in sessions
+            ]
+        })
+    return ScheduleIndex(year, events)
+
+def make_fixture_loader(make_session_results, schedule_index):
+    """load_session() replacement serving pre-built synthetic sessions"""
+    sessions = {}
+    for round_number, event in schedule_index.events.items():
+        for session in event['sessions']:
+            seed = len(sessions)
+            sessions[(round_number, session['name'])] = FixtureSession(
+                make_session_results(seed), session['name'],
+                datetime.fromtimestamp(session['start'], timezone.utc))
+
+    def load_session(year, round_number, session_name, profile='results'):
+        return sessions[(round_number, session_name)]
+    return load_session
+
+def make_cache_tree(cache_dir, seasons, rounds, now):
+    """FastF1-shaped cache directory: year/event/session with a few small files each"""
+    payload = b'x' * 4096
+    for year in seasons:
+        for round_number in range(1, rounds + 1):
+            for session in range(CACHE_ENTRIES_PER_ROUND):
+                entry = cache_dir / str(year) / f'event_{round_number:03d}' / f'session_{session}'
+                entry.mkdir(parents=True, exist_ok=True)
+                for name in ('results.ff1pkl', 'timing.ff1pkl'):
+                    (entry / name).write_bytes(payload)
+    (cache_dir / 'fastf1_http_cache.sqlite').write_bytes(payload * 8)
+
+def make_laps(rng, drivers=20, laps=60):
+    """Laps DataFrame shaped like FastF1's session.laps: three stints per driver with a stop between each"""
+    count = drivers * laps
+    stint_laps = laps // 3
+    lap_in_stint = np.tile(np.arange(1, laps + 1) - 1, drivers) % stint_laps + 1
+    # Base pace per driver, tyre wear within each stint, noise, and the time lost on in- and out-laps
+    lap_seconds = (np.repeat(rng.uniform(88, 92, drivers), laps) + 0.05 * lap_in_stint
+                   + rng.normal(0, 0.3, count))
+    in_lap = np.tile((np.arange(1, laps + 1) % stint_laps == 0) & (np.arange(1, laps + 1) < laps), drivers)
+    out_lap = np.roll(in_lap, 1)
+    lap_seconds = lap_seconds + 8 * in_lap + 12 * out_lap
+    lap_time = pd.to_timedelta(lap_seconds, unit='s')
+    session_time = pd.to_timedelta(np.cumsum(lap_seconds.reshape(drivers, laps), axis=1).ravel() + 3600, unit='s')
+    return pd.DataFrame({
+        'Driver': np.repeat([f'D{n:02d}' for n in range(drivers)], laps),
+        'DriverNumber': np.repeat([str(n) for n in range(1, drivers + 1)], laps),
+        'Team': np.repeat([f'Team {n // 2}' for n in range(drivers)], laps),
+        'LapNumber': np.tile(np.arange(1, laps + 1, dtype=float), drivers),
+        'LapTime': lap_time,
+        'Time': session_time,
+        'Stint': np.tile(np.repeat([1.0, 2.0, 3.0], stint_laps), drivers),
+        'Compound': np.tile(np.repeat(['SOFT', 'MEDIUM', 'HARD'], stint_laps), drivers),
+        'TyreLife': lap_in_stint.astype(float),
+        'Sector1Time': pd.to_timedelta(rng.uniform(25, 30, count), unit='s'),
+        'Sector2Time': pd.to_timedelta(rng.uniform(25, 30, count), unit='s'),
+        'Sector3Time': pd.to_timedelta(rng.uniform(25, 30, count), unit='s'),
+        'PitInTime': pd.Series(session_time - pd.to_timedelta(5, unit='s')).where(in_lap),
+        'PitOutTime': pd.Series(session_time - lap_time + pd.to_timedelta(20, unit='s')).where(out_lap),
+        'Position': rng.integers(1, drivers + 1, count).astype(float),
+        'TrackStatus': '1',
+    })
+
+def make_lap_stores(workdir, seasons, rounds):
+    """The same synthetic laps as pickled DataFrames (like rehydrated sessions) and as the Parquet store"""
+    from f1data import columnar
+
+    rng = np.random.default_rng(0)
+    pickles = workdir / 'pickled-laps'
+    pickles.mkdir()
+    for year in seasons:
+        for round_number in range(1, rounds + 1):
+            laps = make_laps(rng)
+            laps.to_pickle(pickles / f'{year}-{round_number}.pkl')
+            columnar.write_frame(laps, columnar.LAP_COLUMNS, columnar.partition_path(
+                columnar.KIND_LAPS, year, round_number, 'Race', workdir / 'parquet') / columnar.PART_NAME)
+    return pickles, workdir / 'parquet'
+
+def measure(func, repeat, setup=None):
+    """Run func repeat times (after setup each time), returning per-run seconds"""
+    runs = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+def run_suite(scales, repeat, year=2025):
+    """Time every case at every scale; returns {case_name: result}"""
+    now = datetime.now(timezone.utc)
+    results = {}
+
+    for scale in scales:
+        rounds = ROUNDS_PER_SEASON * scale
+        workdir = Path(tempfile.mkdtemp(prefix='bench-pipeline-'))
+        os.chdir(workdir)
+        (workdir / 'logs').mkdir()
+        (workdir / 'public' / 'data').mkdir(parents=True)
+
+        # The modules set up cache/, public/data and logs/ relative to the working directory
+        from f1data import latest_session as updater
+        from f1data import standings
+        from f1data.cache_manager import F1DataCache
+        from f1data.results_extract import format_lap_times
+        updater.init()
+        standings.init()
+        bench_extract = load_bench_extract()
+        logging.disable(logging.CRITICAL)
+
+        schedule_index = make_schedule(year, rounds, now)
+        loader = make_fixture_loader(bench_extract.make_session_results, schedule_index)
+        standings.load_session = loader
+        updater.load_session = loader
+
+        cases = {}
+
+        def driver_cold():
+            standings.calculate_driver_standings(year, refresh=True, schedule_index=schedule_index)
+        cases['calculate_driver_standings.cold'] = (driver_cold, None)
+
+        driver_data = standings.calculate_driver_standings(year, schedule_index=schedule_index)
+
+        def driver_warm():
+            standings.calculate_driver_standings(year, schedule_index=schedule_index)
+        cases['calculate_driver_standings.ledger'] = (driver_warm, None)
+
+        cases['calculate_constructor_standings'] = (
+            lambda: standings.calculate_constructor_standings(driver_data), None)
+
+        cases['fetch_latest_session'] = (lambda: updater.fetch_latest_session(schedule_index), None)
+
+        # One timedelta column per classified session, as extraction formats them (DNFs are NaT)
+        rng = np.random.default_rng(0)
+        time_columns = []
+        for _ in range(rounds * 3):
+            column = pd.Series(pd.to_timedelta(rng.uniform(60, 6000, 20), unit='s'))
+            column[rng.random(20) < 0.15] = pd.NaT
+            time_columns.append(column.to_numpy())
+        cases['format_lap_times'] = (lambda: [format_lap_times(column) for column in time_columns], None)
+
+        cache_dir = workdir / 'fastf1-cache'
+        cache_dir.mkdir()
+
+        def cache_ops():
+            cache = F1DataCache(cache_dir, workdir / 'public' / 'data', schedule_index)
+            for round_number in range(1, rounds + 1):
+                event = schedule_index.get_event(round_number)['name']
+                for session_name in ('Qualifying', 'Race'):
+                    cache.should_update_session_data(event, session_name)
+                    cache.mark_session_updated(event, session_name)
+                cache.should_update_standings()
+            cache.mark_standings_updated()
+            cache.get_cache_stats()
+            cache.close()
+        cases['F1DataCache.operations'] = (cache_ops, None)
+
+        seasons = range(year - scale, year)
+
+        def cleanup_setup():
+            make_cache_tree(cache_dir, seasons, ROUNDS_PER_SEASON, now)
+
+        def cleanup():
+            cache = F1DataCache(cache_dir, workdir / 'public' / 'data', schedule_index)
+            cache.reconcile()
+            cache.evict_to_budget(max_size_mb=0.5)
+            cache.close()
+        cases['cache_cleanup'] = (cleanup, cleanup_setup)
+
+        from f1data.lap_analytics import analyse_laps
+        race_laps = make_laps(np.random.default_rng(1))
+        cases['lap_analytics.race'] = (lambda: analyse_laps(race_laps), None)
+
+        from f1data import columnar
+        if columnar.pyarrow_available():
+            pickles, parquet_root = make_lap_stores(workdir, seasons, ROUNDS_PER_SEASON)
+
+            # One driver's lap times over every season: whole frames vs two pruned columns
+            def laps_from_pickles():
+                frames = [pd.read_pickle(path) for path in sorted(pickles.iterdir())]
+                return pd.concat([f.loc[f['Driver'] == 'D01', ['LapNumber', 'LapTime']] for f in frames])
+            cases['laps_query.pickled_sessions'] = (laps_from_pickles, None)
+
+            def laps_from_parquet():
+                return columnar.read(columnar.KIND_LAPS, ['season', 'round', 'LapNumber', 'LapTime'],
+                                     [('Driver', '==', 'D01')], root=parquet_root)
+            cases['laps_query.parquet'] = (laps_from_parquet, None)
+
+        for name, (func, setup) in cases.items():
+            runs = measure(func, repeat, setup)
+            results[f'{name}@{scale}x'] = {
+                'case': name,
+                'scale': scale,
+                'rounds': rounds,
+                'best_s': min(runs),
+                'median_s': statistics.median(runs),
+                'runs': runs
+            }
+
+        logging.disable(logging.NOTSET)
+        os.chdir(SCRIPTS_DIR)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return results
+
+def compare(results, baseline, threshold):
+    """Cases whose median got slower than the baseline by more than threshold"""
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get('results', {}).get(key)
+        if not previous:
+            continue
+        ratio = result['median_s'] / previous['median_s'] if previous['median_s'] else 1.0
+        result['baseline_median_s'] = previous['median_s']
+        result['ratio'] = ratio
+        if ratio > 1 + threshold:
+            regressions.append(key)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the data pipeline offline')
+    parser.add_argument('--scales', default='1,10',
+                        help='Comma-separated season size multipliers (default: 1,10)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', default='logs/bench-results.json',
+                        help='Where to write machine-readable results')
+    parser.add_argument('--baseline', help='Results file to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed median slowdown vs baseline (default: 0.25 = 25%%)')
+    args = parser.parse_args()
+
+    output = Path(args.output).resolve()
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+
+    cwd = os.getcwd()
+    try:
+        results = run_suite([int(s) for s in args.scales.split(',')], args.repeat)
+    finally:
+        os.chdir(cwd)
+
+    regressions = compare(results, baseline, args.threshold) if baseline else []
+
+    report = {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'repeat': args.repeat
+        },
+        'results': results,
+        'regressions': regressions
+    }
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'case':<44} {'median':>10} {'best':>10} {'vs base':>8}")
+    for key, result in results.items():
+        ratio = f"{result['ratio']:.2f}x" if 'ratio' in result else '-'
+        flag = '  ⚠️' if key in regressions else ''
+        print(f"{key:<44} {result['median_s'] * 1000:8.1f}ms {result['best_s'] * 1000:8.1f}ms {ratio:>8}{flag}")
+    print(f"\nResults written to {output}")
+
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
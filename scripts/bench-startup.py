@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Times importing each f1data module and the "nothing to do" fast path, each in a fresh interpreter
+
+    python3 scripts/bench-startup.py --output logs/bench-startup.json
+    python3 scripts/bench-startup.py --baseline bench-startup-baseline.json   # exits 1 on regressions
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Modules that must import without pulling in the heavy dependencies
+LIGHT_MODULES = [
+    'f1data', 'f1data.run_state', 'f1data.metrics', 'f1data.cache_manager', 'f1data.schedule_index',
+    'f1data.publish', 'f1data.pipeline', 'f1data.session_loader', 'f1data.results_store',
+    'f1data.standings_ledger', 'f1data.async_fetch', 'f1data.prefetch', 'f1data.cleanup',
+    'f1data.latest_session', 'f1data.standings', 'f1data.archive', 'f1data.columnar', 'f1data.lap_analytics',
+]
+# Modules that need pandas/numpy at import time by design
+HEAVY_MODULES = ['f1data.results_extract']
+
+HEAVY_DEPENDENCIES = ('fastf1', 'pandas', 'numpy')
+
+# The fast path has to answer well inside this
+FAST_PATH_TARGET_S = 0.1
+
+DEFAULT_THRESHOLD = 0.25
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+FAST_PATH_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from f1data.run_state import nothing_to_do
+result = nothing_to_do(path={state_file!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'result': result, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def run_probe(code):
+    """Run code in a fresh interpreter, returning its JSON report and total wall time"""
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, '-c', code], cwd=SCRIPTS_DIR, check=True,
+                            capture_output=True, text=True).stdout
+    wall = time.perf_counter() - start
+    report = json.loads(output.strip().splitlines()[-1])
+    report['wall_s'] = wall
+    return report
+
+def measure(code, repeat):
+    """Median/best of repeated probes plus the heavy modules the last probe loaded"""
+    reports = [run_probe(code) for _ in range(repeat)]
+    runs = [r['seconds'] for r in reports]
+    return {
+        'best_s': min(runs),
+        'median_s': statistics.median(runs),
+        'wall_median_s': statistics.median(r['wall_s'] for r in reports),
+        'runs': runs,
+        'loaded': reports[-1]['loaded'],
+        **({'result': reports[-1]['result']} if 'result' in reports[-1] else {})
+    }
+
+def run_suite(repeat):
+    """Time every module import and the fast path; returns ({case: result}, [problems])"""
+    results = {}
+    problems = []
+
+    for module in LIGHT_MODULES + HEAVY_MODULES:
+        result = measure(IMPORT_PROBE.format(module=module, heavy=HEAVY_DEPENDENCIES), repeat)
+        results[f'import {module}'] = result
+        if module in LIGHT_MODULES and result['loaded']:
+            problems.append(f"import {module} loads {', '.join(result['loaded'])}")
+
+    with tempfile.TemporaryDirectory(prefix='bench-startup-') as tmp:
+        state_file = Path(tmp) / 'update-state.json'
+        next_check = datetime.now(timezone.utc) + timedelta(hours=1)
+        state_file.write_text(json.dumps({'success': True, 'next_check': next_check.isoformat()}))
+        result = measure(FAST_PATH_PROBE.format(state_file=str(state_file), heavy=HEAVY_DEPENDENCIES), repeat)
+    results['fast_path'] = result
+    if not result['result']:
+        problems.append("fast path did not report 'nothing to do' for a fresh state file")
+    if result['loaded']:
+        problems.append(f"fast path loads {', '.join(result['loaded'])}")
+    if result['median_s'] > FAST_PATH_TARGET_S:
+        problems.append(f"fast path took {result['median_s'] * 1000:.1f}ms (target {FAST_PATH_TARGET_S * 1000:.0f}ms)")
+
+    return results, problems
+
+def compare(results, baseline, threshold):
+    """Cases whose median got slower than the baseline by more than threshold"""
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get('results', {}).get(key)
+        if not previous:
+            continue
+        ratio = result['median_s'] / previous['median_s'] if previous['median_s'] else 1.0
+        result['baseline_median_s'] = previous['median_s']
+        result['ratio'] = ratio
+        if ratio > 1 + threshold:
+            regressions.append(key)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark module import times and the fast path')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', default='logs/bench-startup.json',
+                        help='Where to write machine-readable results')
+    parser.add_argument('--baseline', help='Results file to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed median slowdown vs baseline (default: 0.25 = 25%%)')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+
+    results, problems = run_suite(args.repeat)
+    regressions = compare(results, baseline, args.threshold) if baseline else []
+
+    report = {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat
+        },
+        'results': results,
+        'problems': problems,
+        'regressions': regressions
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'case':<36} {'median':>10} {'wall':>10} {'vs base':>8}")
+    for key, result in results.items():
+        ratio = f"{result['ratio']:.2f}x" if 'ratio' in result else '-'
+        flag = '  ⚠️' if key in regressions else ''
+        print(f"{key:<36} {result['median_s'] * 1000:8.1f}ms {result['wall_median_s'] * 1000:8.1f}ms {ratio:>8}{flag}")
+    print(f"\nResults written to {output}")
+
+    for problem in problems:
+        print(f"❌ {problem}")
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}")
+    if problems or regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
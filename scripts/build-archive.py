@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Season Archive Builder
+Builds public/data/archive/<year>.json for a range of seasons; the code lives in f1data.archive
+
+    python3 scripts/build-archive.py 2014 2024 --workers 8
+"""
+
+import runpy
+
+if __name__ == "__main__":
+    runpy.run_module('f1data.archive', run_name='__main__')
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Parquet Session Store
+Exports session results and laps to cache/parquet and queries them; the code lives in f1data.columnar
+
+    python3 scripts/export-parquet.py export 2023 2024 2025
+    python3 scripts/export-parquet.py query laps --columns season,round,LapNumber,LapTime --where Driver=LEC
+"""
+
+import runpy
+
+if __name__ == "__main__":
+    runpy.run_module('f1data.columnar', run_name='__main__')
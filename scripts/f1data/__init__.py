@@ -0,0 +1,8 @@
+"""
+F1 Data Update Package
+Schedule, FastF1 loading, standings and publishing for the site data
+
+Importing the package or any light module (cache_manager, schedule_index,
+run_state, pipeline, publish) never imports fastf1, pandas or numpy and
+never touches the filesystem; scripts call each module's init() explicitly.
+"""
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Season Archive Builder
+Backfills public/data/archive/<year>.json for a range of seasons, loading rounds in parallel worker processes
+
+Every loaded round is checkpointed into that season's standings ledger, so an
+interrupted backfill resumes from the rounds it hasn't stored yet.
+"""
+
+import argparse
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import metrics, standings
+from .cache_manager import DEFAULT_RETRY_BUDGET, start_retry_budget
+from .publish import content_hash, publish_json
+from .results_store import RESULTS_DB, ResultsStore
+from .schedule_index import ScheduleIndex
+from .session_loader import call_in_worker
+from .standings_ledger import SeasonLedger
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = Path('public/data/archive')
+
+DEFAULT_WORKERS = 4
+
+def plan_season(year):
+    """Completed races and sprint rounds of a season, from its schedule"""
+    schedule_index = ScheduleIndex.load(year, standings.cache_dir)
+    return {
+        'year': year,
+        'races': standings.get_completed_races(year, schedule_index),
+        'sprint_sessions': schedule_index.sprint_sessions(),
+        'total_rounds': len(schedule_index.events)
+    }
+
+def load_round(year, round_number, sprint_session, source='fastf1'):
+    """(race_results, sprint_results) of one round; None in place of results whose load failed
+
+    sprint_session is the round's sprint race as named in its schedule, or None without a sprint.
+    """
+    # A backfill runs for hours, so the retry budget is per round rather than per run
+    start_retry_budget(DEFAULT_RETRY_BUDGET)
+    sprint_rounds = {round_number: sprint_session} if sprint_session else {}
+    return standings.fetch_rounds(year, [round_number], sprint_rounds=sprint_rounds, source=source)[round_number]
+
+def archive_season(year, plan, ledger, output_dir=ARCHIVE_DIR):
+    """Build and publish archive/<year>.json from the season's ledger; returns True if rewritten"""
+    driver_standings = standings.driver_standings_from_ledger(ledger, plan['races'])
+    constructor_standings = standings.calculate_constructor_standings(driver_standings, ledger.store)
+
+    constructor = next((team for team in constructor_standings['standings']
+                        if team['team_name'] == standings.SITE_TEAM), None)
+    archive = {
+        'season': year,
+        'completed': bool(plan['races']) and len(plan['races']) == plan['total_rounds'],
+        'completed_races': len(plan['races']),
+        'final_standings': {
+            'drivers': [
+                {
+                    'position': driver['position'],
+                    'name': driver['full_name'],
+                    'driver_number': driver['driver_number'],
+                    'points': driver['total_points'],
+                    'wins': driver['wins'],
+                    'podiums': driver['podiums']
+                }
+                for driver in driver_standings['standings']
+                if driver['team_name'] == standings.SITE_TEAM
+            ],
+            'constructor': {
+                'position': constructor['position'],
+                'points': constructor['total_points'],
+                'wins': constructor['wins'],
+                'podiums': constructor['podiums']
+            } if constructor else None
+        },
+        'archived_date': datetime.now(timezone.utc).isoformat()
+    }
+
+    # Hand-written notes survive a rebuild, and the date only moves when the standings do
+    path = output_dir / f'{year}.json'
+    try:
+        with open(path, 'r') as f:
+            existing = json.load(f)
+    except (OSError, ValueError):
+        existing = None
+    if isinstance(existing, dict):
+        if existing.get('note'):
+            archive['note'] = existing['note']
+        if existing.get('archived_date') and content_hash(existing) == content_hash(archive):
+            archive['archived_date'] = existing['archived_date']
+
+    return publish_json(path, archive, output_dir.parent)
+
+def build_archives(years, workers=DEFAULT_WORKERS, source='fastf1', refresh=False, output_dir=ARCHIVE_DIR):
+    """Load every pending round of the given seasons in parallel and publish their archives
+
+    Rounds already final in a season's ledger are skipped unless refresh is
+    set. Returns a summary with the rounds loaded, failed and the throughput.
+    """
+    years = sorted(set(years))
+    start = time.monotonic()
+    loaded = failed = 0
+    failed_years = set()
+
+    # Worker processes set up their own FastF1 cache, flush it and send their metrics back
+    with ProcessPoolExecutor(max_workers=workers, initializer=standings.init) as pool:
+        plans = {}
+        for year, future in [(year, pool.submit(call_in_worker, plan_season, year)) for year in years]:
+            try:
+                plans[year], worker_metrics = future.result()
+                metrics.merge(worker_metrics)
+            except Exception as e:
+                logger.error(f"Error loading the {year} schedule: {e}")
+                failed_years.add(year)
+        store = ResultsStore(standings.cache_dir / RESULTS_DB.name)
+        ledgers = {year: SeasonLedger(year, standings.cache_dir, store) for year in plans}
+
+        tasks = {}
+        for year, plan in plans.items():
+            for race in plan['races']:
+                if refresh or ledgers[year].needs_fetch(race['round'], source):
+                    future = pool.submit(call_in_worker, load_round, year, race['round'],
+                                         plan['sprint_sessions'].get(race['round']), source)
+                    tasks[future] = (year, race)
+
+        total = len(tasks)
+        logger.info(f"📚 {len(years)} seasons, {total} rounds to load with {workers} workers")
+
+        for future in as_completed(tasks):
+            year, race = tasks[future]
+            try:
+                (race_results, sprint_results), worker_metrics = future.result()
+                metrics.merge(worker_metrics)
+            except Exception as e:
+                logger.error(f"Error loading {year} round {race['round']}: {e}")
+                race_results = None
+            if race_results is None or sprint_results is None:
+                failed += 1
+                failed_years.add(year)
+                logger.warning(f"⚠️ {year} round {race['round']} failed, it will be retried on the next run")
+                continue
+
+            # Checkpoint: the round is on disk before the next one is processed
+            ledgers[year].record_round(race, race_results, sprint_results, source=source)
+            ledgers[year].save()
+            loaded += 1
+            rate = loaded / max(time.monotonic() - start, 1e-9) * 60
+            logger.info(f"✅ {year} round {race['round']} stored ({loaded + failed}/{total}, {rate:.1f} rounds/min)")
+
+    published = 0
+    for year in years:
+        if year in failed_years:
+            logger.warning(f"Archive {year} not written: some rounds are missing")
+            continue
+        published += archive_season(year, plans[year], ledgers[year], output_dir)
+
+    elapsed = time.monotonic() - start
+    return {
+        'seasons': len(years),
+        'rounds_loaded': loaded,
+        'rounds_failed': failed,
+        'seasons_failed': sorted(failed_years),
+        'archives_written': published,
+        'elapsed_s': elapsed,
+        'rounds_per_minute': loaded / elapsed * 60 if elapsed else 0.0
+    }
+
+def parse_years(first, last=None):
+    """Seasons from first to last inclusive"""
+    return list(range(first, (last or first) + 1))
+
+def main():
+    parser = argparse.ArgumentParser(description='Build public/data/archive/<year>.json for a range of seasons')
+    parser.add_argument('first', type=int, help='First season to archive')
+    parser.add_argument('last', type=int, nargs='?', help='Last season to archive (default: first)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Parallel worker processes (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--source', choices=['fastf1', 'jolpica'], default='fastf1',
+                        help='Results source for each round')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Reload every round, ignoring the checkpoints in the ledgers')
+    args = parser.parse_args()
+    if args.last is not None and args.last < args.first:
+        parser.error(f"last season {args.last} is before first season {args.first}")
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    standings.init()
+    ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+
+    summary = build_archives(parse_years(args.first, args.last), args.workers, args.source, args.refresh)
+    print(f"\n📚 {summary['seasons']} stagioni, {summary['rounds_loaded']} round caricati "
+          f"in {summary['elapsed_s']:.1f}s ({summary['rounds_per_minute']:.1f} round/min)")
+    print(f"🗂️ Archivi riscritti: {summary['archives_written']}")
+    if summary['rounds_failed'] or summary['seasons_failed']:
+        print(f"⚠️ Stagioni incomplete: {', '.join(map(str, summary['seasons_failed']))}; "
+              "rilancia il comando per riprendere")
+        return False
+    return True
+
+if __name__ == "__main__":
+    if not main():
+        exit(1)
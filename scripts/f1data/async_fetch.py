@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Async Bulk Fetcher
+Fetches many upstream JSON documents concurrently with aiohttp, within a connection limit and per-host rate limits
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from . import metrics
+from .cache_manager import APITimeoutError, CircuitOpenError, DataNotAvailableError, F1DataError, get_breaker
+
+logger = logging.getLogger(__name__)
+
+# Ergast-compatible API used as the schedule/results/standings source; override for the offline stub
+JOLPICA_BASE_URL = os.environ.get('F1_API_BASE_URL', 'https://api.jolpi.ca/ergast/f1')
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 30
+
+# Per-host (requests per second, burst); Jolpica allows 4 req/s bursts
+DEFAULT_RATE_LIMITS = {'api.jolpi.ca': (4, 4)}
+DEFAULT_RATE = (4, 4)
+
+USER_AGENT = 'chehafa-f1-updater'
+
+# Ergast constructor ids whose name differs from FastF1's TeamName
+TEAM_NAMES = {
+    'red_bull': 'Red Bull Racing',
+    'alpine': 'Alpine',
+    'rb': 'Racing Bulls',
+    'sauber': 'Kick Sauber',
+}
+
+class RateLimiter:
+    """Token bucket shared by every request to one host"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class AsyncFetcher:
+    """Bounded-concurrency JSON fetcher over an aiohttp session with pooled keep-alive connections
+
+    Use as an async context manager. record_dir, when set, saves every
+    response body under its URL path so the stub server can replay it.
+    Redirects, chunked bodies and gzip/deflate/brotli decoding are left to
+    aiohttp.
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, rate_limits=None, default_rate=DEFAULT_RATE,
+                 timeout=DEFAULT_TIMEOUT, record_dir=None):
+        self.concurrency = concurrency
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.rate_limits = {**DEFAULT_RATE_LIMITS, **(rate_limits or {})}
+        self.default_rate = default_rate
+        self.timeout = timeout
+        self.record_dir = Path(record_dir) if record_dir else None
+        self.session = None
+        self.limiters = {}
+        self.stats = {'requests': 0, 'bytes': 0, 'errors': 0}
+
+    async def __aenter__(self):
+        self._session()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _session(self):
+        """The shared aiohttp session, created on first use inside the running loop"""
+        if self.session is None:
+            # Imported here so importing the module stays cheap for the sync code paths
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.concurrency)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'User-Agent': USER_AGENT, 'Accept': 'application/json'}
+            )
+        return self.session
+
+    async def close(self):
+        """Close the session and its pooled connections"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _limiter(self, host):
+        if host not in self.limiters:
+            self.limiters[host] = RateLimiter(*self.rate_limits.get(host, self.default_rate))
+        return self.limiters[host]
+
+    async def get_json(self, url, params=None):
+        """GET a URL and decode its JSON body"""
+        import aiohttp
+
+        parts = urlsplit(url)
+
+        # One breaker per host, shared by every fetcher in the process; FastF1 session loads reach a
+        # different upstream and trip their own 'fastf1' breaker
+        circuit = get_breaker(parts.hostname)
+        if not circuit.allow():
+            raise CircuitOpenError(f"Upstream '{parts.hostname}' unavailable, not fetching {url}")
+
+        session = self._session()
+        async with self.semaphore:
+            await self._limiter(parts.hostname).acquire()
+            self.stats['requests'] += 1
+            try:
+                async with session.get(url, params=params) as response:
+                    status = response.status
+                    body = await response.read()
+            except asyncio.TimeoutError:
+                self.stats['errors'] += 1
+                circuit.record_failure()
+                raise APITimeoutError(f"Timed out after {self.timeout}s: {url}")
+            except aiohttp.ClientError as e:
+                self.stats['errors'] += 1
+                circuit.record_failure()
+                raise F1DataError(f"Request failed for {url}: {e}")
+
+        self.stats['bytes'] += len(body)
+        metrics.increment('upstream_requests', source=parts.hostname)
+        metrics.increment('upstream_bytes', len(body), source=parts.hostname)
+        if status == 404:
+            circuit.record_success()
+            raise DataNotAvailableError(f"Not found: {url}")
+        if status >= 400:
+            self.stats['errors'] += 1
+            if status == 429 or status >= 500:
+                circuit.record_failure()
+            raise F1DataError(f"HTTP {status} for {url}")
+        circuit.record_success()
+
+        if self.record_dir:
+            record_file = self.record_dir / parts.path.lstrip('/')
+            record_file.parent.mkdir(parents=True, exist_ok=True)
+            record_file.write_bytes(body)
+        return json.loads(body)
+
+    async def fetch_all(self, urls, params=None):
+        """Fetch several URLs concurrently; failures are returned as exceptions in place"""
+        return await asyncio.gather(*(self.get_json(url, params) for url in urls), return_exceptions=True)
+
+# Ergast-compatible endpoints
+
+def _races(data):
+    return data['MRData']['RaceTable']['Races']
+
+def _standings_record(result):
+    """Ergast result entry in the extract_standings_results() format"""
+    driver = result['Driver']
+    constructor = result['Constructor']
+    points = float(result.get('points', 0))
+    return {
+        'driver_number': int(result.get('number') or driver.get('permanentNumber') or 0),
+        'full_name': f"{driver['givenName']} {driver['familyName']}",
+        'team_name': TEAM_NAMES.get(constructor.get('constructorId'), constructor['name']),
+        'position': int(result['position']) if result.get('position') else None,
+        'points': int(points) if points.is_integer() else points,
+        'status': result.get('status', 'Unknown')
+    }
+
+async def fetch_schedule(fetcher, year, base_url=JOLPICA_BASE_URL):
+    """Season calendar as [{'round', 'name', 'location', 'country', 'date', 'sprint'}]"""
+    data = await fetcher.get_json(f'{base_url}/{year}.json', {'limit': 100})
+    return [
+        {
+            'round': int(race['round']),
+            'name': race['raceName'],
+            'location': race['Circuit']['Location']['locality'],
+            'country': race['Circuit']['Location']['country'],
+            'date': f"{race['date']}T{race.get('time', '00:00:00Z')}",
+            'sprint': 'Sprint' in race
+        }
+        for race in _races(data)
+    ]
+
+async def fetch_session_results(fetcher, year, round_number, session_name='Race', base_url=JOLPICA_BASE_URL):
+    """Classification of a race or sprint in the extract_standings_results() format"""
+    endpoint = 'sprint' if session_name == 'Sprint' else 'results'
+    data = await fetcher.get_json(f'{base_url}/{year}/{round_number}/{endpoint}.json', {'limit': 100})
+    races = _races(data)
+    if not races:
+        return []
+    key = 'SprintResults' if session_name == 'Sprint' else 'Results'
+    return [_standings_record(result) for result in races[0].get(key, [])]
+
+async def fetch_standings(fetcher, year, kind='driver', base_url=JOLPICA_BASE_URL):
+    """Official driver or constructor standings list for a season"""
+    endpoint = 'driverStandings' if kind == 'driver' else 'constructorStandings'
+    data = await fetcher.get_json(f'{base_url}/{year}/{endpoint}.json', {'limit': 100})
+    lists = data['MRData']['StandingsTable']['StandingsLists']
+    if not lists:
+        return []
+    key = 'DriverStandings' if kind == 'driver' else 'ConstructorStandings'
+    return lists[0][key]
+
+async def _fetch_rounds(fetcher, year, round_numbers, sprint_rounds, base_url):
+    tasks = [(round_number, session_name)
+             for round_number in round_numbers
+             for session_name in ('Race', 'Sprint')
+             if session_name != 'Sprint' or round_number in sprint_rounds]
+    results = await asyncio.gather(*(
+        fetch_session_results(fetcher, year, round_number, session_name, base_url)
+        for round_number, session_name in tasks
+    ), return_exceptions=True)
+
+    # [] when there is no classification, None when the upstream failed
+    merged = {}
+    for (round_number, session_name), result in zip(tasks, results):
+        if isinstance(result, DataNotAvailableError):
+            result = []
+        elif isinstance(result, Exception):
+            logger.error(f"Error fetching {year} round {round_number} {session_name}: {result}")
+            result = None
+        merged[(round_number, session_name)] = result
+    return {
+        round_number: (merged[(round_number, 'Race')], merged.get((round_number, 'Sprint'), []))
+        for round_number in round_numbers
+    }
+
+def fetch_rounds_bulk(year, round_numbers, sprint_rounds=(), base_url=JOLPICA_BASE_URL, **fetcher_options):
+    """Race and sprint results for several rounds, fetched concurrently
+
+    Returns {round: (race_results, sprint_results)} like standings.fetch_rounds(),
+    with None in place of results whose fetch failed.
+    """
+    async def run():
+        async with AsyncFetcher(**fetcher_options) as fetcher:
+            results = await _fetch_rounds(fetcher, year, list(round_numbers), set(sprint_rounds), base_url)
+            logger.info(f"Fetched {fetcher.stats['requests']} documents ({fetcher.stats['bytes']} bytes)")
+            return results
+    return asyncio.run(run())
+
+def fetch_seasons_bulk(years, base_url=JOLPICA_BASE_URL, **fetcher_options):
+    """Schedule and per-round results for several seasons, sharing one connection pool
+
+    Returns {year: {'schedule': [...], 'rounds': {round: (race_results, sprint_results)}}}.
+    Only rounds whose race date has passed are fetched.
+    """
+    async def season(fetcher, year):
+        schedule = await fetch_schedule(fetcher, year, base_url)
+        now = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        completed = [race['round'] for race in schedule if race['date'] < now]
+        sprint_rounds = {race['round'] for race in schedule if race['sprint']}
+        rounds = await _fetch_rounds(fetcher, year, completed, sprint_rounds, base_url)
+        return {'schedule': schedule, 'rounds': rounds}
+
+    async def run():
+        async with AsyncFetcher(**fetcher_options) as fetcher:
+            seasons = await asyncio.gather(*(season(fetcher, year) for year in years))
+            return dict(zip(years, seasons))
+    return asyncio.run(run())
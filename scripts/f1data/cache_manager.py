@@ -0,0 +1,800 @@
+#!/usr/bin/env python3
+"""
+Cache Management for FastF1 Data
+Implements intelligent caching to reduce API calls and improve performance
+"""
+
+import atexit
+import json
+import os
+import random
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from functools import wraps
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import logging
+
+from . import metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+# session_cache entries older than this are dropped on flush so the file stays small
+SESSION_CACHE_RETENTION = timedelta(days=60)
+
+# Failed prefetches are retried after this long
+PREFETCH_RETRY = timedelta(minutes=15)
+
+# Default disk budget for the FastF1 cache
+DEFAULT_CACHE_BUDGET_MB = 500
+
+# Full filesystem reconcile of the cache size index runs at most this often
+RECONCILE_INTERVAL = timedelta(days=7)
+
+# Per-run time budget shared by every retry, in seconds
+DEFAULT_RETRY_BUDGET = 120
+
+# Marks a pending metadata key for removal on flush
+_DELETED = object()
+
+# TTL curves per data type: tight right after a relevant session ends,
+# relaxed for the rest of the race weekend, days-long between events
+TTL_CURVES = {
+    'session': {
+        'sessions': ('Qualifying', 'Sprint', 'Race'),
+        'hot': [(timedelta(hours=2), timedelta(minutes=5)),
+                (timedelta(hours=6), timedelta(minutes=15))],
+        'weekend': timedelta(hours=1),
+        'idle': timedelta(days=2),
+        'fallback': timedelta(hours=1),
+    },
+    'standings': {
+        'sessions': ('Sprint', 'Race'),
+        'hot': [(timedelta(hours=3), timedelta(minutes=10)),
+                (timedelta(hours=12), timedelta(minutes=30))],
+        'weekend': timedelta(hours=2),
+        'idle': timedelta(days=3),
+        'fallback': timedelta(hours=2),
+    },
+}
+
+# A weekend window opens this long before the first session and closes this long after the last
+WEEKEND_LEAD = timedelta(hours=12)
+WEEKEND_TAIL = timedelta(hours=24)
+
+def utc_now():
+    """Current time as an aware UTC datetime"""
+    return datetime.now(timezone.utc)
+
+def parse_timestamp(value):
+    """Parse a stored ISO timestamp to aware UTC; naive values are treated as local time"""
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.astimezone()
+    return dt.astimezone(timezone.utc)
+
+@contextmanager
+def file_lock(lock_path):
+    """Hold an exclusive inter-process lock on lock_path"""
+    with open(lock_path, 'a+') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+def atomic_write_bytes(path, payload):
+    """Write a file through a temp file and rename, so readers never see a partial file"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600 files; published data must stay world-readable
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def atomic_write_text(path, text):
+    """Atomically write UTF-8 text"""
+    atomic_write_bytes(path, text.encode('utf-8'))
+
+def atomic_write_json(path, data):
+    """Atomically write compact JSON"""
+    atomic_write_text(path, json.dumps(data, separators=(',', ':'), default=str))
+
+def _apply_change(metadata, path, value):
+    """Set (or remove, for _DELETED) a nested metadata key"""
+    target = metadata
+    for key in path[:-1]:
+        target = target.setdefault(key, {})
+    if value is _DELETED:
+        target.pop(path[-1], None)
+    else:
+        target[path[-1]] = value
+
+class FreshnessPolicy:
+    """Decides how stale each data type may get, from the real session windows in UTC"""
+
+    def __init__(self, schedule_index=None, curves=TTL_CURVES):
+        self.schedule_index = schedule_index
+        self.curves = curves
+
+    def latest_session_end(self, data_type, now=None):
+        """End of the most recent session relevant to a data type, or None"""
+        if self.schedule_index is None:
+            return None
+        latest = self.schedule_index.latest_completed_session(now, self.curves[data_type]['sessions'])
+        return self.schedule_index.session_end(*latest) if latest else None
+
+    def in_race_weekend(self, now=None):
+        """Check if now falls inside any event's weekend window"""
+        if self.schedule_index is None:
+            return False
+        now = now or utc_now()
+        candidates = [self.schedule_index.latest_completed_session(now), self.schedule_index.next_session(now)]
+        for candidate in candidates:
+            if not candidate:
+                continue
+            window = self.schedule_index.event_window(candidate[0])
+            if window and window[0] - WEEKEND_LEAD <= now <= window[1] + WEEKEND_TAIL:
+                return True
+        return False
+
+    def ttl(self, data_type, now=None):
+        """Maximum age allowed for a data type right now"""
+        curve = self.curves[data_type]
+        if self.schedule_index is None:
+            return curve['fallback']
+
+        now = now or utc_now()
+        last_end = self.latest_session_end(data_type, now)
+        if last_end is not None:
+            since_end = now - last_end
+            for window, ttl in curve['hot']:
+                if since_end < window:
+                    return ttl
+
+        return curve['weekend'] if self.in_race_weekend(now) else curve['idle']
+
+    def is_stale(self, data_type, last_update, now=None):
+        """Check if data last updated at last_update (aware UTC) needs refreshing"""
+        now = now or utc_now()
+        if last_update is None:
+            return True
+
+        # Anything fetched before the latest relevant session ended is out of date
+        last_end = self.latest_session_end(data_type, now)
+        if last_end is not None and last_update < last_end:
+            return True
+
+        return now - last_update > self.ttl(data_type, now)
+
+# Instances with metadata changes possibly not flushed yet; weak so the exit hook keeps none alive
+_open_caches = weakref.WeakSet()
+
+@atexit.register
+def _flush_open_caches():
+    """Write whatever the caches still alive at exit haven't flushed"""
+    for cache in list(_open_caches):
+        cache.flush()
+
+def _expired(value, cutoff):
+    """Check if a stored timestamp is missing, unreadable or older than cutoff"""
+    try:
+        return not value or parse_timestamp(value) < cutoff
+    except (TypeError, ValueError):
+        return True
+
+class F1DataCache:
+    def __init__(self, cache_dir='../cache', data_dir='../data', schedule_index=None):
+        self.cache_dir = Path(cache_dir)
+        self.data_dir = Path(data_dir)
+        self.cache_metadata_file = self.cache_dir / 'cache_metadata.json'
+        self.policy = FreshnessPolicy(schedule_index)
+        
+        # Create directories
+        self.cache_dir.mkdir(exist_ok=True)
+        self.data_dir.mkdir(exist_ok=True)
+        
+        # Load cache metadata; changes are kept in memory and written once by flush()
+        self.cache_lock_file = self.cache_dir / 'cache_metadata.lock'
+        self.metadata = self._load_metadata()
+        self._pending = {}
+        # Background prefetches record into the same metadata
+        self._lock = threading.RLock()
+        _open_caches.add(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        """Flush pending changes; the exit hook no longer tracks this instance"""
+        result = self.flush()
+        _open_caches.discard(self)
+        return result
+    
+    def _empty_metadata(self):
+        return {
+            'last_schedule_fetch': None,
+            'last_session_update': None,
+            'last_standings_update': None,
+            'cached_files': {},
+            'session_cache': {}
+        }
+    
+    def _load_metadata(self):
+        """Load cache metadata"""
+        if self.cache_metadata_file.exists():
+            try:
+                with open(self.cache_metadata_file, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                # Keep the unreadable file for inspection instead of silently dropping it
+                backup = self.cache_metadata_file.with_suffix('.corrupt')
+                logger.error(f"Could not load cache metadata ({e}), moved to {backup.name}")
+                try:
+                    os.replace(self.cache_metadata_file, backup)
+                except OSError:
+                    pass
+        
+        return self._empty_metadata()
+    
+    def _set(self, value, *path):
+        """Record a metadata change in memory, to be written by flush()"""
+        with self._lock:
+            _apply_change(self.metadata, path, value)
+            self._pending[path] = value
+    
+    def _delete(self, *path):
+        """Record a metadata key removal, to be written by flush()"""
+        with self._lock:
+            _apply_change(self.metadata, path, _DELETED)
+            self._pending[path] = _DELETED
+    
+    def _prune(self, metadata):
+        """Drop session_cache and prefetched entries past retention, or with malformed timestamps"""
+        cutoff = utc_now() - SESSION_CACHE_RETENTION
+        session_cache = metadata.get('session_cache', {})
+        expired = [k for k, v in session_cache.items() if _expired(v, cutoff)]
+        for key in expired:
+            del session_cache[key]
+        
+        prefetched = metadata.get('prefetched', {})
+        expired = [k for k, v in prefetched.items() if not isinstance(v, dict) or _expired(v.get('at'), cutoff)]
+        for key in expired:
+            del prefetched[key]
+    
+    def flush(self):
+        """Write pending changes under the metadata lock, merged over what's on disk"""
+        if not self._pending:
+            return True
+        try:
+            with self._lock, file_lock(self.cache_lock_file):
+                # Another process may have written since we loaded; apply our changes on top
+                current = self._load_metadata()
+                for path, value in self._pending.items():
+                    _apply_change(current, path, value)
+                self._prune(current)
+                atomic_write_json(self.cache_metadata_file, current)
+                self.metadata = current
+                self._pending = {}
+            return True
+        except Exception as e:
+            logger.error(f"Could not save cache metadata: {e}")
+            return False
+    
+    def set_schedule(self, schedule_index):
+        """Use a (refreshed) schedule index for freshness decisions"""
+        self.policy.schedule_index = schedule_index
+    
+    def should_update_schedule(self):
+        """Check if schedule should be updated (once per day)"""
+        last_fetch = self.metadata.get('last_schedule_fetch')
+        if not last_fetch:
+            return True
+        
+        return utc_now() - parse_timestamp(last_fetch) > timedelta(days=1)
+    
+    def should_update_session_data(self, event_name, session_type, now=None):
+        """Check if session data should be updated"""
+        cache_key = f"{event_name}_{session_type}"
+        last_update = self.metadata.get('session_cache', {}).get(cache_key)
+        
+        return self.policy.is_stale('session', parse_timestamp(last_update) if last_update else None, now)
+    
+    def should_update_standings(self, now=None):
+        """Check if standings should be updated"""
+        last_update = self.metadata.get('last_standings_update')
+        
+        return self.policy.is_stale('standings', parse_timestamp(last_update) if last_update else None, now)
+    
+    def last_update(self, data_type, now=None):
+        """When a data type was last refreshed (aware UTC), or None if never
+
+        Session data is tracked per session, so this is the update of the
+        latest completed session relevant to the 'session' TTL curve.
+        """
+        if data_type == 'standings':
+            last_update = self.metadata.get('last_standings_update')
+        else:
+            schedule_index = self.policy.schedule_index
+            latest = schedule_index and schedule_index.latest_completed_session(
+                now, self.policy.curves[data_type]['sessions'])
+            if not latest:
+                return None
+            event = schedule_index.get_event(latest[0])
+            last_update = self.metadata.get('session_cache', {}).get(f"{event['name']}_{latest[1]}")
+        return parse_timestamp(last_update) if last_update else None
+    
+    def next_update_due(self, now=None):
+        """Earliest time any data type can go stale, assuming nothing is fetched meanwhile
+        
+        That's the soonest of: each data type's TTL running out, the next
+        relevant session ending, and the next race weekend window opening
+        (where TTLs tighten). Returns now if something is already stale.
+        """
+        now = now or utc_now()
+        schedule_index = self.policy.schedule_index
+        due = []
+        for data_type, curve in self.policy.curves.items():
+            last_update = self.last_update(data_type, now)
+            if self.policy.is_stale(data_type, last_update, now):
+                return now
+            due.append(last_update + self.policy.ttl(data_type, now))
+            if schedule_index is not None:
+                due.append(schedule_index.next_session_end(now, curve['sessions']))
+        
+        upcoming = schedule_index.next_session(now) if schedule_index is not None else None
+        if upcoming:
+            window = schedule_index.event_window(upcoming[0])
+            if window and window[0] - WEEKEND_LEAD > now:
+                due.append(window[0] - WEEKEND_LEAD)
+        return min(d for d in due if d is not None)
+    
+    def mark_schedule_updated(self):
+        """Mark schedule as updated"""
+        self._set(utc_now().isoformat(), 'last_schedule_fetch')
+    
+    def mark_session_updated(self, event_name, session_type):
+        """Mark session data as updated"""
+        cache_key = f"{event_name}_{session_type}"
+        self._set(utc_now().isoformat(), 'session_cache', cache_key)
+    
+    def mark_standings_updated(self):
+        """Mark standings as updated"""
+        self._set(utc_now().isoformat(), 'last_standings_update')
+    
+    def mark_prefetched(self, key, ok=True):
+        """Record a prefetch attempt (e.g. '2025/12/Race')"""
+        self._set({'at': utc_now().isoformat(), 'ok': ok}, 'prefetched', key)
+    
+    def needs_prefetch(self, key, now=None):
+        """Check if a prefetch never ran, or failed long enough ago to retry"""
+        entry = self.metadata.get('prefetched', {}).get(key)
+        if not entry:
+            return True
+        if entry.get('ok'):
+            return False
+        return (now or utc_now()) - parse_timestamp(entry['at']) > PREFETCH_RETRY
+    
+    def get_cached_file_age(self, filename):
+        """Get age of cached file in minutes"""
+        filepath = self.data_dir / filename
+        if not filepath.exists():
+            return float('inf')
+        
+        file_time = datetime.fromtimestamp(filepath.stat().st_mtime)
+        age = datetime.now() - file_time
+        return age.total_seconds() / 60  # Return age in minutes
+    
+    def is_file_fresh(self, filename, max_age_minutes=60):
+        """Check if file is fresh enough"""
+        age = self.get_cached_file_age(filename)
+        return age < max_age_minutes
+    
+    def record_access(self, entry_key):
+        """Record that a cache entry (e.g. '2025/<event>/<session>') was just used"""
+        self._set(utc_now().isoformat(), 'cached_files', entry_key, 'last_access')
+        
+        # The entry may have just been written; refresh its size along with the shared sqlite files
+        self.index_entry(entry_key)
+        for path in self.cache_dir.glob('*.sqlite'):
+            self.index_entry(path.name)
+    
+    def _measure(self, path):
+        """(size, file count, newest mtime) of a file or directory tree"""
+        if path.is_file():
+            st = path.stat()
+            return st.st_size, 1, st.st_mtime
+        
+        size = files = 0
+        mtime = 0.0
+        stack = [path]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        st = entry.stat(follow_symlinks=False)
+                        size += st.st_size
+                        files += 1
+                        mtime = max(mtime, st.st_mtime)
+        return size, files, mtime
+    
+    def index_entry(self, entry_key):
+        """Update the size index for a single entry (O(files in that entry))"""
+        path = self.cache_dir / entry_key
+        if not path.exists():
+            if entry_key in self.metadata.get('cached_files', {}):
+                self._delete('cached_files', entry_key)
+            return
+        
+        size, files, mtime = self._measure(path)
+        self._set(size, 'cached_files', entry_key, 'size')
+        self._set(files, 'cached_files', entry_key, 'files')
+        self._set(mtime, 'cached_files', entry_key, 'mtime')
+    
+    def needs_reconcile(self, now=None):
+        """Check if the size index is due a full filesystem pass"""
+        last = self.metadata.get('last_cache_reconcile')
+        return not last or (now or utc_now()) - parse_timestamp(last) > RECONCILE_INTERVAL
+    
+    def reconcile(self):
+        """Rebuild the size index from the filesystem
+        
+        Entries are FastF1 session directories (year/event/session) plus
+        top-level sqlite files such as the HTTP cache.
+        """
+        candidates = [p for p in self.cache_dir.glob('*.sqlite') if p.is_file()]
+        candidates += [p for p in self.cache_dir.glob('*/*/*') if p.is_dir() and p.parts[-3].isdigit()]
+        
+        found = set()
+        for path in candidates:
+            key = path.relative_to(self.cache_dir).as_posix()
+            found.add(key)
+            self.index_entry(key)
+        
+        for key in list(self.metadata.get('cached_files', {})):
+            if key not in found:
+                self._delete('cached_files', key)
+        
+        self._set(utc_now().isoformat(), 'last_cache_reconcile')
+        logger.info(f"Reconciled cache index: {len(found)} entries")
+    
+    def _indexed_entries(self):
+        """Cache entries from the size index with their last access time"""
+        if self.needs_reconcile():
+            self.reconcile()
+        
+        entries = {}
+        for key, info in self.metadata.get('cached_files', {}).items():
+            if 'size' not in info:
+                continue
+            # Prefer recorded access, fall back to the newest modification time
+            last_access = info.get('mtime', 0)
+            if info.get('last_access'):
+                last_access = max(last_access, parse_timestamp(info['last_access']).timestamp())
+            entries[key] = {'path': self.cache_dir / key, 'size': info['size'], 'last_access': last_access}
+        return entries
+    
+    def protected_entries(self, now=None):
+        """Seasons and event directory names that must never be evicted"""
+        now = now or utc_now()
+        seasons = {str(now.year)}
+        event_names = set()
+        
+        # The upcoming event may belong to the next season around New Year
+        schedule_index = self.policy.schedule_index
+        if schedule_index is not None:
+            seasons.add(str(schedule_index.year))
+            upcoming = schedule_index.next_session(now)
+            if upcoming:
+                event_names.add(schedule_index.get_event(upcoming[0])['name'].replace(' ', '_'))
+        return seasons, event_names
+    
+    def _is_protected(self, key, protected):
+        seasons, event_names = protected
+        return key.split('/')[0] in seasons or any(name in key for name in event_names)
+    
+    def _evict_entry(self, key, entry):
+        """Delete one cache entry from disk and the metadata"""
+        path = entry['path']
+        if path.is_dir():
+            shutil.rmtree(path)
+        elif path.exists():
+            path.unlink()
+        self._delete('cached_files', key)
+        metrics.increment('cache_evictions')
+        metrics.increment('cache_evicted_bytes', entry['size'])
+        logger.info(f"Evicted cache entry {key} ({entry['size'] / (1024 * 1024):.1f} MB)")
+    
+    def evict_to_budget(self, max_size_mb=DEFAULT_CACHE_BUDGET_MB, max_age_days=None, now=None):
+        """Evict least recently used entries until the cache fits the size budget
+        
+        With max_age_days, entries not used for that long are evicted as well.
+        Current-season and upcoming-event entries are never evicted.
+        """
+        now = now or utc_now()
+        budget = max_size_mb * 1024 * 1024
+        entries = self._indexed_entries()
+        total = sum(e['size'] for e in entries.values())
+        protected = self.protected_entries(now)
+        
+        candidates = sorted(
+            ((key, entry) for key, entry in entries.items() if not self._is_protected(key, protected)),
+            key=lambda item: item[1]['last_access']
+        )
+        age_cutoff = (now - timedelta(days=max_age_days)).timestamp() if max_age_days else None
+        
+        evicted = 0
+        freed = 0
+        for key, entry in candidates:
+            too_big = total - freed > budget
+            too_old = age_cutoff is not None and entry['last_access'] < age_cutoff
+            if not too_big and not too_old:
+                if age_cutoff is None:
+                    break
+                continue
+            try:
+                self._evict_entry(key, entry)
+                evicted += 1
+                freed += entry['size']
+            except OSError as e:
+                logger.warning(f"Could not evict {key}: {e}")
+        
+        remaining = total - freed
+        if remaining > budget:
+            logger.warning(f"Cache still over budget after eviction: {remaining / (1024 * 1024):.1f} MB (protected entries)")
+        
+        return {
+            'evicted_entries': evicted,
+            'freed_mb': freed / (1024 * 1024),
+            'cache_size_mb': remaining / (1024 * 1024),
+            'budget_mb': max_size_mb
+        }
+    
+    def cleanup_old_cache(self, max_age_days=7, max_size_mb=DEFAULT_CACHE_BUDGET_MB):
+        """Clean up cache entries unused for max_age_days, then enforce the size budget"""
+        try:
+            return self.evict_to_budget(max_size_mb, max_age_days=max_age_days)
+        except Exception as e:
+            logger.error(f"Error during cache cleanup: {e}")
+            return {}
+    
+    def get_cache_stats(self):
+        """Get cache statistics from the size index"""
+        try:
+            if self.needs_reconcile():
+                self.reconcile()
+            indexed = self.metadata.get('cached_files', {}).values()
+            
+            # Sizes recorded by the publish manifest; the tree (races/, drivers/, laps/, ...) is only
+            # walked for data published before there was a manifest
+            from .publish import load_manifest
+            published = load_manifest(self.data_dir)['files'].values()
+            if published:
+                data_sizes = [info.get('size', 0) for info in published]
+            else:
+                data_sizes = [path.stat().st_size for path in self.data_dir.rglob('*.json') if path.is_file()]
+            
+            return {
+                'cache_files': sum(info.get('files', 0) for info in indexed),
+                'cache_entries': len(indexed),
+                'cache_size_mb': sum(info.get('size', 0) for info in indexed) / (1024 * 1024),
+                'data_files': len(data_sizes),
+                'data_size_mb': sum(data_sizes) / (1024 * 1024),
+                'last_schedule_update': self.metadata.get('last_schedule_fetch'),
+                'last_standings_update': self.metadata.get('last_standings_update'),
+                'last_cache_reconcile': self.metadata.get('last_cache_reconcile')
+            }
+        except Exception as e:
+            logger.error(f"Error getting cache stats: {e}")
+            return {}
+
+# Error handling utilities
+class F1DataError(Exception):
+    """Custom exception for F1 data errors"""
+    pass
+
+class APITimeoutError(F1DataError):
+    """Raised when API calls timeout"""
+    pass
+
+class DataNotAvailableError(F1DataError):
+    """Raised when requested data is not available"""
+    pass
+
+class CircuitOpenError(F1DataError):
+    """Raised without calling upstream while its circuit breaker is open"""
+    pass
+
+class CircuitBreaker:
+    """Fails calls fast once an upstream has failed repeatedly, probing again after a cool-down"""
+    
+    def __init__(self, name, failure_threshold=3, reset_after=60):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at = None
+        self.trial_started = None
+        self.lock = threading.Lock()
+    
+    @property
+    def is_open(self):
+        return self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_after
+    
+    def allow(self):
+        """Check if a call may go upstream: always when closed, a single trial call when half-open"""
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at < self.reset_after:
+                return False
+            # A trial that never reports back (e.g. a non-retryable error) expires after another cool-down
+            if self.trial_started is not None and now - self.trial_started < self.reset_after:
+                return False
+            self.trial_started = now
+            return True
+    
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_started = None
+    
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                if self.opened_at is None or not self.is_open:
+                    logger.error(f"Circuit breaker '{self.name}' opened after {self.failures} failures")
+                self.opened_at = time.monotonic()
+                self.trial_started = None
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(name, **options):
+    """Circuit breaker shared by every call to the named upstream in this process"""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name, **options)
+        return _breakers[name]
+
+class RetryBudget:
+    """Wall-clock time left for retries in the current run"""
+    
+    def __init__(self, seconds):
+        self.deadline = time.monotonic() + seconds
+    
+    def remaining(self):
+        return max(0.0, self.deadline - time.monotonic())
+
+_retry_budget = RetryBudget(DEFAULT_RETRY_BUDGET)
+
+def start_retry_budget(seconds=DEFAULT_RETRY_BUDGET):
+    """Start a new per-run retry budget; retries stop once it is spent"""
+    global _retry_budget
+    _retry_budget = RetryBudget(seconds)
+    return _retry_budget
+
+def _requests_transient_errors():
+    """Connection and timeout errors of requests (used by FastF1), if it has been imported"""
+    requests = sys.modules.get('requests')
+    if requests is None:
+        return ()
+    return (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+def is_retryable(error):
+    """Transient upstream failures are retried; missing data, local I/O and programming errors are not"""
+    if isinstance(error, (DataNotAvailableError, CircuitOpenError)):
+        return False
+    # Only network failures: FileNotFoundError, PermissionError & co. are OSErrors too but won't go away
+    return isinstance(error, (F1DataError, TimeoutError, ConnectionError, socket.gaierror)
+                      + _requests_transient_errors())
+
+def with_retry(max_retries=3, delay=2, backoff=2, max_delay=30, breaker='upstream', fallback=None):
+    """Decorator for retrying transient failures with jittered backoff
+    
+    Only errors accepted by is_retryable() are retried, and never past the
+    per-run retry budget. Failures feed a circuit breaker shared by every
+    function using the same breaker name; while it is open calls fail fast.
+    When retrying gives up, fallback(*args, **kwargs) is returned if given,
+    so callers can serve cached data instead.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            circuit = get_breaker(breaker) if breaker else None
+            
+            def give_up(error):
+                if fallback is not None:
+                    logger.warning(f"{func.__name__} falling back to cached data: {error}")
+                    return fallback(*args, **kwargs)
+                raise error
+            
+            if circuit and not circuit.allow():
+                return give_up(CircuitOpenError(f"Upstream '{breaker}' unavailable, not calling {func.__name__}"))
+            
+            attempt = 0
+            while True:
+                try:
+                    result = func(*args, **kwargs)
+                    if circuit:
+                        circuit.record_success()
+                    return result
+                except Exception as e:
+                    if not is_retryable(e):
+                        raise
+                    if circuit:
+                        circuit.record_failure()
+                    attempt += 1
+                    
+                    # Full jitter keeps parallel workers from retrying in lockstep
+                    sleep_for = random.uniform(0, min(max_delay, delay * backoff ** (attempt - 1)))
+                    if attempt >= max_retries:
+                        logger.error(f"{func.__name__} failed after {attempt} attempts: {e}")
+                        return give_up(e)
+                    if circuit and not circuit.allow():
+                        return give_up(e)
+                    if sleep_for > _retry_budget.remaining():
+                        logger.error(f"{func.__name__} failed, retry budget exhausted: {e}")
+                        return give_up(e)
+                    
+                    logger.warning(f"Attempt {attempt} of {func.__name__} failed: {e}. Retrying in {sleep_for:.1f}s...")
+                    time.sleep(sleep_for)
+            
+        return wrapper
+    return decorator
+
+def safe_file_operation(operation):
+    """Safely perform file operations with error handling"""
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except PermissionError:
+                logger.error(f"Permission denied during {operation}")
+                return False
+            except OSError as e:
+                logger.error(f"OS error during {operation}: {e}")
+                return False
+            except Exception as e:
+                logger.error(f"Unexpected error during {operation}: {e}")
+                return False
+        return wrapper
+    return decorator
\ No newline at end of file
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+FastF1 Cache Cleanup Script
+Keeps the FastF1 cache within a disk budget by evicting the least recently used entries
+"""
+
+import argparse
+from pathlib import Path
+
+from .cache_manager import DEFAULT_CACHE_BUDGET_MB, F1DataCache
+
+def cleanup_cache(max_size_mb=DEFAULT_CACHE_BUDGET_MB, max_age_days=None, schedule_index=None):
+    """Evict cold FastF1 cache entries until the cache fits the budget"""
+    cache_dir = Path('.cache')
+    
+    if not cache_dir.exists():
+        print("ℹ️ No cache directory found")
+        return None
+    
+    with F1DataCache(cache_dir=cache_dir, data_dir='public/data', schedule_index=schedule_index) as cache:
+        stats = cache.evict_to_budget(max_size_mb, max_age_days=max_age_days)
+    
+    print(f"📊 Cache size: {stats['cache_size_mb']:.1f} MB (budget {stats['budget_mb']} MB)")
+    if stats['evicted_entries']:
+        print(f"🧹 Evicted {stats['evicted_entries']} cold entries, freed {stats['freed_mb']:.1f} MB")
+    else:
+        print("✅ Cache within budget, nothing evicted")
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Evict least recently used FastF1 cache entries')
+    parser.add_argument('--max-size-mb', type=float, default=DEFAULT_CACHE_BUDGET_MB,
+                        help=f'Cache size budget in MB (default: {DEFAULT_CACHE_BUDGET_MB})')
+    parser.add_argument('--max-age-days', type=float, default=None,
+                        help='Also evict entries unused for this many days')
+    args = parser.parse_args()
+    cleanup_cache(args.max_size_mb, args.max_age_days)
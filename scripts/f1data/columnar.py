@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Columnar Session Store
+Per-session results and laps as Parquet files partitioned by season/round/session, read back memory-mapped
+
+    cache/parquet/results/season=2025/round=12/session=Race/part-0.parquet
+    cache/parquet/laps/season=2025/round=12/session=Race/part-0.parquet
+
+Readers only touch the columns and partitions a query asks for, instead of
+rehydrating whole FastF1 sessions from the pickle cache. Needs pyarrow
+(optional); without it the export stage is skipped.
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from .cache_manager import atomic_write_bytes
+from .schedule_index import ScheduleIndex
+from .session_loader import load_session
+
+logger = logging.getLogger(__name__)
+
+PARQUET_DIR = Path('cache/parquet')
+
+KIND_RESULTS = 'results'
+KIND_LAPS = 'laps'
+
+# Sessions worth keeping for analysis
+EXPORT_SESSIONS = ('Qualifying', 'Sprint', 'Race')
+
+# Columns kept per kind; whatever a FastF1 version doesn't provide is left out
+RESULT_COLUMNS = ['DriverNumber', 'Abbreviation', 'FullName', 'TeamName', 'Position', 'ClassifiedPosition',
+                  'GridPosition', 'Q1', 'Q2', 'Q3', 'Time', 'Status', 'Points']
+LAP_COLUMNS = ['Driver', 'DriverNumber', 'Team', 'LapNumber', 'LapTime', 'Time', 'Stint', 'Compound', 'TyreLife',
+               'FreshTyre', 'Sector1Time', 'Sector2Time', 'Sector3Time', 'PitInTime', 'PitOutTime',
+               'Position', 'TrackStatus', 'IsPersonalBest', 'Deleted', 'IsAccurate']
+
+PART_NAME = 'part-0.parquet'
+
+def pyarrow_available():
+    """Check if the optional pyarrow dependency is installed"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def partition_path(kind, year, round_number, session_name, root=PARQUET_DIR):
+    """Hive-style partition directory of one session"""
+    return Path(root) / kind / f'season={int(year)}' / f'round={int(round_number)}' / f'session={session_name}'
+
+def is_exported(year, round_number, session_name, root=PARQUET_DIR):
+    """Check if a session is already in the store (its results file is written after the laps)"""
+    return (partition_path(KIND_RESULTS, year, round_number, session_name, root) / PART_NAME).exists()
+
+def write_frame(frame, columns, path):
+    """Write the available columns of a DataFrame as one Parquet file, atomically"""
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    frame = frame[[column for column in columns if column in frame.columns]].reset_index(drop=True)
+    for column in frame.columns:
+        if frame[column].dtype != object:
+            continue
+        kind = pd.api.types.infer_dtype(frame[column], skipna=True)
+        # Flags with gaps (Deleted, FreshTyre) stay booleans, as a nullable column
+        if kind == 'boolean':
+            frame[column] = frame[column].astype('boolean')
+        # Only columns that really mix types (e.g. ClassifiedPosition 'R' or 1) are stored as strings
+        elif kind.startswith('mixed'):
+            frame[column] = frame[column].map(lambda v: None if v is None or v != v else str(v))
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+
+    buffer = pa.BufferOutputStream()
+    pq.write_table(table, buffer, compression='zstd')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(path, buffer.getvalue().to_pybytes())
+    return table.num_rows
+
+def export_session(year, round_number, session_name, root=PARQUET_DIR):
+    """Load one session with laps and write its results and laps partitions; returns rows written"""
+    session = load_session(year, round_number, session_name, profile='laps')
+    rows = 0
+    laps = getattr(session, 'laps', None)
+    if laps is not None and len(laps):
+        rows += write_frame(laps, LAP_COLUMNS,
+                            partition_path(KIND_LAPS, year, round_number, session_name, root) / PART_NAME)
+    # Results last: their file marks the session exported (is_exported), so a crash leaves it pending
+    rows += write_frame(session.results, RESULT_COLUMNS,
+                        partition_path(KIND_RESULTS, year, round_number, session_name, root) / PART_NAME)
+    return rows
+
+def export_pending(schedule_index, root=PARQUET_DIR, sessions=EXPORT_SESSIONS, refresh=False, limit=None):
+    """Export completed sessions not in the store yet, newest first; returns (exported, failed) counts
+
+    limit caps the sessions loaded in one call so a backlog drains over
+    several pipeline runs instead of stretching one of them.
+    """
+    exported = failed = 0
+    for round_number, session_name in schedule_index.completed_sessions(session_names=sessions):
+        if not refresh and is_exported(schedule_index.year, round_number, session_name, root):
+            continue
+        if limit is not None and exported + failed >= limit:
+            logger.info("Export limit reached, remaining sessions are exported on the next runs")
+            break
+        try:
+            rows = export_session(schedule_index.year, round_number, session_name, root)
+            exported += 1
+            logger.info(f"🗃️ Exported {schedule_index.year} round {round_number} {session_name} ({rows} rows)")
+        except Exception as e:
+            failed += 1
+            logger.warning(f"Could not export {schedule_index.year} round {round_number} {session_name}: {e}")
+    return exported, failed
+
+def read(kind, columns=None, filters=None, root=PARQUET_DIR):
+    """Read a kind ('results' or 'laps') across partitions as a pyarrow Table
+
+    columns limits what is decoded (partition keys season/round/session can
+    be requested too); filters use the pyarrow.parquet syntax, e.g.
+    [('season', '>=', 2022), ('Driver', '==', 'LEC')], and prune whole
+    partitions and row groups before anything is read. Files are
+    memory-mapped rather than copied into memory.
+    """
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    from pyarrow import fs
+
+    path = Path(root) / kind
+    if not path.exists():
+        raise FileNotFoundError(f"No {kind} exported under {root}")
+    dataset = ds.dataset(str(path.resolve()), format='parquet', partitioning='hive',
+                         filesystem=fs.LocalFileSystem(use_mmap=True))
+    expression = pq.filters_to_expression(filters) if filters else None
+    return dataset.to_table(columns=columns, filter=expression)
+
+def read_partition(kind, year, round_number, session_name, columns=None, root=PARQUET_DIR):
+    """Read one session's file memory-mapped as a pyarrow Table, or None if it isn't exported
+
+    Requested columns the file doesn't have are left out, so files written
+    before a column was added to the export stay readable.
+    """
+    import pyarrow.parquet as pq
+
+    path = partition_path(kind, year, round_number, session_name, root) / PART_NAME
+    if not path.exists():
+        return None
+    if columns is not None:
+        available = set(pq.read_schema(path).names)
+        columns = [column for column in columns if column in available]
+    return pq.read_table(path, columns=columns, memory_map=True)
+
+def main():
+    parser = argparse.ArgumentParser(description='Export sessions to the Parquet store or query it')
+    commands = parser.add_subparsers(dest='command', required=True)
+    export = commands.add_parser('export', help='Export completed sessions of one or more seasons')
+    export.add_argument('years', type=int, nargs='+')
+    export.add_argument('--refresh', action='store_true', help='Rewrite sessions already exported')
+    query = commands.add_parser('query', help='Read columns with optional equality filters')
+    query.add_argument('kind', choices=[KIND_RESULTS, KIND_LAPS])
+    query.add_argument('--columns', help='Comma-separated columns (default: all)')
+    query.add_argument('--where', action='append', default=[], metavar='COLUMN=VALUE',
+                       help='Equality filter, repeatable (e.g. season=2025, session=Race, Driver=LEC)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if not pyarrow_available():
+        parser.error('pyarrow is not installed (pip install pyarrow)')
+
+    if args.command == 'export':
+        from .session_loader import enable_cache
+        enable_cache('.cache')
+        for year in args.years:
+            exported, failed = export_pending(ScheduleIndex.load(year, 'cache'), refresh=args.refresh)
+            print(f"{year}: {exported} sessioni esportate, {failed} fallite")
+        return
+
+    filters = []
+    for condition in args.where:
+        column, _, value = condition.partition('=')
+        # Partition keys season and round are integers, everything else is compared as stored
+        filters.append((column, '==', int(value) if column in ('season', 'round') else value))
+    start = time.perf_counter()
+    table = read(args.kind, args.columns.split(',') if args.columns else None, filters)
+    elapsed = time.perf_counter() - start
+    print(table.to_pandas().to_string(max_rows=50))
+    print(f"\n{table.num_rows} righe, {table.nbytes / 1024:.1f} KB in {elapsed * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Lap and Stint Analytics
+Race pace, stints, tyre degradation, pit stop losses and gap-to-leader traces from session laps
+
+One session is loaded, reduced to a few float columns and analysed at a
+time, so memory stays flat however many rounds are pending. Each round is
+published as public/data/laps/round_XX.json, listed by laps/index.json.
+"""
+
+import argparse
+import gc
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .publish import publish_json
+from .schedule_index import ScheduleIndex
+from .session_loader import load_session
+
+logger = logging.getLogger(__name__)
+
+public_data_dir = Path('public/data')
+
+ANALYSIS_SESSIONS = ('Sprint', 'Race')
+
+# Columns read from session.laps (or the Parquet store); the rest of the frame is dropped on load
+LAP_COLUMNS = ['Driver', 'DriverNumber', 'Team', 'LapNumber', 'LapTime', 'Time', 'Stint', 'Compound',
+               'TyreLife', 'PitInTime', 'PitOutTime', 'TrackStatus', 'Deleted', 'IsAccurate']
+
+# TrackStatus digits for safety car, red flag and virtual safety car
+NEUTRALISED_STATUS = '[4567]'
+# Laps slower than this factor of the driver's median clean lap are traffic or incidents, not pace
+CLEAN_LAP_FACTOR = 1.07
+# Fewest clean laps a stint needs for a degradation slope
+MIN_FIT_LAPS = 5
+# Lap time gained per lap from fuel burn, added back so slopes measure the tyres
+FUEL_EFFECT_S_PER_LAP = 0.03
+# Flag values as FastF1 gives them, and as strings in Parquet files exported before they were kept as booleans
+_FLAG_VALUES = {True: True, False: False, 'True': True, 'False': False}
+
+def analysis_name(round_number):
+    """Path of a round's analytics, relative to the data directory"""
+    return f'laps/round_{round_number:02d}.json'
+
+def is_analysed(year, round_number, session_name, data_dir=public_data_dir):
+    """Check if a session is already in its round's published analytics"""
+    try:
+        with open(Path(data_dir) / analysis_name(round_number), 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return data.get('season') == year and session_name in data.get('sessions', {})
+
+def _seconds(column):
+    """Timedelta (or already numeric) column as float seconds, NaN where missing"""
+    import pandas as pd
+
+    if column.dtype.kind == 'm':
+        return column.dt.total_seconds().to_numpy()
+    return pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+
+def _flag(column):
+    """Boolean array from a flag column; 'True'/'False' strings (older Parquet exports) parsed, missing is False"""
+    return column.map(_FLAG_VALUES).eq(True).to_numpy()
+
+def _label(value):
+    """String value, or None for missing labels (NaN, None, '')"""
+    return value if isinstance(value, str) and value else None
+
+def _rounded(values, digits):
+    """Float array as a JSON-ready list, None where missing"""
+    import numpy as np
+
+    values = np.round(np.asarray(values, dtype=float), digits)
+    return [None if missing else value for value, missing in zip(values.tolist(), np.isnan(values).tolist())]
+
+def prepare_laps(laps):
+    """Reduce a laps DataFrame to the compact frame the analysis works on, one row per driver lap"""
+    import numpy as np
+    import pandas as pd
+
+    def column(name, default):
+        return laps[name] if name in laps else pd.Series(default, index=laps.index)
+
+    frame = pd.DataFrame({
+        'driver': column('Driver', '').astype(str).to_numpy(),
+        'driver_number': pd.to_numeric(column('DriverNumber', np.nan), errors='coerce').to_numpy(),
+        'team': column('Team', None).to_numpy(dtype=object),
+        'lap': pd.to_numeric(column('LapNumber', np.nan), errors='coerce').to_numpy(),
+        'lap_s': _seconds(column('LapTime', np.nan)),
+        'time_s': _seconds(column('Time', np.nan)),
+        'stint': pd.to_numeric(column('Stint', np.nan), errors='coerce').to_numpy(),
+        'compound': column('Compound', None).to_numpy(dtype=object),
+        'tyre_life': pd.to_numeric(column('TyreLife', np.nan), errors='coerce').to_numpy(),
+        'pit_in': column('PitInTime', np.nan).notna().to_numpy(),
+        'pit_out': column('PitOutTime', np.nan).notna().to_numpy(),
+        'pit_in_s': _seconds(column('PitInTime', np.nan)),
+        'pit_out_s': _seconds(column('PitOutTime', np.nan)),
+        'neutralised': column('TrackStatus', '').astype(str).str.contains(NEUTRALISED_STATUS).to_numpy(),
+        'deleted': _flag(column('Deleted', False)),
+        'accurate': _flag(column('IsAccurate', True)),
+    })
+    frame = frame[frame['lap'].notna() & (frame['driver'] != '')]
+    return frame.sort_values(['driver', 'lap'], kind='stable').reset_index(drop=True)
+
+def clean_lap_mask(frame):
+    """Green-flag, non-pit, valid laps within CLEAN_LAP_FACTOR of the driver's median"""
+    candidates = (frame['lap_s'].notna() & (frame['lap'] > 1) & ~frame['pit_in'] & ~frame['pit_out']
+                  & ~frame['neutralised'] & ~frame['deleted'] & frame['accurate'])
+    median = frame['lap_s'].where(candidates).groupby(frame['driver']).transform('median')
+    return candidates & (frame['lap_s'] <= median * CLEAN_LAP_FACTOR)
+
+def stint_summary(frame, clean):
+    """One row per (driver, stint): compound, laps and the fuel-corrected degradation slope in s/lap"""
+    import pandas as pd
+
+    stints = frame[frame['stint'].notna()].groupby(['driver', 'stint'], sort=True).agg(
+        compound=('compound', 'first'),
+        start_lap=('lap', 'min'),
+        end_lap=('lap', 'max'),
+        laps=('lap', 'size'),
+        tyre_life_start=('tyre_life', 'min'),
+    )
+
+    # Least-squares slope of lap time over tyre age per stint, from grouped sums
+    fit = frame[clean & frame['stint'].notna()]
+    x = fit['tyre_life'].fillna(fit['lap']).to_numpy()
+    y = fit['lap_s'].to_numpy() + FUEL_EFFECT_S_PER_LAP * fit['lap'].to_numpy()
+    sums = pd.DataFrame({'n': 1.0, 'x': x, 'y': y, 'xy': x * y, 'xx': x * x},
+                        index=pd.MultiIndex.from_arrays([fit['driver'], fit['stint']])).groupby(level=[0, 1]).sum()
+    denominator = sums['n'] * sums['xx'] - sums['x'] ** 2
+    valid = (sums['n'] >= MIN_FIT_LAPS) & (denominator > 0)
+    slope = (sums['n'] * sums['xy'] - sums['x'] * sums['y']) / denominator.where(valid)
+    stints['degradation'] = slope.reindex(stints.index).to_numpy(dtype=float)
+    return stints
+
+def pit_stops(frame, pace):
+    """One row per pit stop: in-lap, pit lane time and time lost against two laps at race pace"""
+    by_driver = frame.groupby('driver', sort=False)
+    next_pit_out = by_driver['pit_out'].shift(-1, fill_value=False).astype(bool)
+    stops = frame.assign(
+        next_time_s=by_driver['time_s'].shift(-1),
+        previous_time_s=by_driver['time_s'].shift(1),
+        next_pit_out_s=by_driver['pit_out_s'].shift(-1),
+        next_compound=by_driver['compound'].shift(-1),
+    )[frame['pit_in'] & next_pit_out]
+
+    driver_pace = stops['driver'].map(pace).to_numpy(dtype=float)
+    elapsed = stops['next_time_s'].to_numpy() - stops['previous_time_s'].to_numpy()
+    return stops.assign(
+        loss=elapsed - 2 * driver_pace,
+        pit_lane=stops['next_pit_out_s'].to_numpy() - stops['pit_in_s'].to_numpy(),
+    )
+
+def gap_traces(frame):
+    """Driver x lap matrix of the gap to the leader at the end of each lap, in seconds"""
+    leader = frame.groupby('lap')['time_s'].transform('min')
+    gaps = (frame['time_s'] - leader).groupby([frame['driver'], frame['lap']]).first().unstack('lap')
+    # One column per lap, even for laps no driver has a time for
+    return gaps.reindex(columns=range(int(gaps.columns.min()), int(gaps.columns.max()) + 1))
+
+def analyse_laps(laps):
+    """Lap and stint analytics of one session's laps DataFrame as a compact dict"""
+    frame = prepare_laps(laps)
+    if frame.empty:
+        return None
+
+    clean = clean_lap_mask(frame)
+    clean_laps = frame['lap_s'].where(clean).groupby(frame['driver'])
+    pace = clean_laps.median()
+    stints = stint_summary(frame, clean)
+    stops = pit_stops(frame, pace)
+    gaps = gap_traces(frame)
+
+    drivers = frame.groupby('driver', sort=False).agg(
+        driver_number=('driver_number', 'first'),
+        team=('team', 'first'),
+        laps=('lap', 'max'),
+        finish_s=('time_s', 'last'),
+        best=('lap_s', 'min'),
+    )
+    drivers['pace'] = pace
+    drivers['clean_laps'] = clean_laps.count()
+    # Running order at the flag: most laps first, then who completed them earliest
+    drivers = drivers.sort_values(['laps', 'finish_s'], ascending=[False, True], na_position='last')
+
+    stints_by_driver = {driver: group for driver, group in stints.groupby(level='driver', sort=False)}
+    stops_by_driver = {driver: group for driver, group in stops.groupby('driver', sort=False)}
+    first_lap = int(gaps.columns.min())
+
+    records = []
+    for driver, row in drivers.iterrows():
+        driver_stints = stints_by_driver.get(driver)
+        driver_stops = stops_by_driver.get(driver)
+        records.append({
+            'driver': driver,
+            'driver_number': None if row['driver_number'] != row['driver_number'] else int(row['driver_number']),
+            'team': _label(row['team']),
+            'laps': int(row['laps']),
+            'pace': _rounded([row['pace']], 3)[0],
+            'best': _rounded([row['best']], 3)[0],
+            'clean_laps': int(row['clean_laps']),
+            'stints': [] if driver_stints is None else [
+                {
+                    'stint': int(stint),
+                    'compound': _label(compound),
+                    'start_lap': int(start_lap),
+                    'end_lap': int(end_lap),
+                    'laps': int(laps),
+                    'tyre_life_start': None if tyre_life != tyre_life else int(tyre_life),
+                    'degradation': degradation
+                }
+                for (_, stint), compound, start_lap, end_lap, laps, tyre_life, degradation in zip(
+                    driver_stints.index, driver_stints['compound'], driver_stints['start_lap'],
+                    driver_stints['end_lap'], driver_stints['laps'], driver_stints['tyre_life_start'],
+                    _rounded(driver_stints['degradation'], 3))
+            ],
+            'pit_stops': [] if driver_stops is None else [
+                {'lap': int(lap), 'loss': loss, 'pit_lane': pit_lane,
+                 'from': _label(compound), 'to': _label(next_compound)}
+                for lap, loss, pit_lane, compound, next_compound in zip(
+                    driver_stops['lap'], _rounded(driver_stops['loss'], 1), _rounded(driver_stops['pit_lane'], 1),
+                    driver_stops['compound'], driver_stops['next_compound'])
+            ],
+            'gaps': _rounded(gaps.loc[driver], 1)
+        })
+
+    rated = stints[stints['degradation'].notna()].groupby('compound')['degradation']
+    compounds = [
+        {'compound': _label(compound), 'degradation': _rounded([median], 3)[0], 'stints': int(count)}
+        for (compound, median), count in zip(rated.median().items(), rated.count())
+    ]
+
+    return {
+        'laps': int(frame['lap'].max()),
+        'first_gap_lap': first_lap,
+        'compounds': compounds,
+        'drivers': records
+    }
+
+def load_laps(year, round_number, session_name, parquet_root=None):
+    """Laps of one session, from the Parquet store when it has them, else loaded with FastF1"""
+    from . import columnar
+
+    if columnar.pyarrow_available():
+        table = columnar.read_partition(columnar.KIND_LAPS, year, round_number, session_name, LAP_COLUMNS,
+                                        root=parquet_root or columnar.PARQUET_DIR)
+        # Stores exported before 'Time' was kept can't give the gap traces
+        if table is not None and 'Time' in table.column_names:
+            return table.to_pandas()
+
+    session = load_session(year, round_number, session_name, profile='laps')
+    laps = session.laps
+    return laps[[column for column in LAP_COLUMNS if column in laps.columns]]
+
+def analyse_session(year, round_number, session_name, parquet_root=None):
+    """Analytics of one session; nothing of the loaded session outlives the call"""
+    laps = load_laps(year, round_number, session_name, parquet_root)
+    try:
+        return analyse_laps(laps)
+    finally:
+        del laps
+        # FastF1 laps and sessions reference each other, so free the cycle before loading the next one
+        gc.collect()
+
+def publish_round(year, event, sessions, data_dir=public_data_dir):
+    """Merge analysed sessions into a round's analytics file and publish it; returns True if rewritten"""
+    path = Path(data_dir) / analysis_name(event['round'])
+    try:
+        with open(path, 'r') as f:
+            existing = json.load(f)
+    except (OSError, ValueError):
+        existing = {}
+    previous = existing.get('sessions', {}) if existing.get('season') == year else {}
+
+    data = {
+        'season': year,
+        'round': event['round'],
+        'event': event['name'],
+        'last_updated': datetime.now(timezone.utc).isoformat(),
+        'sessions': {**previous, **sessions}
+    }
+    return publish_json(path, data, data_dir)
+
+def publish_index(year, schedule_index, data_dir=public_data_dir):
+    """Publish laps/index.json listing the rounds with analytics"""
+    data_dir = Path(data_dir)
+    rounds = []
+    for path in sorted((data_dir / 'laps').glob('round_*.json')):
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if data.get('season') == year:
+            rounds.append({'round': data['round'], 'name': data['event'], 'sessions': sorted(data['sessions']),
+                           'file': analysis_name(data['round'])})
+    return publish_json(data_dir / 'laps' / 'index.json', {'season': year, 'rounds': rounds}, data_dir)
+
+def update_lap_analytics(schedule_index, limit=None, refresh=False, data_dir=public_data_dir, parquet_root=None):
+    """Analyse completed sprints and races not published yet, newest first, one session at a time
+
+    limit caps the sessions analysed in one call so a backlog drains over
+    several pipeline runs. Returns (analysed, failed) counts.
+    """
+    year = schedule_index.year
+    analysed = failed = 0
+    for round_number, session_name in schedule_index.completed_sessions(session_names=ANALYSIS_SESSIONS):
+        if not refresh and is_analysed(year, round_number, session_name, data_dir):
+            continue
+        if limit is not None and analysed + failed >= limit:
+            logger.info("Lap analytics limit reached, remaining sessions are analysed on the next runs")
+            break
+        start = time.perf_counter()
+        try:
+            result = analyse_session(year, round_number, session_name, parquet_root)
+        except Exception as e:
+            failed += 1
+            logger.warning(f"Could not analyse {year} round {round_number} {session_name}: {e}")
+            continue
+        if result is None:
+            failed += 1
+            logger.warning(f"No laps for {year} round {round_number} {session_name}")
+            continue
+        publish_round(year, schedule_index.get_event(round_number), {session_name: result}, data_dir)
+        analysed += 1
+        logger.info(f"⏱️ Lap analytics for {year} round {round_number} {session_name} "
+                    f"in {time.perf_counter() - start:.2f}s")
+
+    if analysed:
+        publish_index(year, schedule_index, data_dir)
+    return analysed, failed
+
+def main():
+    parser = argparse.ArgumentParser(description='Publish lap and stint analytics of completed sprints and races')
+    parser.add_argument('year', type=int, nargs='?', default=datetime.now().year)
+    parser.add_argument('--refresh', action='store_true', help='Re-analyse sessions already published')
+    parser.add_argument('--limit', type=int, help='Analyse at most this many sessions')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    from .session_loader import enable_cache
+    enable_cache('.cache')
+    public_data_dir.mkdir(parents=True, exist_ok=True)
+
+    analysed, failed = update_lap_analytics(ScheduleIndex.load(args.year, 'cache'), args.limit, args.refresh)
+    print(f"{args.year}: {analysed} sessioni analizzate, {failed} fallite")
+    return not failed
+
+if __name__ == "__main__":
+    if not main():
+        exit(1)
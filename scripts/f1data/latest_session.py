@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Optimized F1 Data Updater - FastF1 only for latest session
+Standings from reliable sources, session data from FastF1
+"""
+
+import json
+import logging
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+import time
+
+from .pipeline import setup_logging
+from .publish import publish_json, unpublish
+from .schedule_index import ScheduleIndex
+from .session_loader import enable_cache, load_session
+from .standings import SITE_TEAM
+
+logger = logging.getLogger(__name__)
+
+# Minimal FastF1 cache for latest session only
+cache_dir = Path('.cache')
+
+# Data directory setup
+public_data_dir = Path('public/data')
+
+# One page per team plus the full field, all from a single session load
+LATEST_SESSION_DIR = public_data_dir / 'latest-session'
+FULL_FIELD_NAME = 'all'
+
+LOG_FILE = 'logs/data_update_optimized.log'
+
+def init():
+    """Create the cache and data directories and enable the FastF1 cache"""
+    cache_dir.mkdir(exist_ok=True)
+    public_data_dir.mkdir(parents=True, exist_ok=True)
+    enable_cache(cache_dir)
+
+def normalize_datetime(dt):
+    """Normalize datetime to timezone-aware UTC"""
+    if dt is None:
+        return None
+    if hasattr(dt, 'tzinfo') and dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    if hasattr(dt, 'tzinfo') and dt.tzinfo is not None:
+        return dt.astimezone(timezone.utc)
+    return dt
+
+def team_slug(team_name):
+    """File name of a team's latest-session page (e.g. 'Red Bull Racing' -> 'red-bull-racing')"""
+    return re.sub(r'[^a-z0-9]+', '-', team_name.lower()).strip('-') or 'unknown'
+
+def fetch_latest_session(schedule_index=None):
+    """Fetch the latest session with FastF1 and build the pages of every team from that one load
+
+    Returns {'field': full-field page, 'teams': {team name: page}}, or None
+    when no session could be loaded.
+    """
+    try:
+        logger.info("🏁 Fetching latest session with FastF1...")
+        
+        # Get current year and find the latest completed race or qualifying
+        current_year = datetime.now().year
+        schedule_index = schedule_index or ScheduleIndex.load(current_year, cache_dir)
+        
+        # Newest first; fall back to the previous one if results aren't published yet
+        candidates = schedule_index.completed_sessions(session_names=('Race', 'Qualifying'))[:2]
+        if not candidates:
+            logger.warning("No completed sessions found")
+            return None
+        
+        session_data = None
+        event = None
+        
+        for round_number, session_type in candidates:
+            event = schedule_index.get_event(round_number)
+            try:
+                logger.info(f"Attempting to load {session_type} session for {event['name']}")
+                session = load_session(current_year, round_number, session_type, profile='results')
+                
+                if session.results is not None and len(session.results) > 0:
+                    session_data = session
+                    break
+                    
+            except Exception as e:
+                logger.warning(f"Could not load {session_type} session: {e}")
+                continue
+        
+        if not session_data:
+            logger.error("No session data available")
+            return None
+        
+        logger.info(f"Latest session: {event['name']} - {event['location']}")
+        
+        # Every team's results come out of the same extraction, so more teams cost no extra load
+        from .results_extract import extract_session_results_by_team
+        field_results, team_results = extract_session_results_by_team(session_data.results)
+        
+        # Prepare session data
+        session_info = {
+            'event': event['name'],
+            'location': event['location'],
+            'country': event['country'],
+            'round': event['round'],
+            'session_type': 'Qualifying' if session_data.session_info['Type'] == 'Qualifying' else 'Race',
+            'date': session_data.session_info['StartDate'].isoformat(),
+        }
+        total_drivers = len(session_data.results)
+        
+        pages = {
+            'field': {
+                **session_info,
+                'results': field_results,
+                'total_drivers': total_drivers,
+                'teams': [{'team_name': team, 'slug': team_slug(team)} for team in team_results]
+            },
+            'teams': {
+                team: {**session_info, 'results': results, 'total_drivers': total_drivers}
+                for team, results in team_results.items()
+            }
+        }
+        
+        logger.info(f"✅ Successfully fetched latest session: {session_info['event']} - "
+                    f"{session_info['session_type']} ({len(team_results)} teams)")
+        return pages
+        
+    except Exception as e:
+        logger.error(f"Error fetching latest session: {e}")
+        return None
+
+def get_verified_standings():
+    """Get standings from verified manual sources (already corrected)"""
+    try:
+        # Read the manually verified current season data
+        standings_file = public_data_dir / 'current-season.json'
+        if standings_file.exists():
+            with open(standings_file, 'r') as f:
+                data = json.load(f)
+                logger.info("✅ Using verified standings data")
+                return data
+        else:
+            logger.warning("No verified standings file found")
+            return None
+            
+    except Exception as e:
+        logger.error(f"Error reading verified standings: {e}")
+        return None
+
+def get_next_race():
+    """Get next race from schedule (from verified data)"""
+    try:
+        # Read the manually verified next race data
+        next_race_file = public_data_dir / 'next-race.json'
+        if next_race_file.exists():
+            with open(next_race_file, 'r') as f:
+                data = json.load(f)
+                logger.info("✅ Using verified next race data")
+                return data
+        else:
+            logger.warning("No verified next race file found")
+            return None
+            
+    except Exception as e:
+        logger.error(f"Error reading verified next race: {e}")
+        return None
+
+def publish_latest_session(pages):
+    """Publish every team's page, the full-field page and the site team's latest-session.json
+
+    Returns False when the site team has no results in the session.
+    """
+    written = publish_json(LATEST_SESSION_DIR / f'{FULL_FIELD_NAME}.json', pages['field'], public_data_dir)
+    for team, page in pages['teams'].items():
+        written += publish_json(LATEST_SESSION_DIR / f'{team_slug(team)}.json', page, public_data_dir)
+    logger.info(f"✅ Latest session pages: {written} of {len(pages['teams']) + 1} rewritten")
+    
+    # Teams no longer in the full-field page (off the grid) lose theirs
+    current = {f'{FULL_FIELD_NAME}.json'} | {f"{team['slug']}.json" for team in pages['field']['teams']}
+    for path in LATEST_SESSION_DIR.glob('*.json'):
+        if path.name not in current:
+            unpublish(path, public_data_dir)
+    
+    site_page = pages['teams'].get(SITE_TEAM)
+    if site_page is None:
+        logger.warning(f"No {SITE_TEAM} results found in latest session")
+        return False
+    
+    # The site's own page keeps its historical path
+    output_file = public_data_dir / 'latest-session.json'
+    if publish_json(output_file, site_page, public_data_dir):
+        logger.info(f"✅ Latest session data saved to {output_file}")
+    else:
+        logger.info(f"✅ Latest session data unchanged in {output_file}")
+    return True
+
+def update_latest_session(schedule_index=None):
+    """Update latest session data only"""
+    try:
+        logger.info("🔄 Updating latest session data...")
+        
+        pages = fetch_latest_session(schedule_index)
+        if pages:
+            return publish_latest_session(pages)
+        else:
+            logger.warning("❌ No latest session data to update")
+            return False
+            
+    except Exception as e:
+        logger.error(f"Error updating latest session: {e}")
+        return False
+
+def main():
+    """Main optimized update function"""
+    setup_logging(LOG_FILE)
+    init()
+    logger.info("🚀 Starting OPTIMIZED F1 data update...")
+    logger.info("📋 Strategy: FastF1 for latest session only, verified data for standings")
+    
+    start_time = time.time()
+    success_count = 0
+    total_tasks = 3
+    
+    # Task 1: Update latest session with FastF1
+    logger.info("📊 Task 1/3: Updating latest session data with FastF1...")
+    if update_latest_session():
+        success_count += 1
+        logger.info("✅ Latest session update completed")
+    else:
+        logger.warning("⚠️ Latest session update failed")
+    
+    # Task 2: Verify standings data exists
+    logger.info("📈 Task 2/3: Checking verified standings data...")
+    standings_data = get_verified_standings()
+    if standings_data:
+        success_count += 1
+        logger.info("✅ Verified standings data available")
+    else:
+        logger.warning("⚠️ No verified standings data found")
+    
+    # Task 3: Verify next race data exists  
+    logger.info("🏁 Task 3/3: Checking verified next race data...")
+    next_race_data = get_next_race()
+    if next_race_data:
+        success_count += 1
+        logger.info("✅ Verified next race data available")
+    else:
+        logger.warning("⚠️ No verified next race data found")
+    
+    # Summary
+    elapsed_time = time.time() - start_time
+    logger.info(f"🏆 Update completed in {elapsed_time:.2f} seconds")
+    logger.info(f"📊 Success rate: {success_count}/{total_tasks} tasks completed")
+    
+    if success_count == total_tasks:
+        logger.info("🎉 All data sources are ready!")
+        return True
+    else:
+        logger.warning(f"⚠️ {total_tasks - success_count} tasks failed")
+        return False
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        if success:
+            logger.info("✅ Optimized update script completed successfully")
+        else:
+            logger.error("❌ Optimized update script completed with errors")
+    except KeyboardInterrupt:
+        logger.info("🛑 Update cancelled by user")
+    except Exception as e:
+        logger.error(f"💥 Critical error in update script: {e}")
\ No newline at end of file
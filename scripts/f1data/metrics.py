@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Update Run Metrics
+Process-wide counters and timed spans, exported after each run as JSON and a Prometheus textfile
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+METRICS_JSON = 'logs/update_metrics.json'
+# Point this at the node_exporter textfile collector directory in production
+METRICS_TEXTFILE = os.environ.get('F1_METRICS_TEXTFILE', 'logs/update_metrics.prom')
+
+PROMETHEUS_PREFIX = 'f1_update'
+
+_lock = threading.Lock()
+_counters = {}
+_timings = {}
+_run_started = time.time()
+
+def _key(name, labels):
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+def reset():
+    """Start a new run: clear every counter and timing"""
+    global _run_started
+    with _lock:
+        _counters.clear()
+        _timings.clear()
+        _run_started = time.time()
+
+def increment(name, value=1, **labels):
+    """Add to a counter, e.g. increment('cache_hits', cache='session')"""
+    with _lock:
+        key = _key(name, labels)
+        _counters[key] = _counters.get(key, 0) + value
+
+def observe(name, seconds, **labels):
+    """Record one duration for a span name"""
+    with _lock:
+        key = _key(name, labels)
+        timing = _timings.setdefault(key, {'count': 0, 'sum': 0.0, 'max': 0.0})
+        timing['count'] += 1
+        timing['sum'] += seconds
+        timing['max'] = max(timing['max'], seconds)
+
+def merge(data):
+    """Add a snapshot recorded elsewhere (e.g. in a worker process) to this run's counters and timings"""
+    with _lock:
+        for counter in data['counters']:
+            key = _key(counter['name'], counter['labels'])
+            _counters[key] = _counters.get(key, 0) + counter['value']
+        for span_data in data['spans']:
+            key = _key(span_data['name'], span_data['labels'])
+            timing = _timings.setdefault(key, {'count': 0, 'sum': 0.0, 'max': 0.0})
+            timing['count'] += span_data['count']
+            timing['sum'] += span_data['sum']
+            timing['max'] = max(timing['max'], span_data['max'])
+
+@contextmanager
+def span(name, **labels):
+    """Time a block of work under a span name"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+def snapshot():
+    """Counters and timings recorded so far in this run"""
+    with _lock:
+        return {
+            'run_started': _run_started,
+            'run_seconds': time.time() - _run_started,
+            'counters': [{'name': name, 'labels': dict(labels), 'value': value}
+                         for (name, labels), value in sorted(_counters.items())],
+            'spans': [{'name': name, 'labels': dict(labels), **timing}
+                      for (name, labels), timing in sorted(_timings.items())]
+        }
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _prometheus_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in sorted(labels.items())) + '}'
+
+def to_prometheus(data, extra_gauges=None):
+    """Render a snapshot in the Prometheus text exposition format"""
+    # Samples of one metric family must be contiguous, under a single TYPE line
+    families = {}
+
+    def metric(name, kind, labels, value):
+        full = f'{PROMETHEUS_PREFIX}_{name}'
+        families.setdefault(full, [f'# TYPE {full} {kind}']).append(f'{full}{_prometheus_labels(labels)} {value}')
+
+    for counter in data['counters']:
+        metric(f"{counter['name']}_total", 'counter', counter['labels'], counter['value'])
+    for timing in data['spans']:
+        metric(f"{timing['name']}_seconds_sum", 'gauge', timing['labels'], f"{timing['sum']:.6f}")
+        metric(f"{timing['name']}_seconds_count", 'gauge', timing['labels'], timing['count'])
+        metric(f"{timing['name']}_seconds_max", 'gauge', timing['labels'], f"{timing['max']:.6f}")
+    metric('run_seconds', 'gauge', {}, f"{data['run_seconds']:.6f}")
+    metric('last_run_timestamp_seconds', 'gauge', {}, f"{data['run_started']:.0f}")
+    for name, value in (extra_gauges or {}).items():
+        metric(name, 'gauge', {}, value)
+    return '\n'.join(line for lines in families.values() for line in lines) + '\n'
+
+def write_metrics(json_path=METRICS_JSON, textfile_path=METRICS_TEXTFILE, **extra_gauges):
+    """Write the run's metrics as JSON and as a Prometheus textfile
+
+    extra_gauges are run-level values such as success=1.
+    """
+    # Imported here since cache_manager itself reports evictions through this module
+    from .cache_manager import atomic_write_text
+
+    data = snapshot()
+    data.update(extra_gauges)
+    try:
+        for path in (json_path, textfile_path):
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(json_path, json.dumps(data, indent=2))
+        # The textfile collector may read at any moment, so it is replaced atomically too
+        atomic_write_text(textfile_path, to_prometheus(data, extra_gauges))
+    except OSError as e:
+        logger.error(f"Could not write metrics: {e}")
+    return data
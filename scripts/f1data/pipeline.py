@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+In-Process Update Pipeline
+Runs the data update stages in one process with shared schedule, cache and logging
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import metrics
+from .cache_manager import DEFAULT_RETRY_BUDGET, TTL_CURVES, start_retry_budget
+from .run_state import write_state
+
+logger = logging.getLogger(__name__)
+
+STATUS_OK = 'ok'
+STATUS_FAILED = 'failed'
+STATUS_TIMEOUT = 'timeout'
+STATUS_SKIPPED = 'skipped'
+
+class Stage:
+    """A named unit of pipeline work with dependencies and a timeout"""
+
+    def __init__(self, name, func, depends_on=(), after=(), timeout=300, critical=True):
+        self.name = name
+        self.func = func
+        # depends_on stages must succeed; after stages only need to have finished, if they run at all
+        self.depends_on = tuple(depends_on)
+        self.after = tuple(after)
+        self.timeout = timeout
+        self.critical = critical
+
+def setup_logging(log_file='logs/update_pipeline.log'):
+    """Configure logging once for every stage"""
+    Path(log_file).parent.mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
+def _start_stage(stage, context):
+    """Run a stage function on a daemon thread, returning a Future of its result
+
+    Stages share the in-memory cache and schedule, so they run as threads; a
+    daemon thread doesn't keep the interpreter alive, so a stage abandoned
+    after its timeout (e.g. a hung FastF1 load) dies with the process instead
+    of blocking its exit the way ThreadPoolExecutor workers do.
+    """
+    future = Future()
+    future.set_running_or_notify_cancel()
+
+    def run():
+        try:
+            future.set_result(stage.func(context))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=f'stage-{stage.name}', daemon=True).start()
+    return future
+
+def run_pipeline(stages, context=None, max_workers=4, retry_budget=DEFAULT_RETRY_BUDGET, write_metrics=True):
+    """Run stages respecting dependencies, independent ones concurrently
+
+    Each stage function receives the shared context dict and its return value
+    is stored under context[stage.name]. Returning False or raising marks the
+    stage failed; stages depending on it are skipped. `after` only orders
+    stages, so names missing from a partial stage list are ignored. A stage
+    that times out keeps running on its abandoned thread, so stages
+    depending on it or ordered after it are skipped. All stages share one
+    retry budget of retry_budget seconds. Stage timings and the counters
+    recorded during the run are exported through metrics.write_metrics().
+    """
+    context = {} if context is None else context
+    start_retry_budget(retry_budget)
+    metrics.reset()
+    stages = {stage.name: stage for stage in stages}
+    for stage in stages.values():
+        unknown = set(stage.depends_on) - set(stages)
+        if unknown:
+            raise ValueError(f"Stage {stage.name} depends on unknown stages: {sorted(unknown)}")
+
+    status = {}
+    timings = {}
+    running = {}
+    started = {}
+
+    while len(status) < len(stages):
+        # Skip stages whose dependencies didn't succeed, start the ready ones
+        for name, stage in stages.items():
+            if name in status or name in running.values():
+                continue
+            dep_status = [status.get(dep) for dep in stage.depends_on]
+            if any(s not in (None, STATUS_OK) for s in dep_status):
+                status[name] = STATUS_SKIPPED
+                logger.warning(f"⏭️ Stage {name} skipped (dependency not completed)")
+            elif any(status.get(a) == STATUS_TIMEOUT for a in stage.after):
+                # A timed-out stage's thread may still be writing, so nothing ordered after it starts
+                status[name] = STATUS_SKIPPED
+                logger.warning(f"⏭️ Stage {name} skipped (a stage it runs after timed out)")
+            elif (all(s == STATUS_OK for s in dep_status)
+                  and all(a in status for a in stage.after if a in stages)
+                  and len(running) < max_workers):
+                logger.info(f"▶️ Stage {name} started")
+                future = _start_stage(stage, context)
+                started[future] = time.monotonic()
+                running[future] = name
+
+        if not running:
+            continue
+
+        # Wake up on the first completion or the nearest stage deadline
+        now = time.monotonic()
+        next_deadline = min(started[f] + stages[n].timeout for f, n in running.items())
+        done, _ = wait(running, timeout=max(0, next_deadline - now), return_when=FIRST_COMPLETED)
+
+        for future in done:
+            name = running.pop(future)
+            timings[name] = time.monotonic() - started[future]
+            try:
+                result = future.result()
+                context[name] = result
+                status[name] = STATUS_FAILED if result is False else STATUS_OK
+            except Exception as e:
+                logger.error(f"Stage {name} raised: {e}")
+                status[name] = STATUS_FAILED
+            logger.info(f"{'✅' if status[name] == STATUS_OK else '❌'} Stage {name} {status[name]} in {timings[name]:.2f}s")
+
+        now = time.monotonic()
+        for future, name in list(running.items()):
+            if now - started[future] >= stages[name].timeout:
+                # The daemon thread is abandoned (it ends with the process); dependents and stages
+                # ordered after it are skipped
+                running.pop(future)
+                timings[name] = now - started[future]
+                status[name] = STATUS_TIMEOUT
+                logger.error(f"⏱️ Stage {name} timed out after {stages[name].timeout}s")
+
+    success = all(status[name] == STATUS_OK for name, stage in stages.items() if stage.critical)
+
+    for name, elapsed in timings.items():
+        metrics.observe('stage', elapsed, stage=name, status=status[name])
+    if write_metrics:
+        metrics.write_metrics(success=int(success))
+    return {'success': success, 'status': status, 'timings': timings, 'context': context}
+
+# Sessions exported to the Parquet store per run; older backlog drains over the following runs
+COLUMNAR_EXPORT_LIMIT = 3
+# Sessions analysed per run by the lap analytics stage, for the same reason
+LAP_ANALYTICS_LIMIT = 3
+
+def build_update_stages(year=None, standings=True, cleanup=True, columnar=True, lap_analytics=True):
+    """Declare the site update stages
+
+    A full run (standings included) ends with a 'state' stage writing the
+    run state file that lets the next run exit early when nothing is due.
+    Without a year the season is resolved on every run, from
+    context['season'] or the current UTC year, so stages kept by a
+    long-running daemon move on to the new season at New Year.
+    """
+
+    # One cache setup for all stages; fastf1 and pandas are imported by the first stage needing them
+    from . import latest_session as updater
+    from .schedule_index import ScheduleIndex
+    from .session_loader import get_cache
+    updater.init()
+    cache = get_cache()
+
+    def load_schedule(context):
+        season = year or context.get('season') or datetime.now(timezone.utc).year
+        schedule_index = ScheduleIndex.load(season, 'cache')
+        cache.set_schedule(schedule_index)
+        return schedule_index
+
+    def latest_session(context):
+        if not updater.update_latest_session(context['schedule']):
+            return False
+        latest = context['schedule'].latest_completed_session(session_names=TTL_CURVES['session']['sessions'])
+        if latest:
+            event = context['schedule'].get_event(latest[0])
+            cache.mark_session_updated(event['name'], latest[1])
+            cache.flush()
+        return True
+
+    def verified_data(context):
+        return bool(updater.get_verified_standings()) and bool(updater.get_next_race())
+
+    stages = [
+        Stage('schedule', load_schedule, timeout=120),
+        Stage('latest_session', latest_session, depends_on=['schedule'], timeout=300, critical=False),
+        Stage('verified_data', verified_data, timeout=30, critical=False),
+    ]
+
+    if standings:
+        from . import standings as standings_module
+        standings_module.init()
+
+        def calculate_standings(context):
+            standings_module.update_standings(context['schedule'].year, schedule_index=context['schedule'])
+            cache.mark_standings_updated()
+            cache.flush()
+            return True
+
+        stages.append(Stage('standings', calculate_standings, depends_on=['schedule'], timeout=300))
+
+    if columnar:
+        from . import columnar as columnar_store
+        if columnar_store.pyarrow_available():
+            def export_columnar(context):
+                columnar_store.export_pending(context['schedule'], limit=COLUMNAR_EXPORT_LIMIT)
+                return True
+
+            # Loads laps into the FastF1 cache, so it waits for the stages reading it
+            after = ['latest_session', 'standings'] if standings else ['latest_session']
+            stages.append(Stage('columnar', export_columnar, depends_on=['schedule'], after=after,
+                                timeout=300, critical=False))
+        else:
+            logger.info("pyarrow not installed, Parquet export skipped")
+
+    if lap_analytics:
+        from .lap_analytics import update_lap_analytics
+
+        def analyse_laps(context):
+            update_lap_analytics(context['schedule'], limit=LAP_ANALYTICS_LIMIT)
+            return True
+
+        # Reads laps from the Parquet store when the columnar stage has just exported them
+        after = [stage.name for stage in stages if stage.name in ('latest_session', 'standings', 'columnar')]
+        stages.append(Stage('lap_analytics', analyse_laps, depends_on=['schedule'], after=after,
+                            timeout=300, critical=False))
+
+    if cleanup:
+        from .cleanup import cleanup_cache
+
+        def run_cleanup(context):
+            cleanup_cache(schedule_index=context.get('schedule'))
+            return True
+
+        # Cleanup waits for the stages reading the cache whatever their outcome, and is skipped if
+        # one timed out since its thread may still be using the cache
+        after = [stage.name for stage in stages
+                 if stage.name in ('latest_session', 'standings', 'columnar', 'lap_analytics')]
+        stages.append(Stage('cleanup', run_cleanup, after=after, timeout=30, critical=False))
+
+    if standings:
+        critical = [stage.name for stage in stages if stage.critical]
+
+        def record_state(context):
+            # Failed or skipped stages leave no (or a False) result in the context
+            success = all(context.get(name) not in (None, False) for name in critical)
+            now = datetime.now(timezone.utc)
+            season = context['schedule'].year if context.get('schedule') else year
+            write_state(cache.next_update_due(now) if success else now, success=success, year=season)
+            return True
+
+        # Runs after every other stage; skipped when one timed out, so a half-finished run is never recorded
+        stages.append(Stage('state', record_state, after=[stage.name for stage in stages],
+                            timeout=10, critical=False))
+
+    return stages
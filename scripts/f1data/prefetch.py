@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Predictive Cache Prefetch
+Warms the FastF1 cache from the event schedule, so user-facing updates find session data already downloaded
+"""
+
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+
+from .schedule_index import ScheduleIndex
+
+logger = logging.getLogger(__name__)
+
+# Start warming the cache this long before an event's first session
+PREFETCH_LEAD = timedelta(hours=24)
+# Give the timing feed a moment after the scheduled end before loading
+PREFETCH_GRACE = timedelta(minutes=10)
+# Stop trying to prefetch a session this long after it ended
+PREFETCH_WINDOW = timedelta(hours=6)
+
+# Sessions the updates read (latest session and standings)
+PREFETCH_SESSIONS = ('Qualifying', 'Sprint', 'Race')
+
+KIND_SCHEDULE = 'schedule'
+KIND_PREVIOUS_ROUND = 'previous_round'
+KIND_FINISHED_SESSION = 'finished_session'
+
+def _task(kind, year, round_number, session_name):
+    return {
+        'key': f'{year}/{round_number}/{session_name}',
+        'kind': kind,
+        'year': year,
+        'round': round_number,
+        'session': session_name
+    }
+
+def next_weekend_start(schedule_index, now=None):
+    """(round, first session start) of the next event that hasn't started, or None"""
+    now = now or datetime.now(timezone.utc)
+    for round_number in sorted(schedule_index.events):
+        window = schedule_index.event_window(round_number)
+        if window and window[0] > now:
+            return round_number, window[0]
+    return None
+
+def plan_prefetch(schedule_index, cache, now=None):
+    """Prefetch tasks due right now that the cache metadata doesn't record as done
+
+    Before a weekend: refresh the schedule and the previous round's sessions.
+    After a session: its results, once the grace period has passed.
+    """
+    now = now or datetime.now(timezone.utc)
+    year = schedule_index.year
+    tasks = []
+
+    upcoming = next_weekend_start(schedule_index, now)
+    if upcoming and upcoming[1] - PREFETCH_LEAD <= now:
+        round_number = upcoming[0]
+        tasks.append(_task(KIND_SCHEDULE, year, round_number, 'schedule'))
+        previous = [r for r in schedule_index.events if r < round_number]
+        if previous:
+            for session_name in PREFETCH_SESSIONS:
+                if schedule_index.has_session(max(previous), session_name):
+                    tasks.append(_task(KIND_PREVIOUS_ROUND, year, max(previous), session_name))
+
+    for round_number, session_name in schedule_index.completed_sessions(now, PREFETCH_SESSIONS):
+        since_end = now - schedule_index.session_end(round_number, session_name)
+        if since_end > PREFETCH_WINDOW:
+            break
+        if since_end >= PREFETCH_GRACE:
+            tasks.append(_task(KIND_FINISHED_SESSION, year, round_number, session_name))
+
+    return [task for task in tasks if cache.needs_prefetch(task['key'], now)]
+
+def next_prefetch_time(schedule_index, now=None):
+    """When the next prefetch becomes due, or None if the season has no more events"""
+    now = now or datetime.now(timezone.utc)
+    candidates = []
+
+    upcoming = next_weekend_start(schedule_index, now)
+    if upcoming and upcoming[1] - PREFETCH_LEAD > now:
+        candidates.append(upcoming[1] - PREFETCH_LEAD)
+
+    session = schedule_index.next_session(now, PREFETCH_SESSIONS)
+    if session:
+        candidates.append(schedule_index.session_end(session[0], session[1]) + PREFETCH_GRACE)
+
+    return min(candidates) if candidates else None
+
+class Prefetcher:
+    """Runs prefetch tasks on a background thread and records them in F1DataCache metadata"""
+
+    def __init__(self, cache, schedule_dir='cache'):
+        self.cache = cache
+        self.schedule_dir = schedule_dir
+        # One worker: prefetches must not compete with the updates for bandwidth
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+        self.in_flight = {}
+
+    def run(self, schedule_index, now=None, kinds=None, wait_for=False):
+        """Start every due prefetch task (optionally only some kinds); returns the submitted tasks"""
+        self.in_flight = {key: f for key, f in self.in_flight.items() if not f.done()}
+
+        tasks = [task for task in plan_prefetch(schedule_index, self.cache, now)
+                 if (kinds is None or task['kind'] in kinds) and task['key'] not in self.in_flight]
+        for task in tasks:
+            logger.info(f"📥 Prefetching {task['key']} ({task['kind']})")
+            self.in_flight[task['key']] = self.executor.submit(self._execute, task)
+
+        if wait_for:
+            wait(list(self.in_flight.values()))
+        return tasks
+
+    def _execute(self, task):
+        """Load one task into the FastF1 cache and record the outcome"""
+        ok = True
+        try:
+            if task['kind'] == KIND_SCHEDULE:
+                ScheduleIndex.load(task['year'], self.schedule_dir, max_age=timedelta(0))
+            else:
+                from .session_loader import load_session
+                load_session(task['year'], task['round'], task['session'], profile='results')
+            logger.info(f"✅ Prefetched {task['key']}")
+        except Exception as e:
+            ok = False
+            logger.warning(f"Prefetch of {task['key']} failed: {e}")
+
+        self.cache.mark_prefetched(task['key'], ok)
+        self.cache.flush()
+        return ok
+
+    def shutdown(self, wait_for=True):
+        """Stop the background worker"""
+        self.executor.shutdown(wait=wait_for, cancel_futures=not wait_for)
+
+def main():
+    parser = argparse.ArgumentParser(description='Warm the FastF1 cache ahead of the site updates')
+    parser.add_argument('--year', type=int, default=datetime.now(timezone.utc).year)
+    args = parser.parse_args()
+
+    from .pipeline import setup_logging
+    from .session_loader import enable_cache, get_cache
+
+    setup_logging('logs/prefetch.log')
+    # Same FastF1 cache directory as the update pipeline
+    enable_cache('.cache')
+    cache = get_cache()
+
+    schedule_index = ScheduleIndex.load(args.year, 'cache')
+    cache.set_schedule(schedule_index)
+
+    prefetcher = Prefetcher(cache)
+    tasks = prefetcher.run(schedule_index, wait_for=True)
+    prefetcher.shutdown()
+
+    if not tasks:
+        upcoming = next_prefetch_time(schedule_index)
+        logger.info(f"Nothing to prefetch; next prefetch due at {upcoming.isoformat() if upcoming else 'end of season'}")
+
+if __name__ == "__main__":
+    main()
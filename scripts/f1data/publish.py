@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Content-addressed publishing of public/data
+Files are only rewritten when their data changes, so unchanged runs leave the tree (and the deploy) alone
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import metrics
+from .cache_manager import atomic_write_bytes, atomic_write_text, file_lock
+
+try:
+    import brotli
+except ImportError:  # .br siblings are skipped without the brotli package
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+
+# Minified unless a caller asks otherwise
+DEFAULT_DUMP_OPTIONS = {'separators': (',', ':'), 'ensure_ascii': False, 'default': str}
+
+# Keys that change on every run without the data changing
+VOLATILE_KEYS = frozenset({'last_updated', 'archived_date'})
+
+def _strip_volatile(data):
+    """Copy of data without volatile keys, at any depth"""
+    if isinstance(data, dict):
+        return {k: _strip_volatile(v) for k, v in data.items() if k not in VOLATILE_KEYS}
+    if isinstance(data, list):
+        return [_strip_volatile(v) for v in data]
+    return data
+
+def content_hash(data):
+    """Stable hash of the data content, ignoring key order and volatile timestamps"""
+    canonical = json.dumps(_strip_volatile(data), sort_keys=True, separators=(',', ':'),
+                           ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def load_manifest(data_dir='public/data'):
+    """Read the publish manifest, empty if missing or unreadable"""
+    try:
+        with open(Path(data_dir) / MANIFEST_NAME, 'r') as f:
+            manifest = json.load(f)
+        if isinstance(manifest, dict):
+            manifest.setdefault('files', {})
+            return manifest
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return {'revision': None, 'files': {}}
+
+def manifest_revision(data_dir='public/data'):
+    """Revision of the published data; only changes when some file's content does"""
+    return load_manifest(data_dir).get('revision')
+
+def _revision(files):
+    """Combined hash of every published file's content hash"""
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        digest.update(f"{name}:{files[name]['hash']}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def _compressed_siblings(path):
+    """Precompressed variants written next to a published file"""
+    siblings = [path.with_name(path.name + '.gz')]
+    if brotli:
+        siblings.append(path.with_name(path.name + '.br'))
+    return siblings
+
+def _write_compressed(path, payload):
+    """Write .gz (and .br when available) siblings of a published file"""
+    # mtime=0 keeps the gzip bytes identical for identical content
+    atomic_write_bytes(path.with_name(path.name + '.gz'), gzip.compress(payload, compresslevel=9, mtime=0))
+    if brotli:
+        atomic_write_bytes(path.with_name(path.name + '.br'), brotli.compress(payload, quality=11))
+
+def publish_json(path, data, data_dir='public/data', compress=True, **dump_options):
+    """Write data to path only if its content differs from what is published
+
+    Output is minified JSON with precompressed siblings unless dump_options or
+    compress say otherwise. Returns True when the file was (re)written, False
+    when it was already up to date. The manifest records each file's content
+    hash and an ETag of the bytes on disk.
+    """
+    data_dir = Path(data_dir)
+    path = Path(path)
+    name = path.resolve().relative_to(data_dir.resolve()).as_posix()
+    new_hash = content_hash(data)
+
+    dump_options = {**DEFAULT_DUMP_OPTIONS, **dump_options}
+    if dump_options.get('indent') is not None:
+        dump_options.pop('separators')
+
+    # Stages publish concurrently; the lock keeps manifest updates from overwriting each other
+    with file_lock(data_dir / f'.{MANIFEST_NAME}.lock'):
+        manifest = load_manifest(data_dir)
+        entry = manifest['files'].get(name)
+        on_disk = path.exists() and (not compress or all(p.exists() for p in _compressed_siblings(path)))
+        if entry and entry.get('hash') == new_hash and on_disk:
+            logger.info(f"⏭️ {name} unchanged, not rewritten")
+            metrics.increment('published_files', status='unchanged')
+            return False
+
+        with metrics.span('publish_write'):
+            payload = json.dumps(data, **dump_options).encode('utf-8')
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(path, payload)
+            if compress:
+                _write_compressed(path, payload)
+        metrics.increment('published_files', status='written')
+        metrics.increment('published_bytes', len(payload))
+
+        manifest['files'][name] = {
+            'hash': new_hash,
+            'etag': '"' + hashlib.sha256(payload).hexdigest()[:32] + '"',
+            'size': len(payload),
+            'published': datetime.now(timezone.utc).isoformat()
+        }
+        manifest['revision'] = _revision(manifest['files'])
+        atomic_write_text(data_dir / MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True))
+
+    logger.info(f"📝 Published {name}")
+    return True
+
+def unpublish(path, data_dir='public/data'):
+    """Delete a published file, its precompressed siblings and its manifest entry
+
+    Returns True when anything was removed.
+    """
+    data_dir = Path(data_dir)
+    path = Path(path)
+    name = path.resolve().relative_to(data_dir.resolve()).as_posix()
+
+    with file_lock(data_dir / f'.{MANIFEST_NAME}.lock'):
+        removed = False
+        # Both siblings, whether or not brotli is installed now
+        for file in (path, path.with_name(path.name + '.gz'), path.with_name(path.name + '.br')):
+            if file.exists():
+                file.unlink()
+                removed = True
+        manifest = load_manifest(data_dir)
+        if manifest['files'].pop(name, None) is not None:
+            manifest['revision'] = _revision(manifest['files'])
+            atomic_write_text(data_dir / MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True))
+            removed = True
+
+    if removed:
+        logger.info(f"🗑️ Removed {name}")
+    return removed
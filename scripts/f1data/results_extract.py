@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Columnar Results Extraction
+Converts FastF1 results DataFrames to output records with vectorized operations
+"""
+
+import numpy as np
+import pandas as pd
+
+NS_PER_MS = 1_000_000
+MS_PER_MINUTE = 60_000
+
+QUALIFYING_COLUMNS = ('Q1', 'Q2', 'Q3')
+
+def lap_time_components(values):
+    """Split a column of timedeltas into (minutes, seconds, milliseconds, missing) integer arrays"""
+    values = np.asarray(values)
+    if values.dtype.kind != 'm':
+        values = pd.to_timedelta(pd.Series(values, dtype=object), errors='coerce').to_numpy()
+
+    # Work on integer nanoseconds so no float rounding creeps into the milliseconds
+    td = values.astype('timedelta64[ns]')
+    missing = np.isnat(td)
+    ms = np.where(missing, 0, td.view('i8') // NS_PER_MS)
+    return ms // MS_PER_MINUTE, (ms // 1000) % 60, ms % 1000, missing
+
+def format_lap_times(values):
+    """Format a column of timedeltas to F1 style strings (e.g. '1:26.296'), None where missing"""
+    minutes, seconds, millis, missing = lap_time_components(values)
+    return [
+        None if m else f"{mins}:{secs:02d}.{ms:03d}"
+        for mins, secs, ms, m in zip(minutes.tolist(), seconds.tolist(), millis.tolist(), missing.tolist())
+    ]
+
+def format_f1_time(time_obj):
+    """Format a single time object to F1 style (e.g., '1:26.296'); columns go through format_lap_times"""
+    try:
+        td = pd.Timedelta(time_obj)
+    except (TypeError, ValueError):
+        return None
+    if pd.isna(td):
+        return None
+    ms = td.value // NS_PER_MS
+    return f"{ms // MS_PER_MINUTE}:{(ms // 1000) % 60:02d}.{ms % 1000:03d}"
+
+def _int_column(results, column, default):
+    """Integer column as a list, missing values replaced by default (None allowed)"""
+    if column not in results:
+        return [default] * len(results)
+    values = results[column].to_numpy()
+    if values.dtype.kind not in 'iuf':
+        values = pd.to_numeric(results[column], errors='coerce').to_numpy(dtype=float)
+    values = values.astype(float)
+    missing = np.isnan(values)
+    ints = np.where(missing, 0, values).astype(np.int64).tolist()
+    if not missing.any():
+        return ints
+    return [default if m else v for v, m in zip(ints, missing.tolist())]
+
+def _points_column(results):
+    """Points column as a list: integers when whole, fractional points (half-points races) kept"""
+    if 'Points' not in results:
+        return [0] * len(results)
+    values = pd.to_numeric(results['Points'], errors='coerce').to_numpy(dtype=float)
+    values = np.where(np.isnan(values), 0, values)
+    whole = values == np.floor(values)
+    if whole.all():
+        return values.astype(np.int64).tolist()
+    return [int(v) if w else v for v, w in zip(values.tolist(), whole.tolist())]
+
+def _str_column(results, column, default):
+    """String column as a list, missing values replaced by default"""
+    if column not in results:
+        return [default] * len(results)
+    values = results[column].to_numpy(dtype=object)
+    missing = pd.isna(values)
+    if not missing.any():
+        return [str(v) for v in values.tolist()]
+    return [default if m else str(v) for v, m in zip(values.tolist(), missing.tolist())]
+
+def _time_column(results, column):
+    """Formatted lap time column as a list, None where missing"""
+    if column not in results:
+        return [None] * len(results)
+    return format_lap_times(results[column].to_numpy())
+
+def _records(columns):
+    """Zip named columns into a list of dicts"""
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+def extract_standings_results(results):
+    """Convert a session results DataFrame to standings records"""
+    if results is None or len(results) == 0:
+        return []
+
+    return _records({
+        'driver_number': _int_column(results, 'DriverNumber', 0),
+        'full_name': _str_column(results, 'FullName', 'Unknown'),
+        'team_name': _str_column(results, 'TeamName', 'Unknown'),
+        'position': _int_column(results, 'Position', None),
+        'points': _points_column(results),
+        'status': _str_column(results, 'Status', 'Unknown'),
+    })
+
+def extract_session_results(results):
+    """Convert a session results DataFrame to latest-session records, with Q1-Q3 when available"""
+    if results is None or len(results) == 0:
+        return []
+
+    columns = {
+        'driver_number': _int_column(results, 'DriverNumber', 0),
+        'name': _str_column(results, 'FullName', 'Unknown'),
+        'position': _int_column(results, 'Position', None),
+        'time': _time_column(results, 'Time'),
+        'status': _str_column(results, 'Status', ''),
+        'points': _points_column(results),
+    }
+    quali_columns = [c for c in QUALIFYING_COLUMNS if c in results]
+    for column in quali_columns:
+        columns[column.lower()] = _time_column(results, column)
+
+    records = _records(columns)
+    if not quali_columns:
+        return records
+
+    # Only keep qualifying keys for drivers that set a time in that segment
+    quali_keys = {c.lower() for c in quali_columns}
+    return [
+        {k: v for k, v in record.items() if v is not None or k not in quali_keys}
+        for record in records
+    ]
+
+def extract_session_results_by_team(results):
+    """Latest-session records for the whole field plus the same records grouped by team, in one pass
+
+    Returns (field, teams): field records carry a team_name key, teams maps
+    each team name to its drivers' records (without it) in finishing order.
+    """
+    if results is None or len(results) == 0:
+        return [], {}
+
+    records = extract_session_results(results)
+    team_names = _str_column(results, 'TeamName', 'Unknown')
+    field = []
+    teams = {}
+    for record, team_name in zip(records, team_names):
+        field.append({**record, 'team_name': team_name})
+        teams.setdefault(team_name, []).append(record)
+    return field, teams
+
+def extract_standings_batch(frames):
+    """Extract standings records for many sessions in one columnar pass
+
+    frames maps any key (e.g. (round, session)) to a results DataFrame; the
+    records come back under the same keys.
+    """
+    keys = [key for key, results in frames.items() if results is not None and len(results) > 0]
+    extracted = {key: [] for key in frames}
+    if not keys:
+        return extracted
+
+    records = extract_standings_results(pd.concat([frames[key] for key in keys], ignore_index=True))
+    offset = 0
+    for key in keys:
+        size = len(frames[key])
+        extracted[key] = records[offset:offset + size]
+        offset += size
+    return extracted
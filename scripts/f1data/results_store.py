@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Local Results Store
+SQLite table of every extracted result row, keyed by season, round, session and driver, that standings and exports query
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+RESULTS_DB = Path('cache/results.sqlite')
+
+SESSION_KEYS = (('Race', 'race_results'), ('Sprint', 'sprint_results'))
+
+RESULT_FIELDS = ('driver_number', 'full_name', 'team_name', 'position', 'points', 'status')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    season INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    name TEXT,
+    location TEXT,
+    date TEXT,
+    status TEXT,
+    source TEXT,
+    fetched_at TEXT,
+    PRIMARY KEY (season, round)
+);
+CREATE TABLE IF NOT EXISTS results (
+    season INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    session TEXT NOT NULL,
+    driver_number INTEGER NOT NULL,
+    full_name TEXT,
+    team_name TEXT,
+    position INTEGER,
+    points REAL NOT NULL DEFAULT 0,
+    status TEXT,
+    PRIMARY KEY (season, round, session, driver_number)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_by_driver ON results (driver_number, season, round);
+CREATE INDEX IF NOT EXISTS results_by_team ON results (season, team_name);
+CREATE INDEX IF NOT EXISTS results_by_finish ON results (season, session, position);
+"""
+
+# Name and team come from each group's most recent session (the sprint follows the race in a round)
+_LATEST_ORDER = "round DESC, session = 'Sprint' DESC"
+
+def _whole(expr):
+    """SQL for a points value as an integer when whole, so half points (e.g. Spa 2021) stay fractional"""
+    return f'CASE WHEN {expr} = CAST({expr} AS INTEGER) THEN CAST({expr} AS INTEGER) ELSE {expr} END'
+
+def _round_filter(rounds):
+    """SQL fragment and parameters restricting a query to the given rounds (None means all)"""
+    if rounds is None:
+        return '', []
+    rounds = [int(r) for r in rounds]
+    return f" AND round IN ({','.join('?' * len(rounds))})", rounds
+
+class ResultsStore:
+    def __init__(self, path=RESULTS_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        # Readers (site exports) never block the writer checkpointing rounds
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def commit(self):
+        self.conn.commit()
+
+    def query(self, sql, params=()):
+        """Run a read query, returning rows as dicts"""
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    # Writing
+
+    def upsert_round(self, season, entry):
+        """Replace a round and its result rows with a ledger-style entry (commit separately)"""
+        season, round_number = int(season), int(entry['round'])
+        self.conn.execute(
+            'INSERT OR REPLACE INTO rounds VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (season, round_number, entry.get('name'), entry.get('location'), entry.get('date'),
+             entry.get('status'), entry.get('source'), entry.get('fetched_at')))
+        self.conn.execute('DELETE FROM results WHERE season = ? AND round = ?', (season, round_number))
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(season, round_number, session, *(result.get(field) for field in RESULT_FIELDS))
+             for session, key in SESSION_KEYS
+             for result in entry.get(key) or []])
+
+    # Reading rounds back
+
+    def round_entries(self, season, rounds=None):
+        """Ledger-style round entries with their race and sprint results, in round order"""
+        where, params = _round_filter(rounds)
+        entries = {
+            row['round']: {**row, 'race_results': [], 'sprint_results': []}
+            for row in self.query(f'SELECT round, name, location, date, status, source, fetched_at '
+                                  f'FROM rounds WHERE season = ?{where} ORDER BY round', [season, *params])
+        }
+        fields = ', '.join(f"{_whole(field)} AS {field}" if field == 'points' else field for field in RESULT_FIELDS)
+        rows = self.query(f"SELECT round, session, {fields} FROM results "
+                          f"WHERE season = ?{where} ORDER BY round, session, position IS NULL, position, "
+                          f"driver_number", [season, *params])
+        keys = dict(SESSION_KEYS)
+        for row in rows:
+            entry = entries.get(row.pop('round'))
+            if entry is not None:
+                entry[keys[row.pop('session')]].append(row)
+        return list(entries.values())
+
+    def seasons(self):
+        """Seasons with at least one stored round"""
+        return [row['season'] for row in self.query('SELECT DISTINCT season FROM rounds ORDER BY season')]
+
+    # Standings
+
+    def _points_by_round(self, season, key, where, params):
+        """Cumulative points after each scored round of the season, per group"""
+        cumulative = {}
+        for row in self.query(f"""
+            WITH season_results AS (
+                SELECT * FROM results WHERE season = ?{where}
+            ),
+            scored_rounds AS (
+                SELECT DISTINCT round FROM season_results
+            ),
+            groups AS (
+                SELECT DISTINCT {key} AS grp FROM season_results
+            ),
+            round_points AS (
+                SELECT {key} AS grp, round, SUM(points) AS points
+                FROM season_results
+                GROUP BY {key}, round
+            ),
+            running AS (
+                SELECT g.grp, r.round,
+                       SUM(COALESCE(p.points, 0)) OVER (PARTITION BY g.grp ORDER BY r.round) AS points
+                FROM groups g CROSS JOIN scored_rounds r
+                LEFT JOIN round_points p ON p.grp IS g.grp AND p.round = r.round
+            )
+            SELECT grp, {_whole('points')} AS points FROM running ORDER BY grp, round
+        """, [season, *params]):
+            cumulative.setdefault(row['grp'], []).append(row['points'])
+        return cumulative
+
+    def _rank(self, totals, season, key, where, params):
+        """Rank the `totals` CTE by points, then full position countback, then the key; number from 1
+
+        `totals` is SQL defining one row per group with its total_points over
+        `season_results`. Each group's race finishes at every position become
+        fixed-width counts, so comparing the concatenation as text compares the
+        countback position by position.
+        """
+        ranked = self.query(f"""
+            WITH season_results AS (
+                SELECT * FROM results WHERE season = ?{where}
+            ),
+            {totals},
+            finishes AS (
+                SELECT DISTINCT position FROM season_results
+                WHERE session = 'Race' AND position IS NOT NULL
+            ),
+            finish_counts AS (
+                SELECT {key} AS grp, position, COUNT(*) AS n
+                FROM season_results
+                WHERE session = 'Race' AND position IS NOT NULL
+                GROUP BY {key}, position
+            ),
+            countback AS (
+                SELECT grp, MAX(counts) AS counts FROM (
+                    SELECT t.{key} AS grp,
+                           GROUP_CONCAT(printf('%04d', COALESCE(c.n, 0)), '') OVER (
+                               PARTITION BY t.{key} ORDER BY f.position
+                               ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING) AS counts
+                    FROM totals t CROSS JOIN finishes f
+                    LEFT JOIN finish_counts c ON c.grp = t.{key} AND c.position = f.position
+                ) GROUP BY grp
+            )
+            SELECT t.*, ROW_NUMBER() OVER (
+                       ORDER BY t.total_points DESC, COALESCE(cb.counts, '') DESC, t.{key}) AS position
+            FROM totals t LEFT JOIN countback cb ON cb.grp = t.{key}
+            ORDER BY position
+        """, [season, *params])
+        points_by_round = self._points_by_round(season, key, where, params)
+        for total in ranked:
+            total['points_by_round'] = points_by_round.get(total[key], [])
+        return ranked
+
+    def driver_standings(self, season, rounds=None):
+        """Driver standings over the given rounds, ranked with full countback"""
+        where, params = _round_filter(rounds)
+        return self._rank(f"""
+            latest AS (
+                SELECT driver_number, full_name, team_name FROM (
+                    SELECT driver_number, full_name, team_name,
+                           ROW_NUMBER() OVER (PARTITION BY driver_number ORDER BY {_LATEST_ORDER}) AS recency
+                    FROM season_results
+                ) WHERE recency = 1
+            ),
+            sums AS (
+                SELECT driver_number,
+                       {_whole('SUM(points)')} AS total_points,
+                       SUM(session = 'Race' AND position = 1) AS wins,
+                       SUM(session = 'Race' AND position <= 3) AS podiums,
+                       SUM(session = 'Race') AS races_completed
+                FROM season_results
+                GROUP BY driver_number
+            ),
+            totals AS (
+                SELECT s.driver_number, l.full_name, l.team_name,
+                       s.total_points, s.wins, s.podiums, s.races_completed
+                FROM sums s JOIN latest l USING (driver_number)
+            )""", season, 'driver_number', where, params)
+
+    def constructor_standings(self, season, rounds=None):
+        """Constructor standings over the given rounds, ranked with full countback"""
+        where, params = _round_filter(rounds)
+        return self._rank(f"""
+            totals AS (
+                SELECT team_name,
+                       {_whole('SUM(points)')} AS total_points,
+                       SUM(session = 'Race' AND position = 1) AS wins,
+                       SUM(session = 'Race' AND position <= 3) AS podiums
+                FROM season_results
+                GROUP BY team_name
+            )""", season, 'team_name', where, params)
+
+    def team_driver_points(self, season, rounds=None):
+        """{team: [drivers by points scored for the team, highest first]}"""
+        where, params = _round_filter(rounds)
+        teams = {}
+        for row in self.query(f"""
+            WITH season_results AS (
+                SELECT * FROM results WHERE season = ?{where}
+            ),
+            latest AS (
+                SELECT team_name, driver_number, full_name FROM (
+                    SELECT team_name, driver_number, full_name,
+                           ROW_NUMBER() OVER (PARTITION BY team_name, driver_number
+                                              ORDER BY {_LATEST_ORDER}) AS recency
+                    FROM season_results
+                ) WHERE recency = 1
+            ),
+            totals AS (
+                SELECT team_name, driver_number, {_whole('SUM(points)')} AS points
+                FROM season_results
+                GROUP BY team_name, driver_number
+            )
+            SELECT t.team_name, t.driver_number, l.full_name, t.points
+            FROM totals t JOIN latest l USING (team_name, driver_number)
+            ORDER BY t.team_name, t.points DESC, t.driver_number
+        """, [season, *params]):
+            teams.setdefault(row.pop('team_name'), []).append(row)
+        return teams
+
+    # Driver lookups
+
+    def driver_career(self, driver_number):
+        """Per-season totals and career totals of a driver"""
+        seasons = self.query(f"""
+            SELECT season,
+                   {_whole('SUM(points)')} AS points,
+                   SUM(session = 'Race' AND position = 1) AS wins,
+                   SUM(session = 'Race' AND position <= 3) AS podiums,
+                   SUM(session = 'Race') AS races,
+                   MIN(CASE WHEN session = 'Race' THEN position END) AS best_finish,
+                   GROUP_CONCAT(DISTINCT team_name) AS teams
+            FROM results WHERE driver_number = ?
+            GROUP BY season ORDER BY season
+        """, (int(driver_number),))
+        for season in seasons:
+            season['teams'] = season['teams'].split(',') if season['teams'] else []
+        career = {
+            'points': sum(s['points'] for s in seasons),
+            'wins': sum(s['wins'] for s in seasons),
+            'podiums': sum(s['podiums'] for s in seasons),
+            'races': sum(s['races'] for s in seasons),
+            'best_finish': min((s['best_finish'] for s in seasons if s['best_finish']), default=None)
+        }
+        return {'driver_number': int(driver_number), 'seasons': seasons, 'career': career}
+
+    def head_to_head(self, driver_a, driver_b, season=None, session='Race'):
+        """Who finished ahead in the sessions both drivers took part in (a season, or every season)"""
+        season_filter = ' AND a.season = ?' if season is not None else ''
+        rows = self.query(f"""
+            SELECT a.season, a.round, a.position AS position_a, b.position AS position_b,
+                   {_whole('a.points')} AS points_a, {_whole('b.points')} AS points_b
+            FROM results a
+            JOIN results b ON b.season = a.season AND b.round = a.round AND b.session = a.session
+            WHERE a.driver_number = ? AND b.driver_number = ? AND a.session = ?{season_filter}
+            ORDER BY a.season, a.round
+        """, [int(driver_a), int(driver_b), session, *([season] if season is not None else [])])
+
+        # An unclassified finish counts as behind any classified one
+        def ahead(mine, theirs):
+            return mine is not None and (theirs is None or mine < theirs)
+
+        return {
+            'drivers': [int(driver_a), int(driver_b)],
+            'season': season,
+            'session': session,
+            'meetings': len(rows),
+            'ahead': [sum(ahead(r['position_a'], r['position_b']) for r in rows),
+                      sum(ahead(r['position_b'], r['position_a']) for r in rows)],
+            'points': [sum(r['points_a'] for r in rows), sum(r['points_b'] for r in rows)],
+            'rounds': rows
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the local results store (no FastF1 calls)')
+    parser.add_argument('--db', default=str(RESULTS_DB), help=f'Results database (default: {RESULTS_DB})')
+    commands = parser.add_subparsers(dest='command', required=True)
+    drivers = commands.add_parser('drivers', help='Driver standings of a season')
+    drivers.add_argument('season', type=int)
+    constructors = commands.add_parser('constructors', help='Constructor standings of a season')
+    constructors.add_argument('season', type=int)
+    career = commands.add_parser('career', help='Career stats of a driver, by season')
+    career.add_argument('driver_number', type=int)
+    h2h = commands.add_parser('h2h', help='Head-to-head of two drivers')
+    h2h.add_argument('driver_a', type=int)
+    h2h.add_argument('driver_b', type=int)
+    h2h.add_argument('--season', type=int, help='Limit to one season (default: every season)')
+    h2h.add_argument('--session', choices=['Race', 'Sprint'], default='Race')
+    args = parser.parse_args()
+
+    with ResultsStore(args.db) as store:
+        if args.command == 'drivers':
+            result = store.driver_standings(args.season)
+        elif args.command == 'constructors':
+            result = store.constructor_standings(args.season)
+        elif args.command == 'career':
+            result = store.driver_career(args.driver_number)
+        else:
+            result = store.head_to_head(args.driver_a, args.driver_b, args.season, args.session)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Update Run State
+A tiny file recording when the next update can possibly be due, so a run with nothing to do exits before any heavy import
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = Path('cache/update-state.json')
+
+# The schedule may move sessions, so never trust a state older than the schedule index refresh
+MAX_STATE_AGE = timedelta(days=1)
+
+def read_state(path=STATE_FILE):
+    """Last written run state, or {} when missing or unreadable"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_state(next_check, path=STATE_FILE, **info):
+    """Record when the next run has work to do, plus any extra info about this run"""
+    # Imported here so the fast path only pays for json and datetime
+    from .cache_manager import atomic_write_json
+
+    now = datetime.now(timezone.utc)
+    next_check = min(next_check, now + MAX_STATE_AGE)
+    state = {'written': now.isoformat(), 'next_check': next_check.isoformat(), **info}
+    Path(path).parent.mkdir(exist_ok=True)
+    atomic_write_json(path, state)
+    logger.info(f"Next update due at {state['next_check']}")
+    return state
+
+def nothing_to_do(now=None, path=STATE_FILE):
+    """Check the state file: True only if the last run succeeded and nothing is due before its next_check"""
+    state = read_state(path)
+    if not state.get('success') or not state.get('next_check'):
+        return False
+    try:
+        next_check = datetime.fromisoformat(state['next_check'])
+    except ValueError:
+        return False
+    return (now or datetime.now(timezone.utc)) < next_check
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Cached F1 Schedule Index
+Persists a compact, sorted view of the event schedule with per-session UTC times and event formats
+"""
+
+import json
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import logging
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# Schedule is refetched at most once per day
+SCHEDULE_MAX_AGE = timedelta(days=1)
+
+# Approximate session lengths, used to decide when a session has ended
+SESSION_DURATIONS = {
+    'Practice 1': timedelta(hours=1),
+    'Practice 2': timedelta(hours=1),
+    'Practice 3': timedelta(hours=1),
+    'Sprint Qualifying': timedelta(minutes=45),
+    'Sprint Shootout': timedelta(minutes=45),
+    'Sprint': timedelta(hours=1),
+    'Qualifying': timedelta(hours=1),
+    'Race': timedelta(hours=2),
+}
+DEFAULT_SESSION_DURATION = timedelta(hours=1)
+
+# EventFormat of sprint weekends: 'sprint' (2021-22), 'sprint_shootout' (2023), 'sprint_qualifying' (2024-)
+SPRINT_FORMATS = ('sprint', 'sprint_shootout', 'sprint_qualifying')
+# The sprint race is 'Sprint', except in 2021 when FastF1 names it 'Sprint Qualifying'
+SPRINT_SESSION_NAMES = ('Sprint', 'Sprint Qualifying')
+
+class ScheduleIndex:
+    def __init__(self, year, events):
+        self.year = year
+        self.events = {event['round']: event for event in events}
+
+        # Flat session list sorted by start time for bisect lookups
+        sessions = []
+        for event in events:
+            for session in event['sessions']:
+                sessions.append((session['start'], session['end'], event['round'], session['name']))
+        sessions.sort()
+        self._sessions = sessions
+        self._starts = [s[0] for s in sessions]
+
+        # Sessions sorted by end time, for "completed" lookups
+        self._by_end = sorted(sessions, key=lambda s: s[1])
+        self._ends = [s[1] for s in self._by_end]
+
+        # Sprint race of each sprint weekend, under the session name its season uses
+        self._sprint_sessions = {}
+        for event in events:
+            names = {s['name'] for s in event['sessions']}
+            if event.get('format') in SPRINT_FORMATS or 'Sprint' in names:
+                name = next((n for n in SPRINT_SESSION_NAMES if n in names), None)
+                if name:
+                    self._sprint_sessions[event['round']] = name
+
+    @classmethod
+    def load(cls, year, cache_dir='cache', max_age=SCHEDULE_MAX_AGE):
+        """Load the index from disk, rebuilding from FastF1 when missing or stale"""
+        index_file = Path(cache_dir) / f'schedule-index-{year}.json'
+        if index_file.exists():
+            try:
+                with open(index_file, 'r') as f:
+                    data = json.load(f)
+                fetched_at = datetime.fromisoformat(data['fetched_at'])
+                if datetime.now(timezone.utc) - fetched_at < max_age:
+                    metrics.increment('cache_hits', cache='schedule')
+                    return cls(year, data['events'])
+            except Exception as e:
+                logger.warning(f"Could not load schedule index: {e}")
+
+        metrics.increment('cache_misses', cache='schedule')
+        with metrics.span('schedule_fetch'):
+            index = cls.build(year)
+        index.save(index_file)
+        return index
+
+    @classmethod
+    def build(cls, year):
+        """Build the index from the FastF1 event schedule"""
+        import fastf1
+        import pandas as pd
+
+        schedule = fastf1.get_event_schedule(year, include_testing=False)
+        events = []
+        for event in schedule.to_dict('records'):
+            sessions = []
+            for n in range(1, 6):
+                name = event.get(f'Session{n}')
+                start = event.get(f'Session{n}DateUtc')
+                if not name or pd.isna(start):
+                    continue
+                start = pd.Timestamp(start)
+                start = start.tz_localize('UTC') if start.tzinfo is None else start.tz_convert('UTC')
+                start = start.to_pydatetime()
+                end = start + SESSION_DURATIONS.get(name, DEFAULT_SESSION_DURATION)
+                local = event.get(f'Session{n}Date')
+                sessions.append({
+                    'name': name,
+                    'start': start.timestamp(),
+                    'end': end.timestamp(),
+                    'local_date': str(local) if local is not None and not pd.isna(local) else None
+                })
+            events.append({
+                'round': int(event['RoundNumber']),
+                'name': event['EventName'],
+                'location': event['Location'],
+                'country': event['Country'],
+                'format': event.get('EventFormat', 'conventional'),
+                'sessions': sessions
+            })
+
+        logger.info(f"Built schedule index for {year}: {len(events)} events")
+        return cls(year, events)
+
+    def save(self, index_file):
+        """Save the index to disk"""
+        try:
+            index_file = Path(index_file)
+            index_file.parent.mkdir(exist_ok=True)
+            with open(index_file, 'w') as f:
+                json.dump({
+                    'season': self.year,
+                    'fetched_at': datetime.now(timezone.utc).isoformat(),
+                    'events': [self.events[r] for r in sorted(self.events)]
+                }, f, separators=(',', ':'))
+        except Exception as e:
+            logger.error(f"Could not save schedule index: {e}")
+
+    def get_event(self, round_number):
+        """Get event info for a round"""
+        return self.events.get(int(round_number))
+
+    def get_session(self, round_number, session_name):
+        """Get a session entry for a round, or None if the event has no such session"""
+        event = self.get_event(round_number)
+        if not event:
+            return None
+        for session in event['sessions']:
+            if session['name'] == session_name:
+                return session
+        return None
+
+    def has_session(self, round_number, session_name):
+        """Check if a round includes the given session"""
+        return self.get_session(round_number, session_name) is not None
+
+    def event_window(self, round_number):
+        """(first session start, last session end) of a round as UTC datetimes, or None"""
+        event = self.get_event(round_number)
+        if not event or not event['sessions']:
+            return None
+        start = min(s['start'] for s in event['sessions'])
+        end = max(s['end'] for s in event['sessions'])
+        return datetime.fromtimestamp(start, timezone.utc), datetime.fromtimestamp(end, timezone.utc)
+
+    def session_end(self, round_number, session_name):
+        """Scheduled end of a session as a UTC datetime, or None"""
+        session = self.get_session(round_number, session_name)
+        return datetime.fromtimestamp(session['end'], timezone.utc) if session else None
+
+    def sprint_rounds(self):
+        """Rounds held in sprint format"""
+        return sorted(self._sprint_sessions)
+
+    def sprint_sessions(self):
+        """{round: session name of its sprint race} for the rounds held in sprint format"""
+        return dict(self._sprint_sessions)
+
+    def completed_sessions(self, now=None, session_names=None):
+        """Sessions that have ended, most recent first, as (round, session_name) pairs"""
+        now = _to_timestamp(now)
+        cutoff = bisect_right(self._ends, now)
+        completed = []
+        for _, _, round_number, name in reversed(self._by_end[:cutoff]):
+            if session_names is None or name in session_names:
+                completed.append((round_number, name))
+        return completed
+
+    def latest_completed_session(self, now=None, session_names=None):
+        """Most recently ended session as (round, session_name), or None"""
+        now = _to_timestamp(now)
+        i = bisect_right(self._ends, now)
+        while i > 0:
+            i -= 1
+            _, _, round_number, name = self._by_end[i]
+            if session_names is None or name in session_names:
+                return round_number, name
+        return None
+
+    def next_session(self, now=None, session_names=None):
+        """Next session to start as (round, session_name, start datetime), or None"""
+        now = _to_timestamp(now)
+        i = bisect_left(self._starts, now)
+        while i < len(self._sessions):
+            start, _, round_number, name = self._sessions[i]
+            if session_names is None or name in session_names:
+                return round_number, name, datetime.fromtimestamp(start, timezone.utc)
+            i += 1
+        return None
+
+    def next_session_end(self, now=None, session_names=None):
+        """End of the next session to finish (including one under way) as a UTC datetime, or None"""
+        now = _to_timestamp(now)
+        for _, end, _, name in self._by_end[bisect_right(self._ends, now):]:
+            if session_names is None or name in session_names:
+                return datetime.fromtimestamp(end, timezone.utc)
+        return None
+
+    def completed_rounds(self, now=None, session_name='Race'):
+        """Rounds whose given session has ended, in round order"""
+        return sorted(r for r, _ in self.completed_sessions(now, (session_name,)))
+
+def _to_timestamp(now):
+    """Convert an optional datetime to a UTC epoch timestamp"""
+    if now is None:
+        return time.time()
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return now.timestamp()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Shared FastF1 Session Loader
+Loads sessions through named profiles so each script only pulls the data it actually reads
+"""
+
+import logging
+from pathlib import Path
+
+from . import metrics
+from .cache_manager import DataNotAvailableError, F1DataCache, with_retry
+
+logger = logging.getLogger(__name__)
+
+# Keyword arguments for fastf1 Session.load() per profile
+LOAD_PROFILES = {
+    # Classification only: session.results and session.session_info
+    'results': {'laps': False, 'telemetry': False, 'weather': False, 'messages': False},
+    # Lap timing; race control messages are needed to flag deleted laps
+    'laps': {'laps': True, 'telemetry': False, 'weather': False, 'messages': True},
+    # Everything FastF1 can provide
+    'full': {'laps': True, 'telemetry': True, 'weather': True, 'messages': True},
+}
+
+_cache_dir = None
+_cache = None
+
+def enable_cache(cache_dir):
+    """Enable the FastF1 cache once per process; later calls reuse the first directory"""
+    global _cache_dir, _cache
+    if _cache_dir is None:
+        import fastf1
+        Path(cache_dir).mkdir(exist_ok=True)
+        fastf1.Cache.enable_cache(str(cache_dir))
+        _cache_dir = Path(cache_dir)
+        # Tracks per-entry access times for LRU eviction
+        _cache = F1DataCache(cache_dir=cache_dir, data_dir='public/data')
+    return _cache_dir
+
+def get_cache():
+    """F1DataCache for the enabled FastF1 cache directory, or None before enable_cache()"""
+    return _cache
+
+def call_in_worker(func, *args):
+    """Run func(*args) in a pool worker process, returning (result, metrics snapshot)
+
+    Worker processes exit without the parent's bookkeeping, so the cache
+    access times recorded here are flushed before returning, and the
+    counters travel back with the result for the parent's metrics.merge().
+    """
+    # A forked worker starts with a copy of the parent's counters
+    metrics.reset()
+    try:
+        return func(*args), metrics.snapshot()
+    finally:
+        if _cache is not None:
+            _cache.flush()
+
+def _entry_key(session):
+    """Cache entry key ('2025/<event>/<session>') of a session, or None"""
+    api_path = getattr(session, 'api_path', None)
+    if not api_path:
+        return None
+    entry_key = api_path.strip('/')
+    if entry_key.startswith('static/'):
+        entry_key = entry_key[len('static/'):]
+    return entry_key
+
+def _indexed_size(entry_key):
+    """Size of a cache entry according to the F1DataCache index, 0 if not cached"""
+    if _cache is None or entry_key is None:
+        return 0
+    return _cache.metadata.get('cached_files', {}).get(entry_key, {}).get('size', 0)
+
+def _record_access(session):
+    """Record a cache access for the session's directory"""
+    entry_key = _entry_key(session)
+    if _cache is None or entry_key is None:
+        return
+    _cache.record_access(entry_key)
+
+def get_load_kwargs(profile):
+    """Get Session.load() arguments for a named profile"""
+    try:
+        return LOAD_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown load profile '{profile}', expected one of {sorted(LOAD_PROFILES)}")
+
+@with_retry(breaker='fastf1')
+def load_session(year, round_number, session_name, profile='results'):
+    """Get a FastF1 session and load it using the given profile
+
+    Network failures are retried and feed the shared 'fastf1' circuit breaker.
+    Raises DataNotAvailableError when the session has no classification yet.
+    """
+    import fastf1
+    load_kwargs = get_load_kwargs(profile)
+    session = fastf1.get_session(year, round_number, session_name)
+    entry_key = _entry_key(session)
+    size_before = _indexed_size(entry_key)
+    metrics.increment('cache_hits' if size_before else 'cache_misses', cache='session')
+
+    logger.debug(f"Loading {year} round {round_number} {session_name} with '{profile}' profile")
+    with metrics.span('session_load', session=session_name, profile=profile):
+        session.load(**load_kwargs)
+    _record_access(session)
+
+    # FastF1 doesn't expose its transfers; growth of the cache entry approximates the downloaded bytes
+    downloaded = _indexed_size(entry_key) - size_before
+    if downloaded > 0:
+        metrics.increment('upstream_requests', source='fastf1')
+        metrics.increment('upstream_bytes', downloaded, source='fastf1')
+    if session.results is None or len(session.results) == 0:
+        raise DataNotAvailableError(f"No results for {year} round {round_number} {session_name}")
+    return session
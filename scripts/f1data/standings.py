@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Calculate F1 Championship Standings using FastF1
+Generates both driver and constructor standings from race results
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+import logging
+
+from . import metrics
+from .cache_manager import DataNotAvailableError, start_retry_budget
+from .publish import publish_json
+from .results_store import RESULTS_DB, ResultsStore
+from .schedule_index import ScheduleIndex
+from .session_loader import call_in_worker, enable_cache, load_session
+from .standings_ledger import SeasonLedger
+
+logger = logging.getLogger(__name__)
+
+# The team the site follows: driver profiles and archives are exported for its drivers
+SITE_TEAM = 'Ferrari'
+
+# FastF1 cache, ledger and schedule index (shared with the other stages when run from the pipeline)
+cache_dir = Path('cache')
+
+def init():
+    """Create the cache directory and enable the FastF1 cache; call before loading sessions"""
+    cache_dir.mkdir(exist_ok=True)
+    enable_cache(cache_dir)
+
+def get_completed_races(year=2025, schedule_index=None):
+    """Get list of completed races for the season"""
+    try:
+        schedule_index = schedule_index or ScheduleIndex.load(year, cache_dir)
+        
+        completed_races = []
+        for round_number in schedule_index.completed_rounds(session_name='Race'):
+            event = schedule_index.get_event(round_number)
+            completed_races.append({
+                'round': round_number,
+                'name': event['name'],
+                'location': event['location'],
+                'date': schedule_index.get_session(round_number, 'Race')['local_date']
+            })
+        
+        return completed_races
+    except Exception as e:
+        logger.error(f"Error getting schedule: {e}")
+        return []
+
+def get_race_results(year, round_number, session_name='Race'):
+    """Get race results for a specific round
+    
+    Returns [] when the race has no results and None when the upstream
+    failed, so the caller can keep what the ledger already holds.
+    """
+    from .results_extract import extract_standings_results
+    try:
+        # Try to get main race results
+        session = load_session(year, round_number, session_name, profile='results')
+        
+        return extract_standings_results(session.results)
+    except DataNotAvailableError as e:
+        logger.info(f"No race results yet for round {round_number}: {e}")
+        return []
+    except Exception as e:
+        logger.error(f"Error getting race results for round {round_number}: {e}")
+        return None
+
+def get_sprint_results(year, round_number, session_name='Sprint'):
+    """Get sprint results if available (None when the upstream failed)
+
+    session_name is the sprint race as the season's schedule names it
+    ('Sprint Qualifying' in 2021).
+    """
+    from .results_extract import extract_standings_results
+    try:
+        session = load_session(year, round_number, session_name, profile='results')
+        
+        return extract_standings_results(session.results)
+    except DataNotAvailableError:
+        logger.info(f"No sprint session for round {round_number}")
+        return []
+    except Exception as e:
+        logger.error(f"Error getting sprint results for round {round_number}: {e}")
+        return None
+
+SESSION_LOADERS = {
+    'Race': get_race_results,
+    'Sprint': get_sprint_results
+}
+
+def load_session_results(year, round_number, session_name, schedule_name=None):
+    """Load results for one (round, session) pair, schedule_name being the session's name that season"""
+    return SESSION_LOADERS[session_name](year, round_number, schedule_name or session_name)
+
+def fetch_rounds(year, round_numbers, sprint_rounds=(), workers=1, executor='process', source='fastf1'):
+    """Load race and sprint results for several rounds, in parallel when workers > 1
+    
+    sprint_rounds maps the rounds holding a sprint to its session name, as
+    ScheduleIndex.sprint_sessions() does; a plain set of rounds means 'Sprint'.
+    With source='jolpica' the results come from the Ergast-compatible API
+    through the async bulk fetcher instead of FastF1 session loads.
+    """
+    if source == 'jolpica':
+        from .async_fetch import fetch_rounds_bulk
+        return fetch_rounds_bulk(year, round_numbers, sprint_rounds)
+    
+    # Sprint sessions are only requested for rounds that actually hold one
+    sprint_names = sprint_rounds if isinstance(sprint_rounds, dict) else {}
+    tasks = [(round_number, session_name)
+             for round_number in round_numbers
+             for session_name in SESSION_LOADERS
+             if session_name != 'Sprint' or round_number in sprint_rounds]
+    schedule_names = {task: sprint_names.get(task[0]) if task[1] == 'Sprint' else None for task in tasks}
+    
+    if workers <= 1 or len(tasks) <= 1:
+        results = {task: load_session_results(year, *task, schedule_names[task]) for task in tasks}
+    else:
+        logger.info(f"Loading {len(tasks)} sessions with {workers} {executor} workers")
+        if executor == 'process':
+            # Worker processes set up their own FastF1 cache, flush it and send their metrics back
+            with ProcessPoolExecutor(max_workers=workers, initializer=init) as pool:
+                futures = {task: pool.submit(call_in_worker, load_session_results, year, *task,
+                                             schedule_names[task])
+                           for task in tasks}
+                results = {}
+                for task, future in futures.items():
+                    results[task], worker_metrics = future.result()
+                    metrics.merge(worker_metrics)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {task: pool.submit(load_session_results, year, *task, schedule_names[task])
+                           for task in tasks}
+                results = {task: future.result() for task, future in futures.items()}
+    
+    # Merge back in round order so output doesn't depend on completion order
+    return {
+        round_number: (results[(round_number, 'Race')], results.get((round_number, 'Sprint'), []))
+        for round_number in round_numbers
+    }
+
+def calculate_driver_standings(year=2025, refresh=False, workers=1, executor='process', schedule_index=None,
+                               source='fastf1'):
+    """Calculate driver championship standings"""
+    logger.info(f"Calculating driver standings for {year}")
+    
+    schedule_index = schedule_index or ScheduleIndex.load(year, cache_dir)
+    completed_races = get_completed_races(year, schedule_index)
+    logger.info(f"Found {len(completed_races)} completed races")
+    
+    # Only fetch rounds the ledger doesn't hold as final
+    ledger = SeasonLedger(year)
+    pending = [race for race in completed_races
+               if refresh or ledger.needs_fetch(race['round'], source)]
+    metrics.increment('cache_hits', len(completed_races) - len(pending), cache='ledger')
+    metrics.increment('cache_misses', len(pending), cache='ledger')
+    
+    fetched = fetch_rounds(year, [race['round'] for race in pending],
+                           sprint_rounds=schedule_index.sprint_sessions(),
+                           workers=workers, executor=executor, source=source)
+    for race in pending:
+        logger.info(f"Processing {race['name']} (Round {race['round']})")
+        race_results, sprint_results = fetched[race['round']]
+        if race_results is None or sprint_results is None:
+            logger.warning(f"Upstream failed for round {race['round']}, keeping cached results")
+            continue
+        status = ledger.record_round(race, race_results, sprint_results, source=source)
+        logger.info(f"Round {race['round']} stored as {status}")
+    
+    ledger.save()
+    
+    return driver_standings_from_ledger(ledger, completed_races)
+
+def driver_standings_from_ledger(ledger, completed_races):
+    """Driver standings over the given completed races, queried from the ledger's results store"""
+    year = ledger.year
+    rounds = [race['round'] for race in completed_races]
+    race_details = [
+        {
+            'round': entry['round'],
+            'name': entry['name'],
+            'location': entry['location'],
+            'date': entry['date'],
+            'race_results': entry['race_results'],
+            'sprint_results': entry['sprint_results']
+        }
+        for entry in ledger.rounds(rounds)
+    ]
+    
+    # Points from every session count, ties broken by full position countback
+    standings = [
+        {
+            'driver_number': int(driver['driver_number']),
+            'full_name': driver['full_name'],
+            'team_name': driver['team_name'],
+            'total_points': driver['total_points'],
+            'wins': int(driver['wins']),
+            'podiums': int(driver['podiums']),
+            'races_completed': int(driver['races_completed']),
+            'points_by_round': driver['points_by_round'],
+            'position': driver['position']
+        }
+        for driver in ledger.store.driver_standings(year, rounds)
+    ]
+    
+    return {
+        'season': year,
+        'last_updated': datetime.now(timezone.utc).isoformat(),
+        'completed_races': len(completed_races),
+        'standings': standings,
+        'race_details': race_details
+    }
+
+def calculate_constructor_standings(driver_standings_data, store=None):
+    """Calculate constructor championship standings over the rounds in driver data"""
+    logger.info("Calculating constructor standings")
+    
+    year = driver_standings_data['season']
+    rounds = [race['round'] for race in driver_standings_data['race_details']]
+    store = store or ResultsStore(cache_dir / RESULTS_DB.name)
+    team_drivers = store.team_driver_points(year, rounds)
+    standings = [
+        {
+            'team_name': team['team_name'],
+            'total_points': team['total_points'],
+            'wins': int(team['wins']),
+            'podiums': int(team['podiums']),
+            'drivers': [
+                {
+                    'driver_number': int(driver['driver_number']),
+                    'full_name': driver['full_name'],
+                    'points': driver['points']
+                }
+                for driver in team_drivers.get(team['team_name'], [])
+            ],
+            'points_by_round': team['points_by_round'],
+            'position': team['position']
+        }
+        for team in store.constructor_standings(year, rounds)
+    ]
+    
+    return {
+        'season': year,
+        'last_updated': driver_standings_data['last_updated'],
+        'completed_races': driver_standings_data['completed_races'],
+        'standings': standings
+    }
+
+def race_shard_name(round_number):
+    """Path of a round's shard, relative to the data directory"""
+    return f'races/round_{round_number:02d}.json'
+
+def save_standings(driver_standings, constructor_standings, output_dir=Path('public/data')):
+    """Publish standings plus one shard per round, skipping unchanged files
+    
+    The full classification of every round lives in races/round_XX.json,
+    listed by races/index.json, so the standings files stay a few KB.
+    Returns the number of files actually rewritten.
+    """
+    output_dir.mkdir(exist_ok=True)
+    year = driver_standings['season']
+    race_details = driver_standings['race_details']
+    
+    written = 0
+    for race in race_details:
+        written += publish_json(output_dir / race_shard_name(race['round']), {'season': year, **race}, output_dir)
+    
+    race_index = {
+        'season': year,
+        'last_updated': driver_standings['last_updated'],
+        'rounds': [
+            {
+                'round': race['round'],
+                'name': race['name'],
+                'location': race['location'],
+                'date': race['date'],
+                'file': race_shard_name(race['round'])
+            }
+            for race in race_details
+        ]
+    }
+    written += publish_json(output_dir / 'races' / 'index.json', race_index, output_dir)
+    
+    summary = {key: value for key, value in driver_standings.items() if key != 'race_details'}
+    summary['race_index'] = 'races/index.json'
+    written += publish_json(output_dir / f'driver-standings-{year}.json', summary, output_dir)
+    written += publish_json(output_dir / f'constructor-standings-{year}.json', constructor_standings, output_dir)
+    return written
+
+def driver_profile(driver, driver_standings, store):
+    """Profile of one driver: current season, career by season and head-to-head with teammates"""
+    year = driver_standings['season']
+    teammates = [other['driver_number'] for other in driver_standings['standings']
+                 if other['team_name'] == driver['team_name'] and other['driver_number'] != driver['driver_number']]
+    career = store.driver_career(driver['driver_number'])
+    return {
+        'driver_number': driver['driver_number'],
+        'name': driver['full_name'],
+        'team': driver['team_name'],
+        'last_updated': driver_standings['last_updated'],
+        'current_season': {
+            'season': year,
+            'points': driver['total_points'],
+            'position': driver['position'],
+            'wins': driver['wins'],
+            'podiums': driver['podiums'],
+            'races_completed': driver['races_completed']
+        },
+        'career': career['career'],
+        'seasons': career['seasons'],
+        'head_to_head': [
+            {key: value for key, value in store.head_to_head(driver['driver_number'], teammate, year).items()
+             if key != 'rounds'}
+            for teammate in teammates
+        ]
+    }
+
+def save_driver_profiles(driver_standings, store=None, output_dir=Path('public/data'), team=SITE_TEAM):
+    """Publish drivers/driver_XX.json for the team's drivers; returns the number of files rewritten"""
+    store = store or ResultsStore(cache_dir / RESULTS_DB.name)
+    written = 0
+    for driver in driver_standings['standings']:
+        if driver['team_name'] == team:
+            profile = driver_profile(driver, driver_standings, store)
+            written += publish_json(output_dir / 'drivers' / f"driver_{driver['driver_number']}.json",
+                                    profile, output_dir)
+    return written
+
+def update_standings(year=2025, schedule_index=None, **options):
+    """Calculate and save driver and constructor standings, plus the team's driver profiles"""
+    driver_standings = calculate_driver_standings(year, schedule_index=schedule_index, **options)
+    constructor_standings = calculate_constructor_standings(driver_standings)
+    save_standings(driver_standings, constructor_standings)
+    save_driver_profiles(driver_standings)
+    return driver_standings, constructor_standings
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description='Calculate F1 championship standings')
+    parser.add_argument('--year', type=int, default=datetime.now(timezone.utc).year,
+                        help='Season to calculate (default: current year)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of parallel session loaders (default: 1, sequential)')
+    parser.add_argument('--executor', choices=['process', 'thread'], default='process',
+                        help='Pool type used when --workers > 1')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Reload every completed round, ignoring the ledger')
+    parser.add_argument('--source', choices=['fastf1', 'jolpica'], default='fastf1',
+                        help='Results source; jolpica fetches all rounds concurrently over HTTP')
+    return parser.parse_args()
+
+def main():
+    """Main function to calculate and display standings"""
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+    init()
+    start_retry_budget()
+    try:
+        # Calculate and save driver and constructor standings
+        driver_standings, constructor_standings = update_standings(
+            args.year, refresh=args.refresh, workers=args.workers, executor=args.executor, source=args.source)
+        
+        # Print results
+        print("\n" + "="*60)
+        print(f"🏆 CLASSIFICA PILOTI {args.year}")
+        print("="*60)
+        print(f"Gare completate: {driver_standings['completed_races']}")
+        print(f"Ultimo aggiornamento: {driver_standings['last_updated']}")
+        print("-"*60)
+        
+        for driver in driver_standings['standings']:
+            print(f"{driver['position']:2d}. {driver['full_name']:<25} {driver['team_name']:<15} {driver['total_points']:>4} pts (W:{driver['wins']}, P:{driver['podiums']})")
+        
+        print("\n" + "="*60)
+        print(f"🏆 CLASSIFICA COSTRUTTORI {args.year}")
+        print("="*60)
+        print(f"Gare completate: {constructor_standings['completed_races']}")
+        print("-"*60)
+        
+        for constructor in constructor_standings['standings']:
+            print(f"{constructor['position']:2d}. {constructor['team_name']:<25} {constructor['total_points']:>4} pts (W:{constructor['wins']}, P:{constructor['podiums']})")
+        
+        print(f"\n✅ Standings saved to public/data/")
+        
+    except Exception as e:
+        logger.error(f"Error calculating standings: {e}")
+        return False
+    
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    if not success:
+        exit(1)
\ No newline at end of file
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Season Results Ledger
+Tracks per-round race and sprint results so standings runs only fetch new or provisional rounds
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import logging
+
+from .results_store import RESULTS_DB, ResultsStore
+
+logger = logging.getLogger(__name__)
+
+# Results can still change (penalties, appeals) shortly after the chequered flag
+FINALIZE_AFTER = timedelta(hours=48)
+
+STATUS_PROVISIONAL = 'provisional'
+STATUS_FINAL = 'final'
+
+class SeasonLedger:
+    """Per-round results of one season, kept in the shared SQLite results store"""
+
+    def __init__(self, year, ledger_dir='cache', store=None):
+        self.year = year
+        self.ledger_dir = Path(ledger_dir)
+        self.ledger_dir.mkdir(exist_ok=True)
+        self.store = store or ResultsStore(self.ledger_dir / RESULTS_DB.name)
+        self._rounds = {entry['round']: entry for entry in self.store.round_entries(year)}
+        if not self._rounds:
+            self._migrate_json()
+        self._dirty = False
+
+    def _migrate_json(self):
+        """Import the JSON ledger written before the results store existed"""
+        ledger_file = self.ledger_dir / f'standings-ledger-{self.year}.json'
+        if not ledger_file.exists():
+            return
+        try:
+            with open(ledger_file, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load standings ledger: {e}")
+            return
+        if data.get('season') != self.year:
+            logger.warning(f"Ledger season mismatch in {ledger_file}, starting fresh")
+            return
+        for entry in data.get('rounds', {}).values():
+            self.store.upsert_round(self.year, entry)
+            self._rounds[int(entry['round'])] = entry
+        self.store.commit()
+        logger.info(f"Imported {len(self._rounds)} rounds from {ledger_file.name} into the results store")
+
+    def save(self):
+        """Commit recorded rounds to the results store if anything changed"""
+        if not self._dirty:
+            return
+        try:
+            self.store.commit()
+            self._dirty = False
+        except Exception as e:
+            logger.error(f"Could not save standings ledger: {e}")
+
+    def get_round(self, round_number):
+        """Get stored entry for a round, or None"""
+        return self._rounds.get(int(round_number))
+
+    def needs_fetch(self, round_number, source=None):
+        """Check if a round is missing, still provisional or stored from another source"""
+        entry = self.get_round(round_number)
+        if entry is None or entry.get('status') != STATUS_FINAL:
+            return True
+        # Team names differ between sources, so rounds from another source are refetched
+        return source is not None and (entry.get('source') or 'fastf1') != source
+
+    def record_round(self, race, race_results, sprint_results, now=None, source='fastf1'):
+        """Store results for a round, marking it final once results have settled"""
+        now = now or datetime.now(timezone.utc)
+        status = STATUS_PROVISIONAL
+
+        race_date = _parse_date(race['date'])
+        if race_results and race_date and now - race_date > FINALIZE_AFTER:
+            status = STATUS_FINAL
+
+        entry = {
+            'round': int(race['round']),
+            'name': race['name'],
+            'location': race['location'],
+            'date': str(race['date']),
+            'status': status,
+            'source': source,
+            'fetched_at': now.isoformat(),
+            'race_results': race_results,
+            'sprint_results': sprint_results
+        }
+        self.store.upsert_round(self.year, entry)
+        self._rounds[entry['round']] = entry
+        self._dirty = True
+        return status
+
+    def rounds(self, round_numbers=None):
+        """Get stored rounds in round order, optionally limited to the given round numbers"""
+        entries = self._rounds.values()
+        if round_numbers is not None:
+            wanted = {int(r) for r in round_numbers}
+            entries = [e for e in entries if e['round'] in wanted]
+        return sorted(entries, key=lambda e: e['round'])
+
+def _parse_date(value):
+    """Parse a stored race date into an aware UTC datetime"""
+    if value is None:
+        return None
+    try:
+        if isinstance(value, datetime):
+            dt = value
+        else:
+            dt = datetime.fromisoformat(str(value))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+Predictive Cache Prefetch
+Warms the FastF1 cache from the event schedule; the code lives in f1data.prefetch
+"""
+
+import runpy
+
+if __name__ == "__main__":
+    runpy.run_module('f1data.prefetch', run_name='__main__')
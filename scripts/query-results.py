@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Results Store Queries
+Standings, career stats and head-to-head from cache/results.sqlite; the code lives in f1data.results_store
+
+    python3 scripts/query-results.py drivers 2025
+    python3 scripts/query-results.py h2h 16 44 --season 2025
+"""
+
+import runpy
+
+if __name__ == "__main__":
+    runpy.run_module('f1data.results_store', run_name='__main__')
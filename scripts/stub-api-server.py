@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Stub F1 API Server
+Serves recorded API responses locally so the async fetcher can be exercised offline
+
+Record responses with AsyncFetcher(record_dir=...), then point the scripts at the stub:
+    python3 scripts/stub-api-server.py --responses cache/recorded-api --port 8765
+    F1_API_BASE_URL=http://127.0.0.1:8765 python3 scripts/calculate-standings.py --source jolpica
+"""
+
+import argparse
+import logging
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+class RecordedResponseHandler(BaseHTTPRequestHandler):
+    """Answers GET requests with the recorded file at the request path"""
+
+    # HTTP/1.1 keeps connections alive, so pooling is exercised too
+    protocol_version = 'HTTP/1.1'
+
+    def __init__(self, *args, responses_dir, **kwargs):
+        self.responses_dir = responses_dir
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        path = (self.responses_dir / urlsplit(self.path).path.lstrip('/')).resolve()
+        if self.responses_dir not in path.parents or not path.is_file():
+            self._send(404, b'{"error": "not recorded"}')
+            return
+        self._send(200, path.read_bytes())
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+def make_server(responses_dir, host='127.0.0.1', port=0):
+    """Stub server for a directory of recorded responses; port 0 picks a free port"""
+    handler = partial(RecordedResponseHandler, responses_dir=Path(responses_dir).resolve())
+    return ThreadingHTTPServer((host, port), handler)
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve recorded F1 API responses locally')
+    parser.add_argument('--responses', required=True, help='Directory of recorded responses')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = make_server(args.responses, args.host, args.port)
+    host, port = server.server_address[:2]
+    logger.info(f"Serving {args.responses} on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
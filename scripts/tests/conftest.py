@@ -0,0 +1,18 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+@pytest.fixture
+def load_script():
+    """Import a hyphenated script from scripts/ as a module"""
+    def load(name):
+        spec = importlib.util.spec_from_file_location(name.replace('-', '_'), SCRIPTS_DIR / f'{name}.py')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    return load
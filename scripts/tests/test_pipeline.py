@@ -0,0 +1,32 @@
+import threading
+
+from f1data.pipeline import STATUS_OK, STATUS_SKIPPED, STATUS_TIMEOUT, Stage, run_pipeline
+
+def test_stages_after_a_timed_out_stage_are_skipped(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    release = threading.Event()
+    ran = []
+
+    def hung(context):
+        release.wait(5)
+        return True
+
+    def record(name):
+        def func(context):
+            ran.append(name)
+            return True
+        return func
+
+    try:
+        result = run_pipeline([
+            Stage('schedule', record('schedule')),
+            Stage('standings', hung, depends_on=['schedule'], timeout=0.2),
+            Stage('cleanup', record('cleanup'), after=['standings']),
+            Stage('state', record('state'), after=['schedule', 'standings', 'cleanup']),
+        ], write_metrics=False)
+    finally:
+        release.set()
+
+    assert result['status'] == {'schedule': STATUS_OK, 'standings': STATUS_TIMEOUT,
+                                'cleanup': STATUS_SKIPPED, 'state': STATUS_SKIPPED}
+    assert ran == ['schedule']
@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta, timezone
+
+from f1data import standings
+from f1data.schedule_index import ScheduleIndex
+
+def make_event(round_number, event_format, session_names, start=datetime(2021, 7, 16, 13, tzinfo=timezone.utc)):
+    return {
+        'round': round_number, 'name': f'Grand Prix {round_number}', 'location': '', 'country': '',
+        'format': event_format,
+        'sessions': [{'name': name, 'start': (start + timedelta(hours=n)).timestamp(),
+                      'end': (start + timedelta(hours=n + 1)).timestamp(), 'local_date': None}
+                     for n, name in enumerate(session_names)]
+    }
+
+# FastF1's 2021 schedule: the sprint race is named 'Sprint Qualifying'
+SCHEDULE_2021 = [
+    make_event(9, 'conventional', ['Practice 1', 'Practice 2', 'Practice 3', 'Qualifying', 'Race']),
+    make_event(10, 'sprint', ['Practice 1', 'Qualifying', 'Practice 2', 'Sprint Qualifying', 'Race']),
+    make_event(14, 'sprint', ['Practice 1', 'Qualifying', 'Practice 2', 'Sprint Qualifying', 'Race']),
+]
+
+def test_2021_sprint_rounds_from_event_format():
+    index = ScheduleIndex(2021, SCHEDULE_2021)
+
+    assert index.sprint_rounds() == [10, 14]
+    assert index.sprint_sessions() == {10: 'Sprint Qualifying', 14: 'Sprint Qualifying'}
+
+def test_sprint_race_named_sprint_from_2022():
+    index = ScheduleIndex(2024, [
+        make_event(5, 'sprint_qualifying', ['Practice 1', 'Sprint Qualifying', 'Sprint', 'Qualifying', 'Race']),
+        make_event(4, 'sprint_shootout', ['Practice 1', 'Qualifying', 'Sprint Shootout', 'Sprint', 'Race']),
+        make_event(3, 'conventional', ['Practice 1', 'Practice 2', 'Practice 3', 'Qualifying', 'Race']),
+    ])
+
+    assert index.sprint_sessions() == {4: 'Sprint', 5: 'Sprint'}
+
+def test_2021_sprint_loaded_under_its_schedule_name(monkeypatch):
+    loaded = []
+
+    def load_session(year, round_number, session_name, profile='results'):
+        loaded.append((round_number, session_name))
+        raise standings.DataNotAvailableError(session_name)
+
+    monkeypatch.setattr(standings, 'load_session', load_session)
+    index = ScheduleIndex(2021, SCHEDULE_2021)
+
+    standings.fetch_rounds(2021, [9, 10], sprint_rounds=index.sprint_sessions())
+
+    assert sorted(loaded) == [(9, 'Race'), (10, 'Race'), (10, 'Sprint Qualifying')]
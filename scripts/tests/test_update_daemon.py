@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+
+from f1data.pipeline import Stage
+from f1data.schedule_index import ScheduleIndex
+
+NOW = datetime(2025, 7, 6, 17, 0, tzinfo=timezone.utc)
+
+def make_schedule(year=2025, now=NOW):
+    """One conventional weekend whose race ended an hour before now"""
+    def session(name, start):
+        return {'name': name, 'start': start.timestamp(), 'end': (start + timedelta(hours=1)).timestamp(),
+                'local_date': None}
+    race_start = now - timedelta(hours=2)
+    return ScheduleIndex(year, [{
+        'round': 12, 'name': 'British Grand Prix', 'location': 'Silverstone', 'country': 'UK',
+        'format': 'conventional',
+        'sessions': [session('Qualifying', race_start - timedelta(days=1)), session('Race', race_start)]
+    }])
+
+class StubCache:
+    """Cache metadata saying latest session and standings are fresh"""
+
+    def set_schedule(self, schedule_index):
+        pass
+
+    def should_update_session_data(self, event_name, session_name, now=None):
+        return False
+
+    def should_update_standings(self, now=None):
+        return False
+
+class StubPrefetcher:
+    def run(self, *args, **kwargs):
+        pass
+
+def make_daemon(module, tmp_path, ran):
+    """Daemon with the update stages declared as build_update_stages does, without FastF1"""
+    def stage(name):
+        def func(context):
+            ran.append((name, context.get('season')) if name == 'schedule' else name)
+            return True
+        return func
+
+    daemon = module.UpdateDaemon.__new__(module.UpdateDaemon)
+    daemon.poll_interval = timedelta(minutes=3)
+    daemon.data_dir = tmp_path / 'data'
+    daemon.cache = StubCache()
+    daemon.prefetcher = StubPrefetcher()
+    daemon.stages = {s.name: s for s in [
+        Stage('schedule', stage('schedule')),
+        Stage('latest_session', stage('latest_session'), depends_on=['schedule'], critical=False),
+        Stage('standings', stage('standings'), depends_on=['schedule']),
+        Stage('lap_analytics', stage('lap_analytics'), depends_on=['schedule'],
+              after=['latest_session', 'standings'], critical=False),
+    ]}
+    return daemon
+
+def test_lap_analytics_only_due_list_runs(load_script, monkeypatch, tmp_path):
+    module = load_script('update-daemon')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(ScheduleIndex, 'load', classmethod(lambda cls, year, *args, **kwargs: make_schedule(year)))
+    ran = []
+    daemon = make_daemon(module, tmp_path, ran)
+
+    # Latest session and standings are fresh, only the race's lap analytics is missing
+    daemon.run_once(NOW)
+
+    assert ran == [('schedule', 2025), 'lap_analytics']
+
+def test_season_follows_the_clock_across_new_year(load_script, monkeypatch, tmp_path):
+    module = load_script('update-daemon')
+    monkeypatch.chdir(tmp_path)
+    loaded = []
+    polls = [datetime(2025, 12, 31, 23, 30, tzinfo=timezone.utc), datetime(2026, 1, 1, 0, 30, tzinfo=timezone.utc)]
+
+    def load(cls, year, *args, **kwargs):
+        loaded.append(year)
+        return make_schedule(year, polls[len(loaded) - 1])
+
+    monkeypatch.setattr(ScheduleIndex, 'load', classmethod(load))
+    ran = []
+    daemon = make_daemon(module, tmp_path, ran)
+
+    for now in polls:
+        daemon.run_once(now)
+
+    assert loaded == [2025, 2026]
+    assert [entry for entry in ran if entry != 'lap_analytics'] == [('schedule', 2025), ('schedule', 2026)]
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+F1 Data Update Daemon
+Stays resident with fastf1 and the schedule warm, sleeping until sessions end and polling until results appear
+"""
+
+import argparse
+import json
+import logging
+import signal
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from f1data.cache_manager import F1DataCache
+from f1data.lap_analytics import ANALYSIS_SESSIONS, is_analysed
+from f1data.pipeline import build_update_stages, run_pipeline, setup_logging
+from f1data.prefetch import KIND_PREVIOUS_ROUND, KIND_SCHEDULE, Prefetcher, next_prefetch_time
+from f1data.schedule_index import ScheduleIndex
+from f1data.session_loader import get_cache
+
+logger = logging.getLogger(__name__)
+
+# How long after a session ends we keep polling for its results
+RESULTS_WINDOW = timedelta(hours=6)
+# Wait a little after the scheduled end before the first poll
+SESSION_GRACE = timedelta(minutes=10)
+# Never sleep longer than this, so the schedule index is refreshed regularly
+MAX_SLEEP = timedelta(hours=6)
+
+STANDINGS_SESSIONS = ('Race', 'Sprint')
+
+class UpdateDaemon:
+    def __init__(self, poll_interval=timedelta(minutes=3), data_dir='public/data'):
+        self.poll_interval = poll_interval
+        self.data_dir = Path(data_dir)
+        self.stop_event = threading.Event()
+
+        # Sets up the FastF1 cache once; fastf1 and pandas stay imported for the daemon's lifetime
+        self.stages = {stage.name: stage for stage in build_update_stages(cleanup=False, columnar=False)}
+
+        # Same metadata as the FastF1 cache the stages load into
+        self.cache = get_cache() or F1DataCache(cache_dir='.cache', data_dir=data_dir)
+
+        # Warms the cache before weekends; finished sessions are loaded by the stages themselves
+        self.prefetcher = Prefetcher(self.cache)
+
+    def stop(self, *_):
+        """Request a clean shutdown"""
+        logger.info("🛑 Stop requested")
+        self.stop_event.set()
+
+    def _run_stages(self, names, season):
+        """Run the named stages of a season plus the schedule stage they depend on"""
+        stages = [self.stages['schedule']] + [self.stages[name] for name in names]
+        return run_pipeline(stages, context={'season': season})
+
+    def _published_session(self):
+        """(round, session_type) of the latest-session.json currently published"""
+        try:
+            with open(self.data_dir / 'latest-session.json', 'r') as f:
+                data = json.load(f)
+            return data.get('round'), data.get('session_type')
+        except Exception:
+            return None, None
+
+    def run_once(self, now=None):
+        """Do whatever is due right now and return how long to sleep"""
+        # The season is resolved on every poll, so a daemon running over New Year moves on to the new one
+        now = now or datetime.now(timezone.utc)
+        season = now.astimezone(timezone.utc).year
+        schedule_index = ScheduleIndex.load(season, 'cache')
+        self.cache.set_schedule(schedule_index)
+        self.prefetcher.run(schedule_index, now, kinds=(KIND_SCHEDULE, KIND_PREVIOUS_ROUND))
+
+        latest = schedule_index.latest_completed_session(now, session_names=('Race', 'Qualifying', 'Sprint'))
+        awaiting_results = False
+
+        if latest:
+            round_number, session_name = latest
+            event = schedule_index.get_event(round_number)
+            ended = schedule_index.session_end(round_number, session_name)
+            recent = now - ended < RESULTS_WINDOW
+
+            due = []
+            if self.cache.should_update_session_data(event['name'], session_name, now):
+                due.append('latest_session')
+            if session_name in STANDINGS_SESSIONS and self.cache.should_update_standings(now):
+                due.append('standings')
+            if session_name in ANALYSIS_SESSIONS and not is_analysed(season, round_number, session_name,
+                                                                    self.data_dir):
+                due.append('lap_analytics')
+
+            if due:
+                logger.info(f"🔄 Updating {', '.join(due)} after {event['name']} {session_name}")
+                # The stages mark what they refreshed in the shared cache metadata
+                self._run_stages(due, season)
+
+            # Keep polling a just-finished session until its results are published
+            if recent and session_name in ('Race', 'Qualifying'):
+                published_round, published_type = self._published_session()
+                awaiting_results = (published_round, published_type) != (round_number, session_name)
+
+        if awaiting_results:
+            logger.info(f"⏳ Results not published yet, polling again in {self.poll_interval}")
+            return self.poll_interval
+
+        # Otherwise sleep until the next session to end (possibly one under way) has ended or a prefetch is due
+        wakes = [next_prefetch_time(schedule_index, now)]
+        session_end = schedule_index.next_session_end(now)
+        if session_end:
+            wakes.append(session_end + SESSION_GRACE)
+            logger.info(f"💤 Next session ends at {session_end.isoformat()}")
+        wakes = [wake for wake in wakes if wake is not None]
+        if not wakes:
+            return MAX_SLEEP
+        wake = min(wakes)
+        logger.info(f"💤 Waking at {wake.isoformat()}")
+        return max(self.poll_interval, min(wake - now, MAX_SLEEP))
+
+    def run_forever(self):
+        """Main loop until stopped"""
+        logger.info("🚀 Update daemon started")
+        while not self.stop_event.is_set():
+            try:
+                sleep_for = self.run_once()
+            except Exception as e:
+                logger.error(f"Error in daemon iteration: {e}")
+                sleep_for = self.poll_interval
+            self.stop_event.wait(sleep_for.total_seconds())
+        self.prefetcher.shutdown(wait_for=False)
+        logger.info("👋 Update daemon stopped")
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the F1 data updater as a long-running daemon')
+    parser.add_argument('--poll-minutes', type=float, default=3,
+                        help='Polling interval while waiting for results (default: 3)')
+    parser.add_argument('--once', action='store_true',
+                        help='Run a single iteration and exit')
+    args = parser.parse_args()
+
+    setup_logging('logs/update_daemon.log')
+    daemon = UpdateDaemon(poll_interval=timedelta(minutes=args.poll_minutes))
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+
+    if args.once:
+        sleep_for = daemon.run_once()
+        logger.info(f"Next iteration would run in {sleep_for}")
+    else:
+        daemon.run_forever()
+
+if __name__ == "__main__":
+    main()
@@ -4,27 +4,18 @@ Quick Latest Session Updater
 Fast script to update only the latest F1 session data
 """
 
-import os
 import sys
-from pathlib import Path
+
+from f1data.pipeline import build_update_stages, run_pipeline, setup_logging
 
 def main():
-    """Run the optimized update script"""
-    script_dir = Path(__file__).parent
-    optimized_script = script_dir / 'update-data-optimized.py'
-    
-    if not optimized_script.exists():
-        print("❌ Optimized update script not found")
-        return False
-    
+    """Run the latest session stages in-process"""
     print("🚀 Running optimized F1 data update...")
-    
-    # Run the optimized script
-    import subprocess
-    result = subprocess.run([sys.executable, str(optimized_script)], 
-                          capture_output=False, text=True)
-    
-    return result.returncode == 0
+
+    setup_logging()
+    result = run_pipeline(build_update_stages(standings=False, cleanup=False, columnar=False, lap_analytics=False))
+
+    return result['status'].get('latest_session') == 'ok'
 
 if __name__ == "__main__":
     success = main()
@@ -32,4 +23,4 @@ if __name__ == "__main__":
         print("✅ Latest session update completed")
     else:
         print("❌ Update failed")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
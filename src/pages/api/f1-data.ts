@@ -26,13 +26,23 @@ export const GET: APIRoute = async ({ url }) => {
     }
     const driverId = searchParams.get('driver_id');
     const raceId = searchParams.get('race_id');
+    const team = searchParams.get('team');
     
     let dataPath: string;
     let fallbackData: any;
     
     switch (type) {
       case 'latest-session':
-        dataPath = join(process.cwd(), 'public/data/latest-session.json');
+        if (team && !/^[a-z0-9-]+$/.test(team)) {
+          return new Response(JSON.stringify({ error: 'Team non valido' }), {
+            status: 400,
+            headers: { 'Content-Type': 'application/json' }
+          });
+        }
+        // team=<slug> (e.g. red-bull-racing) or team=all for the full field
+        dataPath = team
+          ? join(process.cwd(), `public/data/latest-session/${team}.json`)
+          : join(process.cwd(), 'public/data/latest-session.json');
         fallbackData = {
           message: 'Dati non ancora disponibili',
           event: null,
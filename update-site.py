@@ -4,101 +4,92 @@ UNICO SCRIPT PER AGGIORNARE IL SITO
 Aggiorna tutti i dati necessari per il sito in un solo comando
 """
 
+import argparse
 import os
 import sys
-import subprocess
 from pathlib import Path
 
-def main():
-    """Aggiorna tutti i dati del sito"""
+STAGE_LABELS = {
+    'schedule': 'Calendario',
+    'latest_session': 'Dati ultima sessione',
+    'verified_data': 'Dati verificati',
+    'standings': 'Classifiche piloti e costruttori',
+    'columnar': 'Archivio Parquet di giri e risultati',
+    'lap_analytics': 'Analisi giri, stint e pit stop',
+    'cleanup': 'Pulizia cache',
+    'state': 'Stato aggiornamento',
+}
+
+# Codici di uscita: chi lancia lo script (cron, build) salta build e deploy con EXIT_UNCHANGED
+EXIT_CHANGED = 0
+EXIT_FAILED = 1
+EXIT_UNCHANGED = 3
+
+def ensure_venv(script_dir):
+    """Riavvia lo script con il Python dell'ambiente virtuale, se esiste"""
+    venv_path = script_dir / 'venv'
+    if not venv_path.exists():
+        return
+
+    if os.name == 'nt':  # Windows
+        python_exe = venv_path / 'Scripts' / 'python.exe'
+    else:  # Linux/Mac
+        python_exe = venv_path / 'bin' / 'python'
+
+    if python_exe.exists() and Path(sys.prefix).resolve() != venv_path.resolve():
+        os.execv(str(python_exe), [str(python_exe), str(Path(__file__).resolve())] + sys.argv[1:])
+
+def main(force=False):
+    """Aggiorna tutti i dati del sito; restituisce il codice di uscita"""
     print("🏁 AGGIORNAMENTO SITO FERRARI")
     print("=" * 50)
-    
+
     # Verifica ambiente virtuale
-    script_dir = Path(__file__).parent
+    script_dir = Path(__file__).parent.resolve()
     os.chdir(script_dir)
-    
-    # Attiva ambiente virtuale se esiste
-    venv_path = script_dir / 'venv'
-    if venv_path.exists():
-        if os.name == 'nt':  # Windows
-            python_exe = venv_path / 'Scripts' / 'python.exe'
-        else:  # Linux/Mac
-            python_exe = venv_path / 'bin' / 'python'
-    else:
-        python_exe = sys.executable
-    
-    success = True
-    
-    # 1. Aggiorna i dati dell'ultima sessione
-    print("\n1️⃣ Aggiornamento ultima sessione...")
-    try:
-        result = subprocess.run([
-            str(python_exe), 
-            'scripts/update-data-optimized.py'
-        ], capture_output=True, text=True, timeout=300)
-        
-        if result.returncode == 0:
-            print("✅ Dati ultima sessione aggiornati")
-        else:
-            print("❌ Errore aggiornamento sessione:")
-            print(result.stderr)
-            success = False
-    except subprocess.TimeoutExpired:
-        print("⏱️ Timeout aggiornamento sessione")
-        success = False
-    except Exception as e:
-        print(f"❌ Errore: {e}")
-        success = False
-    
-    # 2. Aggiorna classifiche complete
-    print("\n2️⃣ Aggiornamento classifiche complete...")
-    try:
-        result = subprocess.run([
-            str(python_exe),
-            'scripts/calculate-standings.py'
-        ], capture_output=True, text=True, timeout=300)
-        
-        if result.returncode == 0:
-            print("✅ Classifiche piloti e costruttori aggiornate")
-        else:
-            print("❌ Errore classifiche:")
-            print(result.stderr)
-            success = False
-    except subprocess.TimeoutExpired:
-        print("⏱️ Timeout classifiche")
-        success = False
-    except Exception as e:
-        print(f"❌ Errore: {e}")
-        success = False
-    
-    # 3. Pulizia cache vecchia
-    print("\n3️⃣ Pulizia cache...")
-    try:
-        result = subprocess.run([
-            str(python_exe),
-            'scripts/cleanup-cache.py'
-        ], capture_output=True, text=True, timeout=30)
-        
-        if result.returncode == 0:
-            print("✅ Cache pulita")
-        else:
-            print("⚠️ Warning pulizia cache")
-    except:
-        print("⚠️ Pulizia cache non riuscita (non critico)")
-    
+    ensure_venv(script_dir)
+    sys.path.insert(0, str(script_dir / 'scripts'))
+
+    # Percorso veloce: il file di stato dice se c'è qualcosa da aggiornare,
+    # senza importare fastf1 o pandas
+    from f1data.run_state import nothing_to_do
+    if not force and nothing_to_do():
+        print("Niente da aggiornare: dati ancora freschi (usa --force per aggiornare comunque)")
+        return EXIT_UNCHANGED
+
+    # Tutte le fasi girano in un solo processo: un import di fastf1/pandas,
+    # un calendario, una cache e un solo setup dei log
+    from f1data.pipeline import build_update_stages, run_pipeline, setup_logging
+    from f1data.publish import manifest_revision
+
+    setup_logging()
+    revision = manifest_revision()
+    result = run_pipeline(build_update_stages())
+    data_changed = manifest_revision() != revision
+
+    print()
+    for name, status in result['status'].items():
+        icon = {'ok': '✅', 'skipped': '⏭️', 'timeout': '⏱️'}.get(status, '❌')
+        elapsed = result['timings'].get(name)
+        timing = f" ({elapsed:.1f}s)" if elapsed is not None else ""
+        print(f"{icon} {STAGE_LABELS.get(name, name)}: {status}{timing}")
+
     # Risultato finale
     print("\n" + "=" * 50)
-    if success:
+    if result['success']:
         print("🎉 AGGIORNAMENTO COMPLETATO CON SUCCESSO!")
+        if not data_changed:
+            print("Nessun dato cambiato: build e deploy non necessari")
+            return EXIT_UNCHANGED
         print("Il sito è ora aggiornato con gli ultimi dati F1")
-    else:
-        print("❌ AGGIORNAMENTO FALLITO")
-        print("Controlla i log per i dettagli")
-        return False
-    
-    return True
+        return EXIT_CHANGED
+
+    print("❌ AGGIORNAMENTO FALLITO")
+    print("Controlla i log per i dettagli")
+    return EXIT_FAILED
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Aggiorna tutti i dati del sito')
+    parser.add_argument('--force', action='store_true',
+                        help='Aggiorna anche se il file di stato dice che non serve')
+    sys.exit(main(force=parser.parse_args().force))